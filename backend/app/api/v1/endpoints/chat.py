@@ -4,6 +4,7 @@ ALL AI endpoints require authentication and tier checks.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from app.core.metrics import record_quota_rejection
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.schemas import AIRewriteRequest, AIProjectRequest, AISummaryRequest, AIResponse
@@ -28,6 +29,7 @@ def rewrite_bullet_point(
     # Check AI usage limit
     can_proceed, info = TierService.check_ai_limit(current_user, db)
     if not can_proceed:
+        record_quota_rejection("ai_calls", current_user.plan)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=info
@@ -81,6 +83,7 @@ def generate_project_description(
     # Check AI usage limit
     can_proceed, info = TierService.check_ai_limit(current_user, db)
     if not can_proceed:
+        record_quota_rejection("ai_calls", current_user.plan)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=info)
     
     # Call AI service
@@ -135,6 +138,7 @@ def generate_resume_summary(
     # Check AI usage limit
     can_proceed, info = TierService.check_ai_limit(current_user, db)
     if not can_proceed:
+        record_quota_rejection("ai_calls", current_user.plan)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=info)
     
     # Call AI service
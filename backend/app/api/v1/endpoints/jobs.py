@@ -0,0 +1,61 @@
+"""
+Job Posting API endpoints - match a student's resume against stored postings.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.tracing import span
+from app.db.session import get_db
+from app.models.user import User
+from app.models.resume import Resume
+from app.models.resume_analysis import ResumeAnalysis
+from app.services.jd_match_service import JDMatchService
+from app.services.job_posting_index import get_job_posting_index
+from app.api.dependencies import get_current_user
+
+
+router = APIRouter()
+
+
+@router.get("/jobs/matches", response_model=dict)
+def get_job_matches(
+    analysis_id: Optional[int] = None,
+    resume_id: Optional[int] = None,
+    top_k: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Best matching job postings for one of the user's resumes.
+    
+    Pass either analysis_id (an uploaded and analyzed resume) or
+    resume_id (a resume built in the app). Postings are scored with the
+    job description match engine through an inverted index, so all
+    stored postings are searched in milliseconds.
+    """
+    if (analysis_id is None) == (resume_id is None):
+        raise HTTPException(status_code=400, detail="Pass exactly one of analysis_id or resume_id")
+    
+    if analysis_id is not None:
+        analysis = db.query(ResumeAnalysis).filter(
+            ResumeAnalysis.id == analysis_id,
+            ResumeAnalysis.user_id == current_user.id,
+            ResumeAnalysis.is_active == 1
+        ).first()
+        if not analysis:
+            raise HTTPException(status_code=404, detail="Analysis not found")
+        parsed_data = analysis.parsed_content or {"unclassified": analysis.extracted_text or ""}
+    else:
+        resume = db.query(Resume).filter(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id,
+            Resume.is_active == 1
+        ).first()
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        parsed_data = JDMatchService.sections_from_resume_content(resume.content)
+    
+    with span("jobs.match") as s:
+        matches = get_job_posting_index().match_resume(db, parsed_data, top_k)
+        s.set_attribute("jobs.postings_indexed", matches["postings_indexed"])
+    return matches
@@ -1,21 +1,132 @@
 """
 Resume CRUD endpoints with tier enforcement.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import logging
+import os
+import re
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple, Union
+from app.core.config import settings
+from app.core.metrics import record_cache, record_quota_rejection
 from app.db.session import get_db
-from app.models.user import User
+from app.models.user import User, PlanTier
 from app.models.resume import Resume
-from app.schemas.schemas import ResumeCreate, ResumeUpdate, ResumeResponse
+from app.models.template import ResumeTemplate
+from app.schemas.schemas import (
+    ResumeCreate, ResumeUpdate, ResumeResponse, ResumePreviewRequest, ResumeBulkExportRequest
+)
 from app.services.tier_service import TierService
-from app.services.pdf_service import PDFService
+from app.services.pdf_cache import PDFCache, get_pdf_cache, etag_matches
+from app.services.render_pool import get_render_pool, RenderPoolBusy, RenderTimeout
+from app.services.zip_stream import stream_zip
 from app.api.dependencies import get_current_user
 
 
+if TYPE_CHECKING:
+    from app.services.pdf_service import LayoutPlan
+
+# ReportLab / PyMuPDF are imported on first export or preview, not at startup
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _layout_plan_for_template(template_id: Optional[int], db: Session) -> "LayoutPlan":
+    """Get the compiled layout plan for a template (DB only on first use)."""
+    from app.services.pdf_service import PDFService
+    
+    template_id = template_id if isinstance(template_id, int) else None
+    plan = PDFService.cached_layout_plan(template_id)
+    record_cache("layout_plan", plan is not None)
+    if plan is not None:
+        return plan
+    
+    template_settings = None
+    if template_id is not None:
+        template = db.query(ResumeTemplate).filter(ResumeTemplate.id == template_id).first()
+        if template:
+            template_settings = template.settings
+        else:
+            template_id = None  # Unknown template - render with the default plan
+    
+    return PDFService.get_layout_plan(template_settings, template_id=template_id)
+
+
+def _layout_plan_for(resume: Resume, db: Session) -> "LayoutPlan":
+    """Get the compiled layout plan for a resume's template."""
+    return _layout_plan_for_template(resume.template_id, db)
+
+
+def _pdf_cache_key(resume: Resume, user: User, layout_plan: "LayoutPlan") -> str:
+    template_id = resume.template_id if isinstance(resume.template_id, int) else None
+    return PDFCache.cache_key(resume, template_id, user.plan == PlanTier.FREE, layout_plan.template_settings)
+
+
+async def _render_to_cache(
+    content: Dict,
+    user_plan: PlanTier,
+    template_settings: Optional[Dict],
+    cache_key: str
+) -> Tuple[BinaryIO, Optional[str]]:
+    """
+    Render a PDF in the worker pool and add it to the cache.
+    
+    Returns:
+        (open file, temp path) - the temp path is set when the render was
+        too large to cache and must be removed by the caller once sent
+    """
+    tmp_path = await run_in_threadpool(get_pdf_cache().temp_path)
+    try:
+        await get_render_pool().render(content, user_plan, template_settings, tmp_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return await run_in_threadpool(_adopt_render, cache_key, tmp_path)
+
+
+def _adopt_render(cache_key: str, tmp_path: str) -> Tuple[BinaryIO, Optional[str]]:
+    """Open a finished render and move it into the cache."""
+    # Opened before adopting, so a concurrent eviction cannot remove it under us
+    f = open(tmp_path, "rb")
+    try:
+        cached_path = get_pdf_cache().adopt(cache_key, tmp_path)
+    except BaseException:
+        _close_pdf(f, tmp_path if os.path.exists(tmp_path) else None)
+        raise
+    return f, tmp_path if cached_path is None else None
+
+
+def _close_pdf(f: BinaryIO, remove_path: Optional[str] = None) -> None:
+    f.close()
+    if remove_path is not None:
+        os.remove(remove_path)
+
+
+def _pdf_response(f: BinaryIO, headers: dict, remove_path: Optional[str] = None) -> Response:
+    """Small PDFs are sent from memory, larger ones streamed from the open file."""
+    size = os.fstat(f.fileno()).st_size
+    if size <= settings.PDF_INLINE_MAX_KB * 1024:
+        try:
+            return Response(content=f.read(), media_type="application/pdf", headers=headers)
+        finally:
+            _close_pdf(f, remove_path)
+    return StreamingResponse(
+        iter(lambda: f.read(PDF_STREAM_CHUNK_SIZE), b""),
+        media_type="application/pdf",
+        headers={**headers, "Content-Length": str(size)},
+        background=BackgroundTask(_close_pdf, f, remove_path)
+    )
+
 
 @router.post("/resume", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 def create_resume(
@@ -30,6 +141,7 @@ def create_resume(
     # Check resume limit
     can_proceed, info = TierService.check_resume_limit(current_user, db)
     if not can_proceed:
+        record_quota_rejection("resumes", current_user.plan)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=info)
     
     # Create resume
@@ -56,6 +168,78 @@ def create_resume(
     return resume
 
 
+async def _read_limited_body(request: Request, max_bytes: int) -> bytes:
+    """Read a request body, rejecting it (413) as soon as it exceeds max_bytes."""
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body is larger than {max_bytes // 1024} KB"
+    )
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise too_large
+    
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+
+@router.post("/resume/preview")
+async def preview_resume(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Render one low-resolution PNG page of (possibly unsaved) resume content.
+    Only sections changed since the last render are rebuilt.
+    Returns the total page count in the X-Page-Count header.
+    
+    The body is a ResumePreviewRequest of at most PDF_PREVIEW_MAX_CONTENT_KB
+    (413 otherwise); malformed content is rejected with 422. Pages render
+    in the PDF worker pool under its timeout.
+    """
+    from app.services.preview_service import PreviewPageOutOfRange
+    
+    # Parsed here rather than as a body parameter, so oversized bodies are never buffered
+    body = await _read_limited_body(request, settings.PDF_PREVIEW_MAX_CONTENT_KB * 1024)
+    try:
+        preview_request = ResumePreviewRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()])
+    
+    layout_plan = await run_in_threadpool(_layout_plan_for_template, preview_request.template_id, db)
+    try:
+        png, page_count = await get_render_pool().render_preview(
+            preview_request.content.model_dump(exclude_none=True),
+            current_user.plan,
+            layout_plan.template_settings,
+            page=preview_request.page,
+            dpi=settings.PDF_PREVIEW_DPI
+        )
+    except PreviewPageOutOfRange as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Resume content could not be rendered: {str(e)}"
+        )
+    except (RenderPoolBusy, RenderTimeout) as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{str(e)}. Please try again shortly.",
+            headers={"Retry-After": "5"}
+        )
+    
+    return Response(
+        content=png,
+        media_type="image/png",
+        headers={"X-Page-Count": str(page_count), "Cache-Control": "no-store"}
+    )
+
+
 @router.get("/resume", response_model=List[ResumeResponse])
 def get_user_resumes(
     current_user: User = Depends(get_current_user),
@@ -123,6 +307,9 @@ def update_resume(
     db.commit()
     db.refresh(resume)
     
+    # Drop stale rendered PDFs
+    get_pdf_cache().invalidate(resume_id)
+    
     return resume
 
 
@@ -146,13 +333,15 @@ def delete_resume(
     
     resume.is_active = 0
     db.commit()
+    get_pdf_cache().invalidate(resume_id)
     
     return None
 
 
 @router.get("/resume/{resume_id}/pdf")
-def export_resume_pdf(
+async def export_resume_pdf(
     resume_id: int,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -160,23 +349,162 @@ def export_resume_pdf(
     Export resume as PDF.
     FREE tier: WITH watermark
     PRO/ULTIMATE: NO watermark
+    
+    Renders are cached per resume revision, template and watermark flag;
+    the cache key is returned as the ETag (If-None-Match -> 304).
+    Cache misses are rendered in the PDF worker pool.
     """
+    # Only the render itself is awaited; DB and file work runs in the threadpool
+    resume, layout_plan, cache_key = await run_in_threadpool(_export_target, resume_id, current_user, db)
+    etag = f'"{cache_key}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f"attachment; filename=resume_{resume_id}.pdf"
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    cached = await run_in_threadpool(get_pdf_cache().open, cache_key)
+    if cached is not None:
+        return await run_in_threadpool(_pdf_response, cached, headers)
+    
+    # Render using the resume's template layout
+    try:
+        f, remove_path = await _render_to_cache(
+            resume.content, current_user.plan, layout_plan.template_settings, cache_key
+        )
+    except (RenderPoolBusy, RenderTimeout) as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{str(e)}. Please try again shortly.",
+            headers={"Retry-After": "5"}
+        )
+    
+    # Too large to cache - serve the render and discard it
+    return await run_in_threadpool(_pdf_response, f, headers, remove_path)
+
+
+def _export_target(resume_id: int, user: User, db: Session) -> Tuple[Resume, "LayoutPlan", str]:
+    """Load a user's resume for export with its layout plan and cache key."""
     resume = db.query(Resume).filter(
         Resume.id == resume_id,
-        Resume.user_id == current_user.id,
+        Resume.user_id == user.id,
         Resume.is_active == 1
     ).first()
     
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     
-    # Generate PDF
-    pdf_buffer = PDFService.generate_resume_pdf(resume.content, current_user.plan)
+    layout_plan = _layout_plan_for(resume, db)
+    return resume, layout_plan, _pdf_cache_key(resume, user, layout_plan)
+
+
+def _archive_name(resume_id: int, title: Optional[str]) -> str:
+    safe_title = re.sub(r"[^A-Za-z0-9_-]+", "_", title or "").strip("_") or "resume"
+    return f"{safe_title}_{resume_id}.pdf"
+
+
+async def _rendered_zip_entries(
+    jobs: List[Tuple[str, Dict, str, Optional[Dict]]],
+    user_plan: PlanTier
+) -> AsyncIterator[Tuple[str, Union[BinaryIO, bytes]]]:
+    """
+    Render export jobs in parallel and yield (archive name, open file) as
+    each completes. Failed renders are listed in an errors.txt entry.
+    """
+    cache = get_pdf_cache()
+    # At most one render per pool worker per bulk export, so a single
+    # request cannot fill the render queue
+    semaphore = asyncio.Semaphore(max(1, settings.PDF_RENDER_WORKERS))
+    
+    async def run(job):
+        name, content, cache_key, template_settings = job
+        try:
+            cached = await run_in_threadpool(cache.open, cache_key)
+            if cached is not None:
+                return name, cached, None, None
+            async with semaphore:
+                f, remove_path = await _render_to_cache(content, user_plan, template_settings, cache_key)
+        except (RenderPoolBusy, RenderTimeout) as e:
+            return name, None, None, str(e)
+        except Exception as e:
+            # One broken resume must not truncate the rest of the archive
+            logger.error(f"Bulk export of {name} failed: {str(e)}", exc_info=True)
+            return name, None, None, "Rendering failed"
+        return name, f, remove_path, None
+    
+    tasks = [asyncio.ensure_future(run(job)) for job in jobs]
+    errors = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            name, f, remove_path, error = await next_done
+            if error:
+                errors.append(f"{name}: {error}")
+                continue
+            try:
+                yield name, f
+            finally:
+                _close_pdf(f, remove_path)
+    finally:
+        for task in tasks:
+            task.cancel()
+    
+    if errors:
+        yield "errors.txt", ("\n".join(errors) + "\n").encode("utf-8")
+
+
+@router.post("/resume/export")
+async def export_resumes_zip(
+    export_request: ResumeBulkExportRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Export several resumes as one ZIP archive (PRO/ULTIMATE).
+    Resumes render in parallel in the PDF worker pool and are streamed
+    into the archive as they complete; cached renders are reused.
+    """
+    if not TierService.can_use_feature(current_user, "multiple_resumes"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bulk export requires a PRO or ULTIMATE plan"
+        )
+    
+    # Resolve everything needing the DB before streaming starts
+    jobs = await run_in_threadpool(
+        _export_jobs, list(dict.fromkeys(export_request.resume_ids)), current_user, db
+    )
     
     return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename=resume_{resume_id}.pdf"
-        }
+        stream_zip(_rendered_zip_entries(jobs, current_user.plan)),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=resumes.zip"}
     )
+
+
+def _export_jobs(resume_ids: List[int], user: User, db: Session) -> List[Tuple[str, Dict, str, Optional[Dict]]]:
+    """Load a user's resumes for bulk export as (archive name, content, cache key, template settings)."""
+    resumes = db.query(Resume).filter(
+        Resume.id.in_(resume_ids),
+        Resume.user_id == user.id,
+        Resume.is_active == 1
+    ).all()
+    
+    missing = set(resume_ids) - {resume.id for resume in resumes}
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Resumes not found: {sorted(missing)}")
+    
+    by_id = {resume.id: resume for resume in resumes}
+    jobs = []
+    for resume_id in resume_ids:
+        resume = by_id[resume_id]
+        layout_plan = _layout_plan_for(resume, db)
+        jobs.append((
+            _archive_name(resume.id, resume.title),
+            resume.content,
+            _pdf_cache_key(resume, user, layout_plan),
+            layout_plan.template_settings
+        ))
+    return jobs
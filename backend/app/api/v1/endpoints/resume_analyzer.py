@@ -1,31 +1,77 @@
 """
 Resume Analyzer API endpoints with tier enforcement.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Response
 from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from app.db.session import get_db
+from app.core.config import settings
+from app.core.metrics import record_quota_rejection
+from app.core.tracing import span
+from app.db.session import SessionLocal, get_db
 from app.models.user import User
 from app.models.resume_analysis import ResumeAnalysis
 from app.models.resume import Resume
-from app.schemas.schemas import ResumeAnalysisResponse, EnhanceResumeRequest
+from app.schemas.schemas import ResumeAnalysisResponse, EnhanceResumeRequest, JDMatchRequest, RankResumesRequest, ResumeLintRequest
 from app.services.tier_service import TierService
 from app.services.pdf_parser_service import PDFParserService
 from app.services.resume_analyzer_service import ResumeAnalyzerService
-from app.services.pdf_service import PDFService
+from app.services.resume_lint_service import ResumeLintService
+from app.services.jd_match_service import JDMatchService
+from app.services.skill_extraction_service import SkillExtractionService
+from app.services.resume_match_index import get_resume_match_index
+from app.services.blob_store import BlobRefService, get_blob_store
 from app.api.dependencies import get_current_user
+import asyncio
+import base64
+import csv
+import io
+import json
 import os
-import shutil
+import zipfile
 
 
 router = APIRouter()
 
+ANALYSIS_LIMITS = {
+    "FREE": 1,
+    "PRO": 5,
+    "ULTIMATE": 999999
+}
+
+BULK_CSV_FIELDS = [
+    "filename", "status", "analysis_id", "overall_score", "ats_score",
+    "content_score", "structure_score", "total_suggestions", "critical_issues", "error"
+]
+
+
+def _month_start() -> datetime:
+    """Start of the current analysis quota period."""
+    return datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _analysis_quota(user: User, db: Session) -> Tuple[int, int]:
+    """Return (monthly analysis limit, analyses used this month) for a user."""
+    limit = ANALYSIS_LIMITS.get(user.plan, 1)
+    
+    # Count analyses in current month
+    with span("db.quota_check"):
+        analyses_this_month = db.query(ResumeAnalysis).filter(
+            ResumeAnalysis.user_id == user.id,
+            ResumeAnalysis.created_at >= _month_start(),
+            ResumeAnalysis.is_active == 1
+        ).count()
+    
+    return limit, analyses_this_month
+
 
 @router.post("/resume/analyze", response_model=dict, status_code=status.HTTP_200_OK)
 async def analyze_resume(
     file: UploadFile = File(...),
+    job_description: Optional[str] = Form(None, max_length=20000),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -42,25 +88,13 @@ async def analyze_resume(
     - Overall score
     - Category scores
     - List of suggestions
+    - Job description match (when a job_description is sent)
     """
     # Check tier-based analysis limits
-    analysis_limits = {
-        "FREE": 1,
-        "PRO": 5,
-        "ULTIMATE": 999999
-    }
-    
-    limit = analysis_limits.get(current_user.plan, 1)
-    
-    # Count analyses in current month
-    month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    analyses_this_month = db.query(ResumeAnalysis).filter(
-        ResumeAnalysis.user_id == current_user.id,
-        ResumeAnalysis.created_at >= month_start,
-        ResumeAnalysis.is_active == 1
-    ).count()
+    limit, analyses_this_month = _analysis_quota(current_user, db)
     
     if analyses_this_month >= limit:
+        record_quota_rejection("analyses", current_user.plan)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Monthly analysis limit reached. Your plan allows {limit} analysis/analyses per month. Upgrade to analyze more resumes."
@@ -70,14 +104,10 @@ async def analyze_resume(
         # Process PDF
         extracted_text, parsed_structure, metrics = await PDFParserService.process_resume_pdf(file)
         
-        # Save uploaded file temporarily (optional - for 24 hours)
-        upload_dir = "uploads/resumes"
-        os.makedirs(upload_dir, exist_ok=True)
-        file_path = os.path.join(upload_dir, f"user_{current_user.id}_{datetime.utcnow().timestamp()}.pdf")
-        
+        # Keep the uploaded file for UPLOAD_TTL_HOURS (content-addressed, deduplicated)
         await file.seek(0)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        with span("upload.store"):
+            upload_digest, _ = await BlobRefService.store_upload(db, get_blob_store(), file)
         
         # Perform AI analysis
         analysis_results = await ResumeAnalyzerService.analyze_resume(
@@ -86,11 +116,16 @@ async def analyze_resume(
             current_user.plan
         )
         
+        jd_match = None
+        if job_description:
+            with span("analyzer.jd_match"):
+                jd_match = JDMatchService.match(parsed_structure, job_description)
+        
         # Create analysis record
         analysis = ResumeAnalysis(
             user_id=current_user.id,
             original_filename=file.filename,
-            original_file_path=file_path,
+            upload_digest=upload_digest,
             extracted_text=extracted_text[:10000],  # Limit stored text
             parsed_content=parsed_structure,
             overall_score=analysis_results["overall_score"],
@@ -98,12 +133,15 @@ async def analyze_resume(
             content_score=analysis_results["category_scores"]["content_quality"],
             structure_score=analysis_results["category_scores"]["structure"],
             suggestions=analysis_results["suggestions"],
+            suggestion_count=analysis_results["total_suggestions"],
+            critical_count=analysis_results["critical_issues"],
             status="completed"
         )
         
-        db.add(analysis)
-        db.commit()
-        db.refresh(analysis)
+        with span("db.commit"):
+            db.add(analysis)
+            db.commit()
+            db.refresh(analysis)
         
         return {
             "analysis_id": analysis.id,
@@ -114,6 +152,7 @@ async def analyze_resume(
             "total_suggestions": analysis_results["total_suggestions"],
             "critical_issues": analysis_results["critical_issues"],
             "metrics": analysis_results["metrics"],
+            "jd_match": jd_match,
             "created_at": analysis.created_at.isoformat(),
             "tier_info": {
                 "current_plan": current_user.plan,
@@ -131,6 +170,242 @@ async def analyze_resume(
         )
 
 
+def _zip_pdf_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """PDF entries of an uploaded archive, skipping folders and macOS metadata."""
+    members = []
+    for info in archive.infolist():
+        name = info.filename
+        basename = name.rsplit("/", 1)[-1]
+        if info.is_dir() or name.startswith("__MACOSX/") or basename.startswith("."):
+            continue
+        if basename.lower().endswith(".pdf"):
+            members.append(info)
+    return members
+
+
+def _analyze_zip_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> Tuple[bytes, str, Dict, Dict]:
+    """
+    Read one archive entry and run the parser and rule-based analyzers on it
+    (blocking; runs in the threadpool).
+    
+    Returns:
+        (pdf bytes, extracted text, parsed structure, analysis results)
+    """
+    max_size = PDFParserService.MAX_FILE_SIZE
+    if info.file_size > max_size:
+        raise HTTPException(status_code=400, detail="File size must not exceed 5MB")
+    
+    # Entries are decompressed straight from the spooled upload; the header
+    # size is not trusted, so never read more than the limit allows
+    with archive.open(info) as member:
+        content = member.read(max_size + 1)
+    if len(content) > max_size:
+        raise HTTPException(status_code=400, detail="File size must not exceed 5MB")
+    if not content.startswith(b"%PDF"):
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+    
+    extracted_text = PDFParserService.extract_text_from_bytes(content)
+    parsed_structure = PDFParserService.parse_resume_structure(extracted_text)
+    metrics = PDFParserService.extract_key_metrics(extracted_text)
+    analysis_results = ResumeAnalyzerService.analyze_rules(parsed_structure, metrics)
+    return content, extracted_text, parsed_structure, analysis_results
+
+
+async def _analyzed_zip_members(
+    archive: zipfile.ZipFile,
+    members: List[zipfile.ZipInfo]
+) -> AsyncIterator[Tuple[zipfile.ZipInfo, Optional[Tuple], Optional[str]]]:
+    """
+    Analyze archive entries in parallel and yield (entry, result, error) as
+    each completes.
+    """
+    # Bounded so one upload cannot take over the threadpool
+    semaphore = asyncio.Semaphore(max(1, settings.BULK_ANALYZE_CONCURRENCY))
+    
+    async def run(info):
+        try:
+            async with semaphore:
+                result = await run_in_threadpool(_analyze_zip_member, archive, info)
+        except HTTPException as e:
+            return info, None, e.detail
+        except Exception as e:
+            return info, None, f"Error analyzing resume: {str(e)}"
+        return info, result, None
+    
+    tasks = [asyncio.ensure_future(run(info)) for info in members]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _bulk_analysis_rows(
+    archive: zipfile.ZipFile,
+    members: List[zipfile.ZipInfo],
+    user_id: int,
+    analyses_used: int,
+    limit: int
+) -> AsyncIterator[Dict]:
+    """
+    Analyze and store each archive entry, yielding one row per entry as it
+    completes and a final summary row.
+    
+    One analysis per member must already be reserved for the user; each
+    stored analysis uses up one, and the rest are released at the end.
+    """
+    # The request's session is closed once the response starts streaming
+    db = SessionLocal()
+    store = get_blob_store()
+    succeeded = failed = 0
+    try:
+        async for info, result, error in _analyzed_zip_members(archive, members):
+            if error is not None:
+                failed += 1
+                yield {"type": "error", "filename": info.filename, "error": error}
+                continue
+            
+            content, extracted_text, parsed_structure, analysis_results = result
+            upload = UploadFile(file=io.BytesIO(content), filename=info.filename)
+            upload_digest, _ = await BlobRefService.store_upload(db, store, upload)
+            
+            analysis = ResumeAnalysis(
+                user_id=user_id,
+                original_filename=info.filename,
+                upload_digest=upload_digest,
+                extracted_text=extracted_text[:10000],  # Limit stored text
+                parsed_content=parsed_structure,
+                overall_score=analysis_results["overall_score"],
+                ats_score=analysis_results["category_scores"]["ats_optimization"],
+                content_score=analysis_results["category_scores"]["content_quality"],
+                structure_score=analysis_results["category_scores"]["structure"],
+                suggestions=analysis_results["suggestions"],
+                suggestion_count=analysis_results["total_suggestions"],
+                critical_count=analysis_results["critical_issues"],
+                status="completed"
+            )
+            db.add(analysis)
+            TierService.release_analyses(user_id, 1, db)
+            db.commit()
+            db.refresh(analysis)
+            
+            succeeded += 1
+            yield {
+                "type": "result",
+                "filename": info.filename,
+                "analysis_id": analysis.id,
+                "overall_score": analysis_results["overall_score"],
+                "category_scores": analysis_results["category_scores"],
+                "total_suggestions": analysis_results["total_suggestions"],
+                "critical_issues": analysis_results["critical_issues"],
+                "suggestions": analysis_results["suggestions"],
+                "created_at": analysis.created_at.isoformat()
+            }
+    finally:
+        db.rollback()
+        TierService.release_analyses(user_id, len(members) - succeeded, db)
+        db.commit()
+        db.close()
+        archive.close()
+    
+    yield {
+        "type": "summary",
+        "total": len(members),
+        "succeeded": succeeded,
+        "failed": failed,
+        "analyses_used": analyses_used + succeeded,
+        "analyses_limit": limit
+    }
+
+
+async def _ndjson_lines(rows: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    async for row in rows:
+        yield json.dumps(row) + "\n"
+
+
+async def _csv_lines(rows: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=BULK_CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    async for row in rows:
+        if row["type"] == "summary":
+            continue
+        scores = row.get("category_scores", {})
+        writer.writerow({
+            **row,
+            "status": "completed" if row["type"] == "result" else "failed",
+            "ats_score": scores.get("ats_optimization"),
+            "content_score": scores.get("content_quality"),
+            "structure_score": scores.get("structure")
+        })
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+@router.post("/resume/analyze/bulk")
+async def analyze_resumes_bulk(
+    file: UploadFile = File(...),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Analyze every PDF in a ZIP archive (e.g. a placement cell's batch).
+    
+    Entries are read straight from the upload (nothing is extracted to
+    disk), analyzed in parallel with the rule-based analyzers (no AI
+    enhancements), stored like single analyses, and streamed back as each
+    completes:
+    - ndjson: one {"type": "result" | "error"} line per PDF, then a
+      {"type": "summary"} line
+    - csv: one summary row per PDF
+    
+    The whole batch is reserved against the monthly analysis limit up
+    front; analyses that fail are released once the batch finishes.
+    """
+    if not file.filename or not file.filename.lower().endswith(".zip"):
+        raise HTTPException(status_code=400, detail="Only ZIP files are allowed")
+    
+    try:
+        archive = zipfile.ZipFile(file.file)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="Invalid or corrupted ZIP file")
+    
+    members = _zip_pdf_members(archive)
+    if not members:
+        archive.close()
+        raise HTTPException(status_code=400, detail="The ZIP file contains no PDF files")
+    if len(members) > settings.BULK_ANALYZE_MAX_FILES:
+        archive.close()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Too many PDFs in one upload ({len(members)}); the limit is {settings.BULK_ANALYZE_MAX_FILES}"
+        )
+    
+    # One quota reservation for the whole batch, taken atomically so
+    # concurrent uploads cannot both fit in the remaining quota
+    limit, analyses_this_month = _analysis_quota(current_user, db)
+    if not TierService.reserve_analyses(current_user, len(members), limit, _month_start(), db):
+        archive.close()
+        record_quota_rejection("analyses", current_user.plan)
+        remaining = max(0, limit - analyses_this_month - TierService.reserved_analyses(current_user, db))
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Monthly analysis limit reached. This upload has {len(members)} PDFs and your plan has {remaining} analyses left this month. Upgrade to analyze more resumes."
+        )
+    
+    rows = _bulk_analysis_rows(archive, members, current_user.id, analyses_this_month, limit)
+    if format == "csv":
+        return StreamingResponse(
+            _csv_lines(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=analyses.csv"}
+        )
+    return StreamingResponse(_ndjson_lines(rows), media_type="application/x-ndjson")
+
+
 @router.post("/resume/enhance/{analysis_id}", status_code=status.HTTP_200_OK)
 async def enhance_resume(
     analysis_id: int,
@@ -196,6 +471,7 @@ async def enhance_resume(
         # Check resume creation limit
         can_proceed, info = TierService.check_resume_limit(current_user, db)
         if not can_proceed:
+            record_quota_rejection("resumes", current_user.plan)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=info
@@ -212,7 +488,7 @@ async def enhance_resume(
                 },
                 "summary": enhanced_content.get("summary", ""),
                 "education": enhanced_content.get("education", ""),
-                "skills": enhanced_content.get("skills", "").split(",") if enhanced_content.get("skills") else [],
+                "skills": SkillExtractionService.normalize_skills(enhanced_content.get("skills", "")),
                 "projects": enhanced_content.get("projects", ""),
                 "experience": enhanced_content.get("experience", ""),
                 "achievements": enhanced_content.get("achievements", "")
@@ -253,8 +529,27 @@ async def enhance_resume(
         )
 
 
+def _encode_history_cursor(created_at: datetime, analysis_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{analysis_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_history_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a history cursor back into its (created_at, id) position."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, analysis_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(analysis_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/resume/analysis-history", response_model=List[dict])
 def get_analysis_history(
+    response: Response,
+    cursor: Optional[str] = None,
+    page_size: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -264,35 +559,78 @@ def get_analysis_history(
     Tier Limits:
     - FREE: Last 1 analysis
     - PRO: Last 10 analyses
-    - ULTIMATE: All analyses
+    - ULTIMATE: All analyses (keyset-paginated)
+    
+    Only summary columns are selected; the extracted text and suggestion
+    payloads are never loaded. For ULTIMATE users the next page cursor is
+    returned in the ``X-Next-Cursor`` response header.
     """
     history_limits = {
         "FREE": 1,
         "PRO": 10,
-        "ULTIMATE": 999999
+        "ULTIMATE": None
     }
     
-    limit = history_limits.get(current_user.plan, 1)
+    window = history_limits.get(current_user.plan, 1)
     
-    analyses = db.query(ResumeAnalysis).filter(
+    query = db.query(
+        ResumeAnalysis.id,
+        ResumeAnalysis.original_filename,
+        ResumeAnalysis.overall_score,
+        ResumeAnalysis.ats_score,
+        ResumeAnalysis.content_score,
+        ResumeAnalysis.structure_score,
+        ResumeAnalysis.suggestion_count,
+        ResumeAnalysis.status,
+        ResumeAnalysis.enhanced_resume_id,
+        ResumeAnalysis.created_at
+    ).filter(
         ResumeAnalysis.user_id == current_user.id,
         ResumeAnalysis.is_active == 1
-    ).order_by(ResumeAnalysis.created_at.desc()).limit(limit).all()
+    )
+    
+    if window is None:
+        # Unlimited history: page through it with a (created_at, id) keyset
+        if cursor:
+            cursor_created_at, cursor_id = _decode_history_cursor(cursor)
+            query = query.filter(
+                or_(
+                    ResumeAnalysis.created_at < cursor_created_at,
+                    and_(
+                        ResumeAnalysis.created_at == cursor_created_at,
+                        ResumeAnalysis.id < cursor_id
+                    )
+                )
+            )
+        fetch_size = page_size + 1
+    else:
+        # Limited history is a fixed window of the newest analyses
+        fetch_size = min(page_size, window)
+    
+    rows = query.order_by(
+        ResumeAnalysis.created_at.desc(),
+        ResumeAnalysis.id.desc()
+    ).limit(fetch_size).all()
+    
+    if window is None and len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = _encode_history_cursor(last.created_at, last.id)
     
     return [
         {
-            "id": analysis.id,
-            "filename": analysis.original_filename,
-            "overall_score": analysis.overall_score,
-            "ats_score": analysis.ats_score,
-            "content_score": analysis.content_score,
-            "structure_score": analysis.structure_score,
-            "total_suggestions": len(analysis.suggestions) if analysis.suggestions else 0,
-            "status": analysis.status,
-            "enhanced_resume_id": analysis.enhanced_resume_id,
-            "created_at": analysis.created_at.isoformat()
+            "id": row.id,
+            "filename": row.original_filename,
+            "overall_score": row.overall_score,
+            "ats_score": row.ats_score,
+            "content_score": row.content_score,
+            "structure_score": row.structure_score,
+            "total_suggestions": row.suggestion_count or 0,
+            "status": row.status,
+            "enhanced_resume_id": row.enhanced_resume_id,
+            "created_at": row.created_at.isoformat()
         }
-        for analysis in analyses
+        for row in rows
     ]
 
 
@@ -331,6 +669,81 @@ def get_analysis_details(
     }
 
 
+@router.post("/resume/analysis/{analysis_id}/match", response_model=dict)
+def match_analysis_to_job(
+    analysis_id: int,
+    match_request: JDMatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Score a stored analysis against a job description.
+    
+    Returns the match score (0-100), the job description keywords the
+    resume covers and the most important ones it is missing.
+    """
+    analysis = db.query(ResumeAnalysis).filter(
+        ResumeAnalysis.id == analysis_id,
+        ResumeAnalysis.user_id == current_user.id,
+        ResumeAnalysis.is_active == 1
+    ).first()
+    
+    if not analysis:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+    
+    jd_match = JDMatchService.match(analysis.parsed_content or {}, match_request.job_description)
+    if not jd_match["job_keywords"]:
+        raise HTTPException(
+            status_code=400,
+            detail="No recognisable skills or requirements found in the job description"
+        )
+    
+    return {"analysis_id": analysis.id, **jd_match}
+
+
+@router.post("/resume/rank", response_model=dict)
+def rank_resumes_for_job(
+    rank_request: RankResumesRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Rank all of the user's stored analyses (e.g. a cohort uploaded with
+    /resume/analyze/bulk) against a job description.
+    
+    Returns the top_k resumes by match score with their matched keywords.
+    The user's resume matrix is cached in memory and updated with new and
+    deleted analyses on each call.
+    """
+    if not JDMatchService.vectorize_job_description(rank_request.job_description):
+        raise HTTPException(
+            status_code=400,
+            detail="No recognisable skills or requirements found in the job description"
+        )
+    
+    index = get_resume_match_index(current_user.id)
+    with span("rank.resumes") as s:
+        ranking = index.rank_resumes(db, rank_request.job_description, rank_request.top_k)
+        s.set_attribute("rank.resumes_indexed", ranking["resumes_indexed"])
+    return ranking
+
+
+@router.post("/resume/lint", response_model=dict)
+def lint_resume_text(
+    lint_request: ResumeLintRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Instant rule-based checks for one bullet or section while editing.
+    
+    Flags weak verbs (with stronger replacements), passive voice, bullets
+    without an action verb or a measurable result, and overlong text,
+    with character offsets for highlighting. No AI call, so it does not
+    count against the analysis quota.
+    """
+    return ResumeLintService.lint(lint_request.text, lint_request.section.lower())
+
+
 @router.delete("/resume/analysis/{analysis_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_analysis(
     analysis_id: int,
@@ -349,11 +762,13 @@ def delete_analysis(
     if not analysis:
         raise HTTPException(status_code=404, detail="Analysis not found")
     
-    # Soft delete
+    # Soft delete and release the uploaded file
     analysis.is_active = 0
+    if analysis.upload_digest:
+        BlobRefService.release(db, analysis.upload_digest)
     db.commit()
     
-    # Clean up temporary file if exists
+    # Clean up legacy per-upload file if exists
     if analysis.original_file_path and os.path.exists(analysis.original_file_path):
         try:
             os.remove(analysis.original_file_path)
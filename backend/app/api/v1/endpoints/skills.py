@@ -0,0 +1,28 @@
+"""
+Skills API endpoints - typeahead for the resume editor.
+"""
+from fastapi import APIRouter, Query, Response
+from app.services.skill_suggest_index import get_skill_suggest_index
+
+
+router = APIRouter()
+
+
+@router.get("/skills/suggest", response_model=dict)
+async def suggest_skills(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(8, ge=1, le=20)
+):
+    """
+    Skill suggestions for what the user has typed so far.
+
+    Matches canonical names and aliases ("js" -> JavaScript) by prefix,
+    most used skills first. Served from memory without authentication or
+    database access, so it can run on every keystroke.
+    """
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return {
+        "query": q,
+        "suggestions": get_skill_suggest_index().suggest(q, limit),
+    }
@@ -1,13 +1,13 @@
 """
 Template API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from typing import List, Optional
-from app.db.session import get_db
-from app.models.template import ResumeTemplate
-from app.models.user import User, PlanTier
+from app.models.user import User
 from app.api.dependencies import get_current_user
+from app.services.pdf_cache import etag_matches
+from app.services.template_catalog import TemplateCatalog, get_template_catalog
+from app.services.usage_counter import get_template_usage_counter
 from pydantic import BaseModel
 
 
@@ -37,67 +37,70 @@ class TemplateListResponse(BaseModel):
     available_to_user: int
 
 
+def _catalog_etag(catalog: TemplateCatalog, *parts) -> str:
+    return '"' + "-".join([catalog.etag] + [str(p) for p in parts]) + '"'
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> bool:
+    """Set caching headers; True if the client's copy is current."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
 @router.get("/templates", response_model=TemplateListResponse)
 def get_all_templates(
+    request: Request,
+    response: Response,
     industry: Optional[str] = None,
     position_type: Optional[str] = None,
     category: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Get all resume templates with optional filtering.
     Returns templates available to user's tier and higher tiers (locked).
+    Served from the in-memory template catalog.
     """
-    query = db.query(ResumeTemplate).filter(ResumeTemplate.is_active == True)
-    
-    # Apply filters
-    if industry:
-        query = query.filter(ResumeTemplate.industry == industry)
-    if position_type:
-        query = query.filter(ResumeTemplate.position_type == position_type)
-    if category:
-        query = query.filter(ResumeTemplate.category == category)
-    
-    # Order by featured first, then by usage count
-    query = query.order_by(
-        ResumeTemplate.is_featured.desc(),
-        ResumeTemplate.usage_count.desc()
-    )
-    
-    templates = query.all()
+    catalog = get_template_catalog()
+    etag = _catalog_etag(catalog, getattr(current_user.plan, "value", current_user.plan))
+    if _not_modified(request, response, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers))
     
-    # Count available templates based on user tier
-    tier_hierarchy = {
-        PlanTier.FREE: 0,
-        PlanTier.PRO: 1,
-        PlanTier.ULTIMATE: 2
-    }
-    user_tier_level = tier_hierarchy.get(current_user.plan, 0)
-    
-    available_count = sum(
-        1 for t in templates 
-        if tier_hierarchy.get(PlanTier[t.tier_required], 0) <= user_tier_level
-    )
+    # Featured first, then by usage count
+    templates = catalog.filter(industry=industry, position_type=position_type, category=category)
     
     return {
         "templates": templates,
         "total": len(templates),
-        "available_to_user": available_count
+        "available_to_user": TemplateCatalog.count_available(templates, current_user.plan)
     }
 
 
+@router.get("/templates/featured")
+def get_featured_templates(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user)
+):
+    """Get featured templates"""
+    catalog = get_template_catalog()
+    featured = catalog.featured_templates()
+    # usage_count is in the body, so it is part of the ETag too
+    etag = _catalog_etag(catalog, "featured", *[t["usage_count"] for t in featured])
+    if _not_modified(request, response, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers))
+    
+    return {"templates": featured}
+
+
 @router.get("/templates/{template_id}", response_model=TemplateResponse)
 def get_template(
     template_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """Get specific template details"""
-    template = db.query(ResumeTemplate).filter(
-        ResumeTemplate.id == template_id,
-        ResumeTemplate.is_active == True
-    ).first()
+    template = get_template_catalog().get(template_id)
     
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -106,55 +109,38 @@ def get_template(
 
 
 @router.get("/templates/industries/list")
-def get_industries(db: Session = Depends(get_db)):
+def get_industries():
     """Get list of all industries"""
-    industries = db.query(ResumeTemplate.industry).distinct().all()
-    return {"industries": [i[0] for i in industries if i[0]]}
+    return {"industries": get_template_catalog().facet_values("industry")}
 
 
 @router.get("/templates/categories/list")
-def get_categories(db: Session = Depends(get_db)):
+def get_categories():
     """Get list of all categories"""
-    categories = db.query(ResumeTemplate.category).distinct().all()
-    return {"categories": [c[0] for c in categories if c[0]]}
+    return {"categories": get_template_catalog().facet_values("category")}
 
 
 @router.get("/templates/position-types/list")
-def get_position_types(db: Session = Depends(get_db)):
+def get_position_types():
     """Get list of all position types"""
-    position_types = db.query(ResumeTemplate.position_type).distinct().all()
-    return {"position_types": [p[0] for p in position_types if p[0]]}
-
-
-@router.get("/templates/featured")
-def get_featured_templates(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """Get featured templates"""
-    templates = db.query(ResumeTemplate).filter(
-        ResumeTemplate.is_featured == True,
-        ResumeTemplate.is_active == True
-    ).limit(6).all()
-    
-    return {"templates": templates}
+    return {"position_types": get_template_catalog().facet_values("position_type")}
 
 
 @router.post("/templates/{template_id}/increment-usage")
 def increment_template_usage(
     template_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
-    """Increment template usage count when user selects it"""
-    template = db.query(ResumeTemplate).filter(
-        ResumeTemplate.id == template_id
-    ).first()
-    
-    if not template:
+    """
+    Increment template usage count when user selects it.
+    Counts are buffered and written to the database periodically;
+    the catalog ranking is updated immediately.
+    """
+    catalog = get_template_catalog()
+    if not catalog.get(template_id):
         raise HTTPException(status_code=404, detail="Template not found")
     
-    template.usage_count += 1
-    db.commit()
+    get_template_usage_counter().increment(template_id)
+    usage_count = catalog.record_usage(template_id)
     
-    return {"message": "Usage count updated", "usage_count": template.usage_count}
+    return {"message": "Usage count updated", "usage_count": usage_count}
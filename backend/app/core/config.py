@@ -2,6 +2,7 @@
 Configuration settings for the application.
 All sensitive data must come from environment variables.
 """
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -19,9 +20,11 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_CREATE_TABLES_ON_STARTUP: bool = False  # Always on in development; use init_db.py elsewhere
     
     # AI - OpenRouter Configuration
     OPENROUTER_API_KEY: str
+    OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"  # Point at benchmarks.openrouter_stub for load tests
     AI_MODEL: str = "mistralai/mistral-7b-instruct:free"  # Verified free tier model
     AI_MAX_TOKENS: int = 200
     AI_TEMPERATURE: float = 0.7
@@ -41,12 +44,70 @@ class Settings(BaseSettings):
     ULTIMATE_AI_LIMIT: int = 9999  # Effectively unlimited
     ULTIMATE_RESUME_LIMIT: int = 9999
     
+    # Upload Storage
+    UPLOAD_STORAGE_BACKEND: str = "local"
+    UPLOAD_DIR: str = "uploads/blobs"
+    UPLOAD_TTL_HOURS: int = 24  # Uploaded PDFs are temporary
+    UPLOAD_SWEEP_INTERVAL_MINUTES: int = 30
+    
+    # Rendered PDF Cache
+    PDF_CACHE_DIR: str = "cache/pdf"
+    PDF_CACHE_MAX_MB: int = 256
+    
+    # PDF Rendering (process pool; 0 workers renders in the API threadpool,
+    # development only: a timed-out thread render cannot be stopped)
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_QUEUE_LIMIT: int = 32
+    PDF_RENDER_TIMEOUT_SECONDS: float = 20.0
+    PDF_INLINE_MAX_KB: int = 256  # Larger PDFs are streamed from disk
+    PDF_PREVIEW_DPI: int = 60
+    PDF_PREVIEW_MAX_CONTENT_KB: int = 64  # Larger preview requests are rejected (413)
+    
+    # Bulk analysis (ZIP of PDFs in, NDJSON/CSV out)
+    BULK_ANALYZE_MAX_FILES: int = 500
+    BULK_ANALYZE_CONCURRENCY: int = 4  # PDFs parsed and scored at once per request
+    BULK_ANALYZE_RESERVATION_MINUTES: int = 60  # Unreleased quota reservations expire after this
+    
+    # Job description ranking (per-user sparse resume matrices kept in memory)
+    RESUME_MATCH_INDEX_USERS: int = 32
+    JOB_POSTING_INDEX_REFRESH_SECONDS: int = 60  # Pick up imported/changed postings this often
+    
+    # Skill typeahead (counts stored by count_skill_popularity.py reloaded this often)
+    SKILL_POPULARITY_REFRESH_SECONDS: int = 3600
+    
+    # Template catalog (in-memory snapshot reload interval)
+    TEMPLATE_CATALOG_REFRESH_SECONDS: int = 300
+    TEMPLATE_USAGE_FLUSH_SECONDS: int = 10  # Write-behind interval for usage counters
+    
+    # Observability
+    METRICS_ENABLED: Optional[bool] = None  # Serve Prometheus metrics at /metrics (default: development only)
+    METRICS_TOKEN: Optional[str] = None  # When set, /metrics requires "Authorization: Bearer <token>"
+    TRACING_ENABLED: bool = True
+    TRACE_EXPORT_FILE: Optional[str] = None  # Append finished traces as OTLP/JSON lines
+    SERVER_TIMING_ENABLED: Optional[bool] = None  # Honour X-Debug-Timing: 1 with a Server-Timing header (default: development only)
+    
     # Payment (FUTURE - NOT IMPLEMENTED)
     STRIPE_SECRET_KEY: Optional[str] = None
     STRIPE_WEBHOOK_SECRET: Optional[str] = None
     RAZORPAY_KEY_ID: Optional[str] = None
     RAZORPAY_KEY_SECRET: Optional[str] = None
     
+    @model_validator(mode="after")
+    def _development_defaults(self) -> "Settings":
+        """Debug surfaces left unset are on in development only."""
+        if self.METRICS_ENABLED is None:
+            self.METRICS_ENABLED = self.ENVIRONMENT == "development"
+        if self.SERVER_TIMING_ENABLED is None:
+            self.SERVER_TIMING_ENABLED = self.ENVIRONMENT == "development"
+        return self
+    
+    @model_validator(mode="after")
+    def _render_workers_outside_development(self) -> "Settings":
+        """In-process renders keep running after a timeout; only allow them in development."""
+        if self.PDF_RENDER_WORKERS < 1 and self.ENVIRONMENT != "development":
+            raise ValueError("PDF_RENDER_WORKERS must be at least 1 outside development")
+        return self
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,276 @@
+"""
+Tracing - lightweight request-scoped spans.
+
+Each request gets a span tree following the OpenTelemetry data model,
+with W3C trace context ids (an incoming traceparent header is
+continued). Code marks stages with `with span("pdf.extract_text"):`;
+outside a request span() is a no-op.
+
+Finished traces are appended to TRACE_EXPORT_FILE as OTLP/JSON, one
+ExportTraceServiceRequest per line (the format the OpenTelemetry
+Collector's otlpjsonfile receiver reads). A background thread does the
+serializing and file writes, so requests only enqueue their trace. When SERVER_TIMING_ENABLED
+(development only by default), requests sent with X-Debug-Timing: 1 get
+a Server-Timing header with per-stage durations.
+"""
+import json
+import logging
+import queue
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "ai-resume-coach-api"
+DEBUG_HEADER = b"x-debug-timing"
+
+# OTLP span kinds / status codes
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+STATUS_OK, STATUS_ERROR = 1, 2
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+# Traces waiting for the exporter thread; beyond this they are dropped
+EXPORT_QUEUE_SIZE = 1000
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], spans: List["Span"], kind: str = "internal"):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes: Dict[str, object] = {}
+        self.status = STATUS_OK
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self._started = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.spans = spans  # Shared by every span in the trace
+        spans.append(self)
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = self.start_ns + (time.perf_counter_ns() - self._started)
+
+    def child(self, name: str, kind: str = "internal") -> "Span":
+        return Span(name, self.trace_id, self.span_id, self.spans, kind)
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else self.start_ns + (time.perf_counter_ns() - self._started)
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self) -> Dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": SPAN_KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status, "message": self.status_message},
+        }
+
+
+class _NoopSpan:
+    """Returned by span() outside a trace so callers need no checks."""
+
+    def set_attribute(self, key: str, value) -> None:
+        pass
+
+    def record_error(self, exc: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_export_queue: "queue.Queue[Tuple[str, Span]]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+_exporter: Optional[threading.Thread] = None
+_exporter_lock = threading.Lock()
+
+
+def _otlp_attribute(key: str, value) -> Dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes) -> Iterator:
+    """Time the with-block as a child of the current span (no-op outside a trace)."""
+    parent = _current_span.get()
+    if parent is None:
+        yield _NOOP_SPAN
+        return
+
+    child = parent.child(name, kind)
+    child.attributes.update(attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        child.record_error(exc)
+        raise
+    finally:
+        child.end()
+        _current_span.reset(token)
+
+
+def start_trace(name: str, traceparent: Optional[str] = None, kind: str = "server") -> Span:
+    """Start a root span, continuing the caller's trace if a valid traceparent is given."""
+    match = _TRACEPARENT.match(traceparent or "")
+    if match and match.group(1) != "0" * 32:
+        trace_id, parent_id = match.group(1), match.group(2)
+    else:
+        trace_id, parent_id = secrets.token_hex(16), None
+    return Span(name, trace_id, parent_id, [], kind)
+
+
+def server_timing(root: Span) -> str:
+    """Server-Timing header value: per-stage totals (ms) in start order, then the total."""
+    totals: Dict[str, float] = {}
+    for s in sorted(root.spans[1:], key=lambda s: s.start_ns):
+        if s.end_ns is not None:
+            totals[s.name] = totals.get(s.name, 0.0) + s.duration_ms
+    entries = [f"{name};dur={ms:.1f}" for name, ms in totals.items()]
+    entries.append(f"total;dur={root.duration_ms:.1f}")
+    return ", ".join(entries)
+
+
+def _otlp_line(root: Span) -> str:
+    """One ExportTraceServiceRequest line for a finished trace."""
+    request = {
+        "resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [s.to_otlp() for s in root.spans],
+            }],
+        }]
+    }
+    return json.dumps(request, separators=(",", ":")) + "\n"
+
+
+def _run_exporter() -> None:
+    """Exporter thread: append queued traces, one open() per batch and file."""
+    while True:
+        batch = [_export_queue.get()]
+        while True:
+            try:
+                batch.append(_export_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            lines: Dict[str, List[str]] = {}
+            for path, root in batch:
+                lines.setdefault(path, []).append(_otlp_line(root))
+            for path, path_lines in lines.items():
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("".join(path_lines))
+        except Exception as e:
+            logger.error(f"Trace export failed: {str(e)}")
+        finally:
+            for _ in batch:
+                _export_queue.task_done()
+
+
+def export_trace(root: Span) -> None:
+    """Queue the finished trace for appending to TRACE_EXPORT_FILE."""
+    global _exporter
+    if not settings.TRACE_EXPORT_FILE:
+        return
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = threading.Thread(target=_run_exporter, name="trace-exporter", daemon=True)
+                _exporter.start()
+    try:
+        _export_queue.put_nowait((settings.TRACE_EXPORT_FILE, root))
+    except queue.Full:
+        logger.warning("Trace export queue is full, dropping trace")
+
+
+def flush_traces() -> None:
+    """Block until every queued trace has been written (shutdown and tests)."""
+    _export_queue.join()
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening the root span of each request.
+
+    The root span is named "<METHOD> <route template>". With the
+    X-Debug-Timing: 1 request header the response carries Server-Timing
+    (stages finished before the headers were sent) and X-Trace-Id.
+    """
+
+    def __init__(self, app, exclude_paths=("/metrics",)):
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        traceparent = headers.get(b"traceparent", b"").decode("latin-1")
+        debug = settings.SERVER_TIMING_ENABLED and headers.get(DEBUG_HEADER) == b"1"
+
+        root = start_trace(f"{scope['method']} {scope['path']}", traceparent)
+        token = _current_span.set(root)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                if debug:
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [
+                        (b"server-timing", server_timing(root).encode("latin-1")),
+                        (b"x-trace-id", root.trace_id.encode("latin-1")),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            root.record_error(exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            route = scope.get("route")
+            root.name = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+            root.set_attribute("http.method", scope["method"])
+            root.set_attribute("http.route", getattr(route, "path", ""))
+            root.end()
+            export_trace(root)
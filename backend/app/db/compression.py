@@ -0,0 +1,122 @@
+"""
+Compressed column types for large text and JSON payloads.
+
+Values are stored as a one-byte format header followed by the payload.
+Compressed payloads use zlib with a preset dictionary of common resume
+vocabulary, so even short sections compress well. Dictionaries are
+versioned by the header byte and must never be edited once released —
+add a new version instead.
+"""
+import json
+import zlib
+from typing import Any, Optional
+from sqlalchemy.types import TypeDecorator, LargeBinary
+
+
+# Header bytes
+FORMAT_RAW = 0x00       # Uncompressed UTF-8 (payload too small to benefit)
+FORMAT_ZLIB_V1 = 0x01   # zlib with RESUME_ZDICT_V1
+
+# Payloads shorter than this are stored raw
+MIN_COMPRESS_SIZE = 64
+
+# Shared dictionary (v1). zlib favours matches near the end of the
+# dictionary, so the most frequent strings are listed last.
+RESUME_ZDICT_V1 = (
+    "Volunteer Extra Curricular Activities Hobbies Languages References "
+    "Certifications Awards Honors Achievements Dean's List Hackathon "
+    "Coursework Relevant Coursework Data Structures Algorithms Operating Systems "
+    "Database Management Systems Computer Networks Machine Learning "
+    "Bachelor of Technology B.Tech B.E. B.Sc M.Tech MBA Computer Science "
+    "Engineering Information Technology University College Institute GPA CGPA "
+    "Python Java JavaScript TypeScript C++ SQL HTML CSS React Node.js Django "
+    "Flask FastAPI Spring AWS Docker Kubernetes Git GitHub Linux MongoDB "
+    "PostgreSQL MySQL REST APIs Excel Power BI Tableau Communication Teamwork "
+    "Leadership Problem Solving linkedin.com/in/ github.com/ @gmail.com "
+    "Internship Intern Software Developer Engineer Analyst Trainee "
+    "January February March April May June July August September October "
+    "November December Present 2020 2021 2022 2023 2024 2025 "
+    "Developed Implemented Designed Built Created Managed Led Improved "
+    "Increased Reduced Optimized Analyzed Coordinated Delivered Launched "
+    "using the and for with to of in a an by on as "
+    "PROFESSIONAL SUMMARY OBJECTIVE EDUCATION EXPERIENCE PROJECTS SKILLS "
+    "Technical Skills Work Experience Projects Education Summary Contact "
+    "\"category\": \"content_quality\", \"category\": \"ats_optimization\", "
+    "\"category\": \"structure\", \"category\": \"fresher_specific\", "
+    "\"severity\": \"critical\", \"severity\": \"high\", "
+    "\"severity\": \"medium\", \"severity\": \"low\", "
+    "\"section\": \"experience\", \"section\": \"summary\", "
+    "\"section\": \"education\", \"section\": \"skills\", "
+    "\"section\": \"projects\", \"section\": \"contact\", \"section\": \"general\", "
+    "\"issue\": \"\", \"suggestion\": \"\", "
+    "\"original_text\": \"\", \"enhanced_text\": \"\", \"accepted\": false}, {"
+).encode("utf-8")
+
+_DICTIONARIES = {
+    FORMAT_ZLIB_V1: RESUME_ZDICT_V1,
+}
+
+
+def compress_bytes(data: bytes) -> bytes:
+    """Compress bytes into the headered storage format."""
+    if len(data) >= MIN_COMPRESS_SIZE:
+        compressor = zlib.compressobj(level=6, zdict=RESUME_ZDICT_V1)
+        compressed = compressor.compress(data) + compressor.flush()
+        if len(compressed) < len(data):
+            return bytes([FORMAT_ZLIB_V1]) + compressed
+    return bytes([FORMAT_RAW]) + data
+
+
+def decompress_bytes(blob: bytes) -> bytes:
+    """Inverse of compress_bytes."""
+    header, payload = blob[0], blob[1:]
+    if header == FORMAT_RAW:
+        return payload
+    zdict = _DICTIONARIES.get(header)
+    if zdict is None:
+        raise ValueError(f"Unknown compressed column format: {header}")
+    decompressor = zlib.decompressobj(zdict=zdict)
+    return decompressor.decompress(payload) + decompressor.flush()
+
+
+class CompressedText(TypeDecorator):
+    """Text column stored compressed as binary."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return compress_bytes(value.encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        # Rows written before the column was converted come back as text
+        if isinstance(value, str):
+            return value
+        return decompress_bytes(bytes(value)).decode("utf-8")
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON column stored compressed as binary."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        encoded = json.dumps(value).encode("utf-8")
+        return compress_bytes(encoded)
+
+    def process_result_value(self, value: Any, dialect) -> Any:
+        if value is None:
+            return None
+        # Rows written before the column was converted come back as JSON
+        if isinstance(value, (dict, list)):
+            return value
+        if isinstance(value, str):
+            return json.loads(value)
+        return json.loads(decompress_bytes(bytes(value)).decode("utf-8"))
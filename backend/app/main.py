@@ -1,37 +1,102 @@
 """
 Main FastAPI application with security hardening.
 """
-from fastapi import FastAPI, status
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from contextlib import asynccontextmanager
+from starlette.concurrency import run_in_threadpool
+import asyncio
+import secrets
+import time
 from app.core.config import settings
+from app.core.metrics import REGISTRY, MetricsMiddleware, collect_db_pool
+from app.core.tracing import TracingMiddleware, flush_traces
 from app.db.base_class import Base
 from app.db.session import engine
-from app.api.v1.endpoints import auth, chat, resume, billing, templates, resume_analyzer
-from app.models import user, usage_limit, resume as resume_model, chat_session, template, resume_analysis
+from app.api.v1.endpoints import auth, chat, resume, billing, templates, resume_analyzer, jobs, skills
+from app.models import user, usage_limit, resume as resume_model, chat_session, template, resume_analysis, upload_blob, job_posting
+from app.services.blob_store import run_blob_sweeper
+from app.services.render_pool import get_render_pool
+from app.services.skill_suggest_index import run_skill_popularity_refresher
+from app.services.template_data import RESUME_TEMPLATES
+from app.services.template_catalog import TemplateCatalog, get_template_catalog, run_catalog_refresher
+from app.services.usage_counter import run_usage_flusher, flush_template_usage
 
 
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
 
+def _warm_caches() -> None:
+    """
+    Load the template catalog and precompile PDF styles and layout plans.
+    Runs in the background after startup (imports ReportLab).
+    """
+    import logging
+    from app.services.pdf_service import PDFService
+    
+    catalog = get_template_catalog()
+    style_sets = PDFService.warm_style_cache(RESUME_TEMPLATES)
+    plans = PDFService.warm_layout_plans(catalog.settings.items())
+    logging.info(f"✅ Loaded {len(catalog.order)} templates, compiled {style_sets} PDF style sets, {plans} layout plans")
+
+
+async def _warm_caches_in_background() -> None:
+    import logging
+    try:
+        await run_in_threadpool(_warm_caches)
+    except Exception as e:
+        logging.error(f"Cache warm-up failed: {str(e)}")
+
+
+def _recompile_layout_plans(catalog: TemplateCatalog) -> None:
+    """Template settings may have changed - rebuild the cached layout plans."""
+    from app.services.pdf_service import PDFService
+    
+    PDFService.invalidate_layout_plans()
+    PDFService.warm_layout_plans(catalog.settings.items())
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Startup and shutdown events.
     """
-    # Startup: Create database tables
-    Base.metadata.create_all(bind=engine)
     import logging
-    logging.info("✅ Database tables created")
+    started = time.perf_counter()
+    
+    # Schema creation is a deploy step (python init_db.py); only
+    # development creates tables on boot
+    if settings.DB_CREATE_TABLES_ON_STARTUP or settings.ENVIRONMENT == "development":
+        Base.metadata.create_all(bind=engine)
+        logging.info("✅ Database tables created")
+    
+    # Template catalog and PDF caches warm up while requests are served
+    warmup = asyncio.create_task(_warm_caches_in_background())
+    
+    # Background cleanup of expired uploads, catalog and skill popularity reloads
+    sweeper = asyncio.create_task(run_blob_sweeper())
+    catalog_refresher = asyncio.create_task(run_catalog_refresher(on_change=_recompile_layout_plans))
+    usage_flusher = asyncio.create_task(run_usage_flusher())
+    skill_refresher = asyncio.create_task(run_skill_popularity_refresher())
+    
+    logging.info(f"✅ Startup complete in {(time.perf_counter() - started) * 1000:.0f} ms")
     
     yield
     
     # Shutdown
+    warmup.cancel()
+    sweeper.cancel()
+    catalog_refresher.cancel()
+    usage_flusher.cancel()
+    skill_refresher.cancel()
+    flush_template_usage()  # Don't drop buffered usage counts
+    flush_traces()
+    get_render_pool().shutdown()
     logging.info("🛑 Shutting down...")
 
 
@@ -58,8 +123,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Page-Count"],  # Readable by the frontend's fetch()
 )
 
+# Request spans and the X-Debug-Timing Server-Timing breakdown
+if settings.TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware)
+
+# Request latency / in-flight metrics (outermost, so it times everything)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    REGISTRY.add_collector(lambda: collect_db_pool(engine))
+
 
 # Health check endpoint
 @app.get("/health", tags=["Health"])
@@ -74,6 +149,25 @@ def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """
+    Prometheus metrics (text exposition format).
+    Requires the METRICS_TOKEN bearer token when one is configured.
+    """
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Not Found"})
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Not authenticated"},
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(chat.router, prefix="/api/v1", tags=["AI Chat"])
@@ -81,6 +175,8 @@ app.include_router(resume_analyzer.router, prefix="/api/v1", tags=["Resume Analy
 app.include_router(resume.router, prefix="/api/v1", tags=["Resume"])
 app.include_router(billing.router, prefix="/api/v1", tags=["Billing"])
 app.include_router(templates.router, prefix="/api/v1", tags=["Templates"])
+app.include_router(jobs.router, prefix="/api/v1", tags=["Jobs"])
+app.include_router(skills.router, prefix="/api/v1", tags=["Skills"])
 
 
 # Global exception handler
@@ -0,0 +1,27 @@
+"""
+Job posting model for matching student resumes against open roles.
+"""
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class JobPosting(Base):
+    __tablename__ = "job_postings"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    external_id = Column(String(100), unique=True, nullable=True)  # Id in the source feed (re-imports upsert on it)
+    
+    # Posting
+    title = Column(String(200), nullable=False)
+    company = Column(String(200), nullable=True)
+    location = Column(String(200), nullable=True)
+    url = Column(String(500), nullable=True)
+    description = Column(Text, nullable=False)
+    
+    # Metadata
+    is_active = Column(Boolean, default=True, index=True)
+    
+    # Timestamps (updated_at drives incremental re-indexing)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
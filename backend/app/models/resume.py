@@ -1,10 +1,11 @@
 """
 Resume storage model.
 """
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base_class import Base
+from app.db.compression import CompressedJSON
 
 
 class Resume(Base):
@@ -18,7 +19,7 @@ class Resume(Base):
     template_id = Column(Integer, ForeignKey("resume_templates.id"), default=1)  # References template table
     
     # Resume Content (stored as JSON)
-    content = Column(JSON, nullable=False)  # Full resume structure
+    content = Column(CompressedJSON, nullable=False)  # Full resume structure
     
     # Metadata
     is_active = Column(Integer, default=1)  # Soft delete
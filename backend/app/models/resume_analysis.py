@@ -1,10 +1,57 @@
 """
 Resume Analysis model for storing analysis history and suggestions.
 """
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Float, Index, event
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
+from typing import Dict, List, Optional
 from app.db.base_class import Base
+from app.db.compression import CompressedText, CompressedJSON
+
+
+# Marker key for parsed content stored as line spans into extracted_text
+SECTION_SPANS_KEY = "__spans__"
+
+
+def encode_section_spans(text: str, parsed: Dict) -> Optional[Dict[str, List[List[int]]]]:
+    """
+    Encode parsed sections as [start, end) offsets of their lines in text.
+    
+    Returns None if any section line can't be located (e.g. it came from
+    beyond the truncated stored text), in which case the caller should
+    store the sections verbatim.
+    """
+    spans = {}
+    for section, value in parsed.items():
+        if not isinstance(value, str):
+            return None
+        section_spans = []
+        cursor = 0
+        for line in value.split("\n") if value else []:
+            start = text.find(line, cursor)
+            if start == -1:
+                start = text.find(line)
+            if start == -1:
+                return None
+            section_spans.append([start, start + len(line)])
+            cursor = start + len(line)
+        spans[section] = section_spans
+    return spans
+
+
+def decode_section_spans(text: str, spans: Dict[str, List[List[int]]]) -> Dict[str, str]:
+    """Rebuild parsed sections from their line spans."""
+    return {
+        section: "\n".join(text[start:end] for start, end in section_spans)
+        for section, section_spans in spans.items()
+    }
+
+
+def load_parsed_content(text: str, stored: Optional[Dict]) -> Optional[Dict]:
+    """Parsed sections from the stored parsed_content column value."""
+    if isinstance(stored, dict) and SECTION_SPANS_KEY in stored:
+        return decode_section_spans(text or "", stored[SECTION_SPANS_KEY])
+    return stored
 
 
 class ResumeAnalysis(Base):
@@ -15,11 +62,16 @@ class ResumeAnalysis(Base):
     
     # Original PDF Info
     original_filename = Column(String, nullable=False)
-    original_file_path = Column(String, nullable=True)  # Temporary storage path
+    original_file_path = Column(String, nullable=True)  # Legacy temporary storage path
+    upload_digest = Column(String(64), nullable=True, index=True)  # Key in the upload blob store
     
     # Extracted Content
-    extracted_text = Column(Text, nullable=False)
-    parsed_content = Column(JSON, nullable=True)  # Structured resume data
+    # Large payload columns are deferred so listing queries never pull them;
+    # the whole "payload" group loads in one SELECT on first access.
+    # Stored compressed; parsed sections are kept as offsets into extracted_text
+    # rather than copies (see the parsed_content property below).
+    extracted_text = deferred(Column(CompressedText, nullable=False), group="payload")
+    _parsed_content = deferred(Column("parsed_content", CompressedJSON, nullable=True), group="payload")
     
     # Analysis Results
     overall_score = Column(Float, default=0.0)  # 0-100 score
@@ -28,7 +80,7 @@ class ResumeAnalysis(Base):
     structure_score = Column(Float, default=0.0)
     
     # AI Suggestions (categorized)
-    suggestions = Column(JSON, nullable=False)  # Array of suggestion objects
+    suggestions = deferred(Column(CompressedJSON, nullable=False), group="payload")  # Array of suggestion objects
     """
     Suggestion structure:
     {
@@ -43,6 +95,10 @@ class ResumeAnalysis(Base):
     }
     """
     
+    # Denormalized counts so history listings don't need the suggestions JSON
+    suggestion_count = Column(Integer, default=0, nullable=False)
+    critical_count = Column(Integer, default=0, nullable=False)
+    
     # Enhanced Resume (if user accepted changes)
     enhanced_resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True)
     accepted_suggestions = Column(JSON, nullable=True)  # IDs of accepted suggestions
@@ -55,6 +111,36 @@ class ResumeAnalysis(Base):
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Keyset pagination index for history listings
+    __table_args__ = (
+        Index("ix_resume_analyses_user_created_id", "user_id", "created_at", "id"),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="resume_analyses")
     enhanced_resume = relationship("Resume", foreign_keys=[enhanced_resume_id])
+    
+    @property
+    def parsed_content(self) -> Optional[Dict]:
+        """Structured resume data, rebuilt from spans when stored that way."""
+        return load_parsed_content(self.extracted_text, self._parsed_content)
+    
+    @parsed_content.setter
+    def parsed_content(self, parsed: Optional[Dict]) -> None:
+        # Kept verbatim until flush, where it is encoded against
+        # extracted_text whichever of the two was set first
+        self._parsed_content = parsed
+        self._parsed_content_pending = bool(parsed)
+
+
+@event.listens_for(ResumeAnalysis, "before_insert")
+@event.listens_for(ResumeAnalysis, "before_update")
+def _encode_parsed_content(mapper, connection, target: ResumeAnalysis) -> None:
+    """Store newly set parsed content as spans into extracted_text when possible."""
+    if not target.__dict__.get("_parsed_content_pending"):
+        return
+    target._parsed_content_pending = False
+    if target.extracted_text:
+        spans = encode_section_spans(target.extracted_text, target._parsed_content)
+        if spans is not None:
+            target._parsed_content = {SECTION_SPANS_KEY: spans}
@@ -0,0 +1,17 @@
+"""
+Skill popularity model - how many stored resumes list each taxonomy skill.
+"""
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class SkillPopularity(Base):
+    __tablename__ = "skill_popularity"
+    
+    # Canonical taxonomy name (ids shift when the taxonomy changes)
+    skill = Column(String(100), primary_key=True)
+    resume_count = Column(Integer, nullable=False, default=0)
+    
+    # Timestamps
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
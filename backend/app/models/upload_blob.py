@@ -0,0 +1,21 @@
+"""
+Uploaded file blob model for reference counting and TTL cleanup.
+"""
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class UploadBlob(Base):
+    __tablename__ = "upload_blobs"
+    
+    # SHA-256 of the file content (also its key in the blob store)
+    digest = Column(String(64), primary_key=True)
+    size = Column(Integer, nullable=False)
+    
+    # Number of active analyses pointing at this blob
+    ref_count = Column(Integer, default=0, nullable=False)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    last_referenced_at = Column(DateTime, default=datetime.utcnow, index=True)
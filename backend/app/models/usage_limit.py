@@ -20,6 +20,10 @@ class UsageLimit(Base):
     # Resume Count
     resume_count = Column(Integer, default=0)
     
+    # Analyses held by bulk uploads that are still being processed
+    analyses_reserved = Column(Integer, nullable=False, default=0)
+    analyses_reserved_at = Column(DateTime, nullable=True)
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,8 +1,8 @@
 """
 Pydantic schemas for request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from app.models.user import PlanTier
 
@@ -99,6 +99,40 @@ class ResumeUpdate(BaseModel):
     content: Optional[Dict[str, Any]] = None
 
 
+# Preview content is a draft: every field is optional, but each must have
+# a shape the renderer understands
+PreviewSectionItem = Union[str, Dict[str, Union[str, int, float, None]]]
+PreviewSection = Union[str, List[PreviewSectionItem], None]
+
+
+class PreviewPersonalInfo(BaseModel):
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    contact: Optional[str] = None
+
+
+class ResumePreviewContent(BaseModel):
+    """Resume.content as rendered; any other key is a section (text or a list of entries)."""
+    model_config = ConfigDict(extra="allow")
+    __pydantic_extra__: Dict[str, PreviewSection]
+    
+    personal_info: Optional[PreviewPersonalInfo] = None
+    summary: PreviewSection = None
+    skills: PreviewSection = None
+
+
+class ResumePreviewRequest(BaseModel):
+    content: ResumePreviewContent
+    template_id: Optional[int] = None
+    page: int = Field(1, ge=1)
+
+
+class ResumeBulkExportRequest(BaseModel):
+    resume_ids: List[int] = Field(..., min_length=1, max_length=50)
+
+
 class ResumeResponse(BaseModel):
     id: int
     user_id: int
@@ -142,3 +176,16 @@ class ResumeAnalysisResponse(BaseModel):
 class EnhanceResumeRequest(BaseModel):
     accepted_suggestions: List[int] = Field(..., description="List of suggestion indices to accept")
 
+
+class JDMatchRequest(BaseModel):
+    job_description: str = Field(..., min_length=20, max_length=20000)
+
+
+class RankResumesRequest(JDMatchRequest):
+    top_k: int = Field(10, ge=1, le=100)
+
+
+class ResumeLintRequest(BaseModel):
+    text: str = Field(..., min_length=1, max_length=5000, description="A bullet or a section, one bullet per line")
+    section: str = Field("experience", max_length=30)
+
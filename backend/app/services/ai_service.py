@@ -2,10 +2,12 @@
 AI Service - Hugging Face Integration
 LOCKED SYSTEM PROMPT - AI ONLY PERFORMS SPECIFIC RESUME TASKS
 """
-import requests
+import time
 from typing import Optional
 from app.core.config import settings
+from app.core.metrics import OPENROUTER_REQUEST_DURATION, OPENROUTER_TOKENS
 from app.core.security import sanitize_input
+from app.core.tracing import span
 from fastapi import HTTPException
 
 
@@ -28,9 +30,10 @@ class AIService:
         SECURITY: This method is NOT exposed to users.
         """
         import logging
+        import requests  # Imported on first use to keep startup fast
         logger = logging.getLogger(__name__)
         
-        api_url = "https://openrouter.ai/api/v1/chat/completions"
+        api_url = f"{settings.OPENROUTER_BASE_URL.rstrip('/')}/chat/completions"
         headers = {
             "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
             "Content-Type": "application/json",
@@ -57,7 +60,20 @@ class AIService:
         
         try:
             logger.info(f"Calling OpenRouter API with model: {settings.AI_MODEL}")
-            response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            started = time.perf_counter()
+            try:
+                with span("openrouter.chat", kind="client", model=settings.AI_MODEL) as s:
+                    response = requests.post(api_url, headers=headers, json=payload, timeout=30)
+                    s.set_attribute("http.status_code", response.status_code)
+            except requests.exceptions.Timeout:
+                OPENROUTER_REQUEST_DURATION.observe(time.perf_counter() - started, model=settings.AI_MODEL, status="timeout")
+                raise
+            except requests.exceptions.RequestException:
+                OPENROUTER_REQUEST_DURATION.observe(time.perf_counter() - started, model=settings.AI_MODEL, status="error")
+                raise
+            OPENROUTER_REQUEST_DURATION.observe(
+                time.perf_counter() - started, model=settings.AI_MODEL, status=str(response.status_code)
+            )
             
             # Log response status
             logger.info(f"OpenRouter response status: {response.status_code}")
@@ -108,6 +124,11 @@ class AIService:
             result = response.json()
             logger.info("Successfully received response from OpenRouter")
             
+            usage = result.get("usage") or {}
+            for token_type in ("prompt", "completion"):
+                if usage.get(f"{token_type}_tokens"):
+                    OPENROUTER_TOKENS.inc(usage[f"{token_type}_tokens"], model=settings.AI_MODEL, type=token_type)
+            
             # Extract message from OpenAI-compatible response
             if "choices" in result and len(result["choices"]) > 0:
                 content = result["choices"][0]["message"]["content"].strip()
@@ -0,0 +1,307 @@
+"""
+Upload Blob Store - content-addressed storage for uploaded resume PDFs.
+
+Files are keyed by their SHA-256 digest, so identical uploads are stored
+once. UploadBlob rows track size and how many analyses reference each
+blob; a background sweeper removes unreferenced blobs and anything older
+than UPLOAD_TTL_HOURS.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, Optional, Tuple, Type
+from fastapi import UploadFile
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.upload_blob import UploadBlob
+from app.models.resume_analysis import ResumeAnalysis
+
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobStore(ABC):
+    """Storage backend interface. Keys are hex SHA-256 digests."""
+
+    @abstractmethod
+    async def stage_stream(self, file: UploadFile) -> Tuple[str, int, str]:
+        """
+        Stream an upload into a staging area and hash it.
+
+        Returns:
+            (digest, size, staged) - pass staged to publish() or discard()
+        """
+
+    @abstractmethod
+    def publish(self, digest: str, staged: str) -> None:
+        """Move a staged upload into place (dropping it if the blob is already stored)."""
+
+    @abstractmethod
+    def discard(self, staged: str) -> None:
+        """Drop a staged upload that will not be published."""
+
+    async def put_stream(self, file: UploadFile) -> Tuple[str, int]:
+        """
+        Stream an upload straight into the store. Returns (digest, size).
+        Uploads that will be referenced go through BlobRefService.store_upload.
+        """
+        digest, size, staged = await self.stage_stream(file)
+        try:
+            self.publish(digest, staged)
+        except BaseException:
+            self.discard(staged)
+            raise
+        return digest, size
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        """Whether a blob is stored."""
+
+    @abstractmethod
+    def open(self, digest: str):
+        """Open a stored blob for binary reading."""
+
+    @abstractmethod
+    def delete(self, digest: str) -> None:
+        """Delete a stored blob (no error if it is already gone)."""
+
+    @abstractmethod
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        """Yield (digest, modified_at) for every stored blob."""
+
+
+class LocalBlobStore(BlobStore):
+    """Local filesystem backend with sharded paths: root/ab/cd/abcd...."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    async def stage_stream(self, file: UploadFile) -> Tuple[str, int, str]:
+        os.makedirs(self.root, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+
+        # Stage in the store root so publishing is an atomic rename
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                while True:
+                    chunk = await file.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    await run_in_threadpool(tmp.write, chunk)
+        except BaseException:
+            self.discard(tmp_path)
+            raise
+        return hasher.hexdigest(), size, tmp_path
+
+    def publish(self, digest: str, staged: str) -> None:
+        final_path = self.path_for(digest)
+        if os.path.exists(final_path):
+            # Duplicate upload - keep the existing copy, refresh its age
+            os.remove(staged)
+            os.utime(final_path)
+        else:
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.replace(staged, final_path)
+
+    def discard(self, staged: str) -> None:
+        try:
+            os.remove(staged)
+        except FileNotFoundError:
+            pass
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path_for(digest))
+
+    def open(self, digest: str):
+        return open(self.path_for(digest), "rb")
+
+    def delete(self, digest: str) -> None:
+        try:
+            os.remove(self.path_for(digest))
+        except FileNotFoundError:
+            pass
+
+    def iter_blobs(self) -> Iterator[Tuple[str, datetime]]:
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".part"):
+                    continue  # In-progress upload
+                path = os.path.join(dirpath, name)
+                try:
+                    modified_at = datetime.utcfromtimestamp(os.path.getmtime(path))
+                except FileNotFoundError:
+                    continue
+                yield name, modified_at
+
+
+# Available backends, selected by settings.UPLOAD_STORAGE_BACKEND
+BLOB_STORE_BACKENDS: Dict[str, Type[BlobStore]] = {
+    "local": LocalBlobStore,
+}
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Get the process-wide blob store for uploaded files."""
+    global _blob_store
+    if _blob_store is None:
+        backend = BLOB_STORE_BACKENDS[settings.UPLOAD_STORAGE_BACKEND]
+        _blob_store = backend(settings.UPLOAD_DIR)
+    return _blob_store
+
+
+class BlobRefService:
+    """Reference counting and cleanup for stored upload blobs."""
+
+    @staticmethod
+    def acquire(db: Session, digest: str, size: int) -> None:
+        """
+        Add a reference to a blob, creating its row on first upload.
+        Does not commit; the caller commits along with the referencing row.
+        """
+        now = datetime.utcnow()
+        updated = db.query(UploadBlob).filter(UploadBlob.digest == digest).update(
+            {
+                UploadBlob.ref_count: UploadBlob.ref_count + 1,
+                UploadBlob.last_referenced_at: now
+            },
+            synchronize_session=False
+        )
+        if updated:
+            return
+
+        try:
+            # Savepoint, so a duplicate insert leaves the caller's pending rows alone
+            with db.begin_nested():
+                db.add(UploadBlob(digest=digest, size=size, ref_count=1, created_at=now, last_referenced_at=now))
+        except IntegrityError:
+            # Another request inserted the same blob concurrently
+            db.query(UploadBlob).filter(UploadBlob.digest == digest).update(
+                {
+                    UploadBlob.ref_count: UploadBlob.ref_count + 1,
+                    UploadBlob.last_referenced_at: now
+                },
+                synchronize_session=False
+            )
+
+    @staticmethod
+    async def store_upload(db: Session, store: BlobStore, file: UploadFile) -> Tuple[str, int]:
+        """
+        Store an upload and add a reference to it (not committed, see acquire).
+
+        The reference is claimed before the file is published, so the sweeper
+        cannot delete an existing copy between the duplicate check and the
+        reference: it either sees the claim and keeps the blob, or deletes it
+        first and publish() writes it again.
+
+        Returns:
+            (digest, size)
+        """
+        digest, size, staged = await store.stage_stream(file)
+        try:
+            BlobRefService.acquire(db, digest, size)
+            # A rename, done inline so no other request runs while the claim is pending
+            store.publish(digest, staged)
+        except BaseException:
+            store.discard(staged)
+            raise
+        return digest, size
+
+    @staticmethod
+    def release(db: Session, digest: str) -> None:
+        """Drop a reference to a blob. The sweeper deletes it once unreferenced."""
+        db.query(UploadBlob).filter(
+            UploadBlob.digest == digest,
+            UploadBlob.ref_count > 0
+        ).update(
+            {UploadBlob.ref_count: UploadBlob.ref_count - 1},
+            synchronize_session=False
+        )
+
+    @staticmethod
+    def sweep(db: Session, store: BlobStore, ttl: timedelta) -> Dict[str, int]:
+        """
+        Delete unreferenced blobs and blobs older than the TTL.
+        Analyses pointing at an expired blob have their reference cleared.
+
+        Returns:
+            Dictionary with deleted blob count and bytes freed
+        """
+        cutoff = datetime.utcnow() - ttl
+        is_expired = (UploadBlob.ref_count <= 0) | (UploadBlob.last_referenced_at < cutoff)
+        candidates = db.query(UploadBlob.digest, UploadBlob.size).filter(is_expired).all()
+
+        deleted = 0
+        freed = 0
+        for digest, size in candidates:
+            # Re-check in the DELETE so a blob re-referenced since the scan survives
+            removed = db.query(UploadBlob).filter(
+                UploadBlob.digest == digest,
+                is_expired
+            ).delete(synchronize_session=False)
+            if not removed:
+                continue  # Nothing was changed, so nothing to roll back
+            db.query(ResumeAnalysis).filter(
+                ResumeAnalysis.upload_digest == digest
+            ).update({ResumeAnalysis.upload_digest: None}, synchronize_session=False)
+            # Delete the file before committing: an upload claiming this digest
+            # meanwhile waits on the row and then publishes a fresh copy
+            store.delete(digest)
+            db.commit()
+            deleted += 1
+            freed += size or 0
+
+        # Orphaned files with no row (upload failed before its analysis committed)
+        known = {digest for (digest,) in db.query(UploadBlob.digest).all()}
+        for digest, modified_at in list(store.iter_blobs()):
+            if digest not in known and modified_at < cutoff:
+                store.delete(digest)
+                deleted += 1
+
+        return {"deleted": deleted, "bytes_freed": freed}
+
+    @staticmethod
+    def total_size(db: Session) -> int:
+        """Total bytes currently held in the blob store."""
+        return db.query(func.coalesce(func.sum(UploadBlob.size), 0)).scalar()
+
+
+def _sweep_once() -> Dict[str, int]:
+    db = SessionLocal()
+    try:
+        return BlobRefService.sweep(db, get_blob_store(), timedelta(hours=settings.UPLOAD_TTL_HOURS))
+    finally:
+        db.close()
+
+
+async def run_blob_sweeper() -> None:
+    """Background task: periodically sweep expired upload blobs."""
+    interval = settings.UPLOAD_SWEEP_INTERVAL_MINUTES * 60
+    while True:
+        try:
+            result = await run_in_threadpool(_sweep_once)
+            if result["deleted"]:
+                logger.info(f"Blob sweeper removed {result['deleted']} blobs ({result['bytes_freed']} bytes)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Blob sweeper failed: {str(e)}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,221 @@
+"""
+Job Description Match - how well a resume covers a job description.
+
+Both sides are tokenized with the skill extraction trie, extended with
+the keywords in jd_vocabulary.py, into sparse {term id: weight} vectors:
+- the job description with sublinear term frequency times the term's
+  category weight, (1 + log tf) * weight
+- the resume with BM25 term saturation over the parsed sections, so
+  repeating a keyword helps a little and keyword stuffing no further
+
+The match score is the share of the job description's weight that the
+resume covers (one sparse dot product); missing keywords are the
+heaviest job description terms the resume never mentions.
+"""
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional
+from app.services.jd_vocabulary import (
+    JD_VOCABULARY, CATEGORY_WEIGHTS, JD_ALIASES, SKILL_CATEGORIES, TAXONOMY_CATEGORIES
+)
+from app.services.skill_extraction_service import SkillTrie
+
+
+SparseVector = Dict[int, float]
+
+# BM25 parameters for resume terms. k1 is low because a single mention of
+# a skill is already strong evidence; b only mildly favours short resumes
+BM25_K1 = 0.5
+BM25_B = 0.3
+AVG_RESUME_TERMS = 25.0  # Weighted vocabulary terms in a typical resume
+
+# How much a mention counts, by parsed resume section
+SECTION_WEIGHTS = {
+    "skills": 1.5,
+    "experience": 1.0,
+    "projects": 1.0,
+    "summary": 0.8,
+    "education": 0.8,
+    "achievements": 0.8,
+    "unclassified": 0.8,
+    "extra": 0.6,
+    "contact": 0.0,
+    "personal_info": 0.0,
+}
+
+MAX_MISSING_KEYWORDS = 15
+
+
+class JDVocabulary:
+    """Term ids, categories and weights over the skills taxonomy plus JD_VOCABULARY."""
+
+    def __init__(self):
+        extra_terms: Dict[str, Dict[str, List[str]]] = {
+            category: {term: [] for term in terms} for category, terms in JD_VOCABULARY.items()
+        }
+        term_categories = {term: category for category, terms in JD_VOCABULARY.items() for term in terms}
+        for alias, term in JD_ALIASES.items():
+            extra_terms[term_categories[term]][term].append(alias)
+
+        # Skills keep their skill extraction ids; JD_VOCABULARY terms follow
+        self.trie = SkillTrie(extra_terms)
+        self.terms: List[str] = self.trie.names
+        self.categories: List[str] = [
+            category if category in JD_VOCABULARY
+            else SKILL_CATEGORIES.get(name, TAXONOMY_CATEGORIES.get(category, "skill"))
+            for name, category in zip(self.trie.names, self.trie.categories)
+        ]
+        self.weights: List[float] = [CATEGORY_WEIGHTS[category] for category in self.categories]
+
+    def term_ids(self, text: str, skills_section: bool = False) -> List[int]:
+        """
+        Vocabulary term ids mentioned in text, in order (repeats kept).
+
+        Args:
+            text: Job description or resume text
+            skills_section: Whether text is a resume skills list (see
+                SkillTrie.find)
+        """
+        return self.trie.find(text, skills_section=skills_section)
+
+
+_vocabulary: Optional[JDVocabulary] = None
+
+
+def get_jd_vocabulary() -> JDVocabulary:
+    """Get the process-wide job description vocabulary."""
+    global _vocabulary
+    if _vocabulary is None:
+        _vocabulary = JDVocabulary()
+    return _vocabulary
+
+
+def _weighted_tf_vector(job_description: str) -> SparseVector:
+    vocabulary = get_jd_vocabulary()
+    counts = Counter(vocabulary.term_ids(job_description))
+    return {
+        term_id: (1 + math.log(count)) * vocabulary.weights[term_id]
+        for term_id, count in counts.items()
+    }
+
+
+_job_description_vector = lru_cache(maxsize=256)(_weighted_tf_vector)
+
+
+class JDMatchService:
+    """Service for scoring resumes against job descriptions."""
+
+    @staticmethod
+    def vectorize_job_description(job_description: str, cached: bool = True) -> SparseVector:
+        """
+        Sparse weighted term frequency vector of a job description.
+
+        Args:
+            job_description: Job description text
+            cached: Reuse vectors of recently seen texts (do not modify
+                the result); pass False when indexing many postings
+
+        Returns:
+            {term id: weight}
+        """
+        if not cached:
+            return _weighted_tf_vector(job_description)
+        return _job_description_vector(job_description)
+
+    @staticmethod
+    def resume_term_frequencies(parsed_data: Dict) -> Dict[int, float]:
+        """
+        Section-weighted term frequencies of a parsed resume.
+
+        Args:
+            parsed_data: Output of PDFParserService.parse_resume_structure
+
+        Returns:
+            {term id: weighted count}
+        """
+        vocabulary = get_jd_vocabulary()
+        frequencies: Dict[int, float] = {}
+        for section, content in parsed_data.items():
+            weight = SECTION_WEIGHTS.get(section, 0.8)
+            if not weight or not content:
+                continue
+            if not isinstance(content, str):
+                content = str(content)
+            for term_id in vocabulary.term_ids(content, skills_section=section == "skills"):
+                frequencies[term_id] = frequencies.get(term_id, 0.0) + weight
+        return frequencies
+
+    @staticmethod
+    def sections_from_resume_content(content: Dict) -> Dict[str, str]:
+        """
+        Section texts of a resume-builder Resume.content, in the shape of
+        parse_resume_structure output (values only; field names such as
+        "degree" are not resume text).
+        """
+        def flatten(value) -> List[str]:
+            if isinstance(value, dict):
+                return [text for item in value.values() for text in flatten(item)]
+            if isinstance(value, (list, tuple)):
+                return [text for item in value for text in flatten(item)]
+            return [str(value)] if value not in (None, "") else []
+
+        return {section: "\n".join(flatten(value)) for section, value in (content or {}).items()}
+
+    @staticmethod
+    def vectorize_resume(parsed_data: Dict) -> SparseVector:
+        """
+        Sparse BM25 saturation vector of a parsed resume: how well each
+        term is covered, from 0 (absent) towards 1.
+
+        Args:
+            parsed_data: Output of PDFParserService.parse_resume_structure
+
+        Returns:
+            {term id: coverage}
+        """
+        frequencies = JDMatchService.resume_term_frequencies(parsed_data)
+        length_norm = 1 - BM25_B + BM25_B * sum(frequencies.values()) / AVG_RESUME_TERMS
+        return {
+            term_id: tf / (tf + BM25_K1 * length_norm)
+            for term_id, tf in frequencies.items()
+        }
+
+    @staticmethod
+    def score(job_vector: SparseVector, resume_vector: SparseVector) -> float:
+        """Share of the job description's weight covered by the resume (0-100)."""
+        total = sum(job_vector.values())
+        if not total:
+            return 0.0
+        covered = sum(weight * resume_vector.get(term_id, 0.0) for term_id, weight in job_vector.items())
+        return round(100 * covered / total, 1)
+
+    @staticmethod
+    def match(parsed_data: Dict, job_description: str) -> Dict:
+        """
+        Match a parsed resume against a job description.
+
+        Args:
+            parsed_data: Output of PDFParserService.parse_resume_structure
+            job_description: Job description text
+
+        Returns:
+            Match score, matched keywords and the most important missing keywords
+        """
+        vocabulary = get_jd_vocabulary()
+        job_vector = JDMatchService.vectorize_job_description(job_description)
+        resume_vector = JDMatchService.vectorize_resume(parsed_data)
+
+        by_importance = sorted(job_vector, key=lambda term_id: (-job_vector[term_id], term_id))
+        matched = [term_id for term_id in by_importance if term_id in resume_vector]
+        missing = [term_id for term_id in by_importance if term_id not in resume_vector]
+
+        return {
+            "match_score": JDMatchService.score(job_vector, resume_vector),
+            "job_keywords": len(job_vector),
+            "matched_keywords": [vocabulary.terms[term_id] for term_id in matched],
+            "missing_keywords": [
+                {"keyword": vocabulary.terms[term_id], "category": vocabulary.categories[term_id]}
+                for term_id in missing[:MAX_MISSING_KEYWORDS]
+            ],
+        }
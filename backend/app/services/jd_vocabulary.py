@@ -0,0 +1,105 @@
+"""
+Job Description Match Vocabulary
+Keywords recognised when matching resumes against job descriptions.
+
+Skills come from the skills taxonomy (skills_taxonomy.py), so matching
+and skill extraction agree on every skill and its spellings; this module
+adds the practices, soft skills and qualifications the taxonomy does not
+list, and the job description category of each taxonomy skill.
+
+Terms are grouped by category; the category sets the term's weight
+(specific technical skills say more about a job than soft skills or
+degree requirements). The weights are fixed priors, not IDF measured on
+a corpus. Multi-word terms are matched as phrases. Text outside the
+vocabulary is ignored.
+"""
+
+JD_VOCABULARY = {
+    # Practices and domain knowledge
+    "concept": [
+        "artificial intelligence", "data science", "data engineering", "data structures",
+        "algorithms", "big data", "etl", "data pipeline", "data modeling", "data warehouse",
+        "api", "microservices", "web development", "full stack", "frontend", "backend",
+        "mobile development", "object-oriented programming", "system design",
+        "distributed systems", "cloud computing", "devops", "test automation", "automation",
+        "debugging", "version control", "agile", "scrum", "cybersecurity", "networking",
+        "database", "user research", "accessibility", "seo", "digital marketing",
+        "product management", "financial analysis", "financial modeling", "accounting",
+        "business analysis", "market research", "supply chain", "operations",
+        "embedded systems", "signal processing", "cad", "a/b testing", "performance optimization",
+        "security", "authentication", "deployment", "monitoring", "scalability", "prompt engineering",
+    ],
+    # Interpersonal skills
+    "soft": [
+        "collaboration", "analytical skills", "attention to detail", "creativity", "mentoring",
+        "presentation", "stakeholder management", "ownership", "initiative",
+        "interpersonal skills", "decision making", "negotiation", "customer service",
+        "multitasking", "self-motivated", "fast learner",
+    ],
+    # Education and experience requirements
+    "qualification": [
+        "bachelor", "master", "degree", "b.tech", "b.e", "m.tech", "mba", "bca", "mca",
+        "b.sc", "computer science", "information technology", "electronics", "mechanical",
+        "engineering", "mathematics", "internship", "certification", "gpa", "cgpa",
+        "hackathon", "open source", "research", "publication", "fresher", "graduate",
+    ],
+}
+
+# Category of taxonomy skills: "skill", unless their taxonomy category or
+# the skill itself is listed here
+TAXONOMY_CATEGORIES = {
+    "Soft Skills": "soft",
+}
+SKILL_CATEGORIES = {
+    "Machine Learning": "concept",
+    "Deep Learning": "concept",
+    "Natural Language Processing": "concept",
+    "Computer Vision": "concept",
+    "Data Analysis": "concept",
+    "Data Visualization": "concept",
+    "Statistics": "concept",
+    "REST APIs": "concept",
+    "CI/CD": "concept",
+    "Unit Testing": "concept",
+    "UI/UX Design": "concept",
+    "Responsive Design": "concept",
+    "Project Management": "concept",
+}
+
+# Weight of a term, by category
+CATEGORY_WEIGHTS = {
+    "skill": 3.0,
+    "concept": 2.2,
+    "qualification": 1.4,
+    "soft": 1.0,
+}
+
+# Alternative spellings -> vocabulary term
+JD_ALIASES = {
+    "ai": "artificial intelligence",
+    "dsa": "data structures",
+    "oop": "object-oriented programming",
+    "oops": "object-oriented programming",
+    "object oriented programming": "object-oriented programming",
+    "fullstack": "full stack",
+    "full-stack": "full stack",
+    "front-end": "frontend",
+    "front end": "frontend",
+    "back-end": "backend",
+    "back end": "backend",
+    "bachelors": "bachelor",
+    "bachelor's": "bachelor",
+    "masters": "master",
+    "master's": "master",
+    "btech": "b.tech",
+    "mtech": "m.tech",
+    "bsc": "b.sc",
+    "cse": "computer science",
+    "ece": "electronics",
+    "internships": "internship",
+    "algorithm": "algorithms",
+    "data structure": "data structures",
+    "microservice": "microservices",
+    "certified": "certification",
+    "genai": "artificial intelligence",
+}
@@ -0,0 +1,168 @@
+"""
+Job Posting Index - find the best job postings for one resume.
+
+Active postings are indexed once into an inverted index over the job
+description vocabulary (term -> {posting id: term weight}). A resume
+is scored against every posting by walking only the posting lists of
+the terms it contains, so cost grows with matching postings rather than
+with resume/posting pairs. Scores equal JDMatchService.match for the
+same pair.
+
+The index is kept current incrementally: at most every
+JOB_POSTING_INDEX_REFRESH_SECONDS a query compares posting ids and
+updated_at with the database, re-indexes new or edited postings and
+drops deactivated ones.
+"""
+import heapq
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.job_posting import JobPosting
+from app.services.jd_match_service import JDMatchService, SparseVector, get_jd_vocabulary
+
+
+LOAD_BATCH_SIZE = 500
+MAX_MISSING_KEYWORDS = 5
+
+
+class JobPostingIndex:
+    """Inverted index over active job postings."""
+
+    def __init__(self):
+        self.postings: Dict[int, Dict[int, float]] = {}  # term id -> {posting id: weight}
+        self.vectors: Dict[int, SparseVector] = {}  # posting id -> {term id: weight}
+        self.norms: Dict[int, float] = {}  # posting id -> total weight
+        self.details: Dict[int, Dict] = {}  # posting id -> title, company, location, url
+        self.versions: Dict[int, Optional[datetime]] = {}  # posting id -> updated_at
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def add(self, posting_id: int, vector: SparseVector, details: Dict, version: Optional[datetime] = None) -> None:
+        """Index (or re-index) one posting."""
+        if posting_id in self.vectors:
+            self.remove(posting_id)
+        total = sum(vector.values())
+        if not total:
+            self.versions[posting_id] = version  # Nothing to match; remember it was seen
+            return
+        self.vectors[posting_id] = vector
+        self.norms[posting_id] = total
+        self.details[posting_id] = details
+        self.versions[posting_id] = version
+        for term_id, weight in vector.items():
+            self.postings.setdefault(term_id, {})[posting_id] = weight
+
+    def remove(self, posting_id: int) -> None:
+        """Drop one posting."""
+        vector = self.vectors.pop(posting_id, None)
+        self.norms.pop(posting_id, None)
+        self.details.pop(posting_id, None)
+        self.versions.pop(posting_id, None)
+        for term_id in vector or ():
+            posting_list = self.postings[term_id]
+            posting_list.pop(posting_id, None)
+            if not posting_list:
+                del self.postings[term_id]
+
+    def sync(self, db: Session, force: bool = False) -> Tuple[int, int]:
+        """
+        Re-index new and edited postings and drop inactive ones.
+        Skipped (returns (0, 0)) if the last sync is recent enough.
+
+        Returns:
+            (postings indexed, postings removed)
+        """
+        now = time.monotonic()
+        if not force and self._synced_at is not None and now - self._synced_at < settings.JOB_POSTING_INDEX_REFRESH_SECONDS:
+            return 0, 0
+
+        current = dict(db.query(JobPosting.id, JobPosting.updated_at).filter(JobPosting.is_active == True))  # noqa: E712
+        removed = [posting_id for posting_id in self.versions if posting_id not in current]
+        for posting_id in removed:
+            self.remove(posting_id)
+
+        changed = sorted(
+            posting_id for posting_id, updated_at in current.items()
+            if posting_id not in self.versions or self.versions[posting_id] != updated_at
+        )
+        for start in range(0, len(changed), LOAD_BATCH_SIZE):
+            rows = db.query(
+                JobPosting.id, JobPosting.title, JobPosting.company, JobPosting.location,
+                JobPosting.url, JobPosting.description, JobPosting.updated_at
+            ).filter(JobPosting.id.in_(changed[start:start + LOAD_BATCH_SIZE])).all()
+            for row in rows:
+                vector = JDMatchService.vectorize_job_description(f"{row.title}\n{row.description}", cached=False)
+                details = {"title": row.title, "company": row.company, "location": row.location, "url": row.url}
+                self.add(row.id, vector, details, row.updated_at)
+
+        self._synced_at = now
+        return len(changed), len(removed)
+
+    def search(self, resume_vector: SparseVector, top_k: int) -> List[Tuple[int, float]]:
+        """
+        Best postings for a resume vector.
+
+        Returns:
+            [(posting id, match score 0-100)], best first; postings sharing
+            no keyword with the resume are left out
+        """
+        covered: Dict[int, float] = {}
+        for term_id, coverage in resume_vector.items():
+            for posting_id, weight in self.postings.get(term_id, {}).items():
+                covered[posting_id] = covered.get(posting_id, 0.0) + weight * coverage
+
+        top = heapq.nlargest(
+            top_k,
+            ((score / self.norms[posting_id], posting_id) for posting_id, score in covered.items()),
+            key=lambda item: (item[0], -item[1])
+        )
+        return [(posting_id, round(100 * score, 1)) for score, posting_id in top]
+
+    def match_resume(self, db: Session, parsed_data: Dict, top_k: int) -> Dict:
+        """
+        Sync with the database and find the best postings for a parsed resume.
+
+        Returns:
+            Ranked postings with scores, matched and missing keywords
+        """
+        vocabulary = get_jd_vocabulary()
+        resume_vector = JDMatchService.vectorize_resume(parsed_data)
+        with self._lock:
+            self.sync(db)
+            results = []
+            for posting_id, match_score in self.search(resume_vector, top_k):
+                vector = self.vectors[posting_id]
+                by_importance = sorted(vector, key=lambda term_id: (-vector[term_id], term_id))
+                results.append({
+                    "posting_id": posting_id,
+                    **self.details[posting_id],
+                    "match_score": match_score,
+                    "matched_keywords": [vocabulary.terms[t] for t in by_importance if t in resume_vector],
+                    "missing_keywords": [
+                        vocabulary.terms[t] for t in by_importance if t not in resume_vector
+                    ][:MAX_MISSING_KEYWORDS],
+                })
+            indexed = len(self.vectors)
+
+        return {"postings_indexed": indexed, "results": results}
+
+
+_job_posting_index: Optional[JobPostingIndex] = None
+_job_posting_index_lock = threading.Lock()
+
+
+def get_job_posting_index() -> JobPostingIndex:
+    """Get the process-wide job posting index (built on first use)."""
+    global _job_posting_index
+    if _job_posting_index is None:
+        with _job_posting_index_lock:
+            # Two requests may race here; only one index must ever exist
+            if _job_posting_index is None:
+                _job_posting_index = JobPostingIndex()
+    return _job_posting_index
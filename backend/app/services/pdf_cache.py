@@ -0,0 +1,207 @@
+"""
+Rendered PDF Cache - size-bounded LRU of exported resume PDFs on disk.
+
+Entries are keyed by everything that affects the rendered bytes: resume
+id, its updated_at and content hash, the template id and the watermark
+flag. The key doubles as the download ETag. Entries for a resume are
+dropped when it is updated or deleted.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Optional
+from app.core.config import settings
+from app.core.metrics import record_cache
+
+
+class PDFCache:
+    """LRU cache of rendered PDFs stored as root/<resume_id>-<digest>.pdf."""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: Optional["OrderedDict[str, int]"] = None  # key -> size, oldest first
+        self._total = 0
+
+    @staticmethod
+    def cache_key(resume, template_id: Optional[int], watermark: bool,
+                  template_settings: Optional[Dict] = None) -> str:
+        """
+        Cache key (and ETag value) for a resume rendering. The template's
+        settings are part of it, so restyling a template re-renders.
+        """
+        content_hash = hashlib.sha256(
+            json.dumps(resume.content, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        settings_hash = hashlib.sha256(
+            json.dumps(template_settings, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        updated_at = resume.updated_at.isoformat() if resume.updated_at else ""
+        fingerprint = f"{updated_at}|{content_hash}|{template_id}|{settings_hash}|{int(watermark)}"
+        digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+        return f"{resume.id}-{digest}"
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.pdf")
+
+    def _index(self) -> "OrderedDict[str, int]":
+        """Load the LRU index from disk on first use (oldest access first)."""
+        if self._entries is None:
+            os.makedirs(self.root, exist_ok=True)
+            found = []
+            for name in os.listdir(self.root):
+                if not name.endswith(".pdf"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.root, name))
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, name[:-4], stat.st_size))
+            self._entries = OrderedDict((key, size) for _, key, size in sorted(found))
+            self._total = sum(self._entries.values())
+        return self._entries
+
+    def _forget(self, key: str) -> None:
+        size = self._index().pop(key, None)
+        if size is not None:
+            self._total -= size
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """
+        Open a cached PDF for reading (marking it recently used), or None
+        on a miss. The handle stays readable if the entry is evicted
+        before the caller has finished with it.
+        """
+        path = self.path_for(key)
+        with self._lock:
+            entries = self._index()
+            try:
+                os.utime(path)  # Keeps LRU order across restarts
+                f = open(path, "rb")
+            except FileNotFoundError:
+                self._forget(key)
+                record_cache("pdf", False)
+                return None
+
+            record_cache("pdf", True)
+            if key in entries:
+                entries.move_to_end(key)
+            else:
+                # Written by another worker process
+                size = os.fstat(f.fileno()).st_size
+                entries[key] = size
+                self._total += size
+            return f
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PDF bytes, or None on a miss."""
+        f = self.open(key)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    def temp_path(self) -> str:
+        """A fresh temp file inside the cache root for a renderer to write into."""
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        os.close(fd)
+        return tmp_path
+
+    def adopt(self, key: str, tmp_path: str) -> Optional[str]:
+        """
+        Move a rendered temp file into the cache, evicting least recently
+        used entries over the size limit.
+
+        Returns:
+            Cached path, or None if the file exceeds the cache size
+            (the temp file is left for the caller to serve and remove)
+        """
+        size = os.path.getsize(tmp_path)
+        if size > self.max_bytes:
+            return None
+
+        path = self.path_for(key)
+        with self._lock:
+            entries = self._index()
+            os.replace(tmp_path, path)
+
+            self._forget(key)
+            entries[key] = size
+            self._total += size
+
+            while self._total > self.max_bytes and len(entries) > 1:
+                oldest, oldest_size = entries.popitem(last=False)
+                self._total -= oldest_size
+                self._remove_file(oldest)
+        return path
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store rendered PDF bytes."""
+        if len(data) > self.max_bytes:
+            return
+        tmp_path = self.temp_path()
+        try:
+            with open(tmp_path, "wb") as tmp:
+                tmp.write(data)
+            self.adopt(key, tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def invalidate(self, resume_id: int) -> int:
+        """Drop every cached rendering of a resume. Returns the number removed."""
+        prefix = f"{resume_id}-"
+        removed = 0
+        with self._lock:
+            self._index()
+            # Scan the directory too, other workers may have rendered it
+            for name in os.listdir(self.root):
+                if name.startswith(prefix) and name.endswith(".pdf"):
+                    key = name[:-4]
+                    self._forget(key)
+                    self._remove_file(key)
+                    removed += 1
+        return removed
+
+    def total_size(self) -> int:
+        with self._lock:
+            self._index()
+            return self._total
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self.path_for(key))
+        except FileNotFoundError:
+            pass
+
+
+_pdf_cache: Optional[PDFCache] = None
+
+
+def get_pdf_cache() -> PDFCache:
+    """Get the process-wide rendered PDF cache."""
+    global _pdf_cache
+    if _pdf_cache is None:
+        _pdf_cache = PDFCache(settings.PDF_CACHE_DIR, settings.PDF_CACHE_MAX_MB * 1024 * 1024)
+    return _pdf_cache
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
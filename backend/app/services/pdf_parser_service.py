@@ -5,13 +5,17 @@ import re
 import io
 from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException, UploadFile
-import fitz  # PyMuPDF
+from app.core.metrics import PDF_PARSE_DURATION
 from app.core.security import sanitize_input
+from app.core.tracing import span
+from app.services.writing_rules import METRIC_ACTION_VERBS
 
 
 class PDFParserService:
     """Service for parsing resume PDFs and extracting structured content."""
     
+    MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+    
     # Common resume section keywords
     SECTION_KEYWORDS = {
         "contact": ["contact", "personal", "information", "details"],
@@ -48,7 +52,7 @@ class PDFParserService:
         file_size = len(content)
         await file.seek(0)  # Reset file pointer
         
-        if file_size > 5 * 1024 * 1024:  # 5MB
+        if file_size > PDFParserService.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=400,
                 detail="File size must not exceed 5MB"
@@ -78,9 +82,27 @@ class PDFParserService:
             # Read file content
             content = await file.read()
             await file.seek(0)  # Reset for potential reuse
-            
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Error processing PDF: {str(e)}"
+            )
+        
+        return PDFParserService.extract_text_from_bytes(content)
+    
+    @staticmethod
+    def extract_text_from_bytes(content: bytes) -> str:
+        """
+        Extract raw text from PDF bytes (blocking; used directly by bulk analysis).
+        
+        Raises:
+            HTTPException: If PDF parsing fails
+        """
+        import fitz  # PyMuPDF - imported on first use to keep startup fast
+        
+        try:
             # Open PDF from bytes
-            with fitz.open(stream=content, filetype="pdf") as doc:
+            with PDF_PARSE_DURATION.time(), fitz.open(stream=content, filetype="pdf") as doc:
                 extracted_text = ""
                 for page in doc:
                     extracted_text += page.get_text() + "\n"
@@ -213,14 +235,8 @@ class PDFParserService:
         metrics["quantifiable_achievements"] = len(re.findall(number_pattern, text))
         
         # Common action verbs in resumes
-        action_verbs = [
-            "developed", "created", "implemented", "designed", "built", "managed",
-            "led", "achieved", "improved", "increased", "reduced", "optimized",
-            "analyzed", "coordinated", "executed", "launched", "delivered"
-        ]
-        
         text_lower = text.lower()
-        for verb in action_verbs:
+        for verb in METRIC_ACTION_VERBS:
             if verb in text_lower:
                 metrics["action_verbs"] += 1
         
@@ -243,15 +259,20 @@ class PDFParserService:
             Tuple of (extracted_text, parsed_structure, metrics)
         """
         # Validate PDF
-        await PDFParserService.validate_pdf(file)
+        with span("pdf.validate"):
+            await PDFParserService.validate_pdf(file)
         
         # Extract text
-        extracted_text = await PDFParserService.extract_text_from_pdf(file)
+        with span("pdf.extract_text") as s:
+            extracted_text = await PDFParserService.extract_text_from_pdf(file)
+            s.set_attribute("pdf.text_length", len(extracted_text))
         
         # Parse structure
-        parsed_structure = PDFParserService.parse_resume_structure(extracted_text)
+        with span("pdf.parse_structure"):
+            parsed_structure = PDFParserService.parse_resume_structure(extracted_text)
         
         # Extract metrics
-        metrics = PDFParserService.extract_key_metrics(extracted_text)
+        with span("pdf.extract_metrics"):
+            metrics = PDFParserService.extract_key_metrics(extracted_text)
         
         return extracted_text, parsed_structure, metrics
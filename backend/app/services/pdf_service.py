@@ -5,116 +5,458 @@ Generates ATS-safe PDF resumes with watermark for FREE tier.
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from reportlab.platypus import (
+    BaseDocTemplate, PageTemplate, Frame, FrameBreak, NextPageTemplate,
+    KeepInFrame, Paragraph, Spacer, Flowable
+)
+from reportlab.lib.enums import TA_CENTER
 from reportlab.lib import colors
+from collections import OrderedDict
 from io import BytesIO
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import copy
+import hashlib
+import json
+import threading
 from app.models.user import PlanTier
 
 
+# Template fonts mapped onto ReportLab's built-in (ATS-safe) families:
+# family -> (regular, bold)
+FONT_FAMILIES = {
+    "Helvetica": ("Helvetica", "Helvetica-Bold"),
+    "Arial": ("Helvetica", "Helvetica-Bold"),
+    "Calibri": ("Helvetica", "Helvetica-Bold"),
+    "Times New Roman": ("Times-Roman", "Times-Bold"),
+    "Georgia": ("Times-Roman", "Times-Bold"),
+    "Courier": ("Courier", "Courier-Bold"),
+}
+
+# Accent colour for headings per template colour scheme
+COLOR_SCHEMES = {
+    "black": colors.black,
+    "blue": colors.HexColor("#1F4E79"),
+    "navy": colors.HexColor("#1B2A49"),
+    "teal": colors.HexColor("#127475"),
+    "green": colors.HexColor("#2E6B30"),
+    "purple": colors.HexColor("#5B2C83"),
+    "orange": colors.HexColor("#C55A11"),
+    "red": colors.HexColor("#A61C1C"),
+    "brown": colors.HexColor("#6B4226"),
+    "maroon": colors.HexColor("#7B1E2B"),
+    "multicolor": colors.HexColor("#1F4E79"),
+}
+
+# Cache key: (font, font_size, color_scheme, layout); None = built-in default look
+StyleKey = Optional[Tuple[str, int, str, str]]
+
+_BASE_STYLES = None
+_STYLE_CACHE: Dict[StyleKey, Dict[str, ParagraphStyle]] = {}
+
+
+def _base_styles():
+    """ReportLab's sample stylesheet, built once per process."""
+    global _BASE_STYLES
+    if _BASE_STYLES is None:
+        _BASE_STYLES = getSampleStyleSheet()
+    return _BASE_STYLES
+
+
+def style_key(template_settings: Optional[Dict]) -> StyleKey:
+    """Normalize template settings into a style cache key."""
+    if not template_settings:
+        return None
+    return (
+        template_settings.get("font", "Helvetica"),
+        int(template_settings.get("font_size", 11)),
+        template_settings.get("color_scheme", "black"),
+        template_settings.get("layout", "single-column"),
+    )
+
+
+def _compile_styles(key: StyleKey) -> Dict[str, ParagraphStyle]:
+    """Build the paragraph styles for one template style key."""
+    base = _base_styles()
+    if key is None:
+        font, font_size, color_scheme, layout = "Helvetica", 11, "black", "single-column"
+    else:
+        font, font_size, color_scheme, layout = key
+    
+    regular, bold = FONT_FAMILIES.get(font, FONT_FAMILIES["Helvetica"])
+    accent = COLOR_SCHEMES.get(color_scheme, colors.black)
+    name = "_".join(str(part) for part in key) if key else "Default"
+    
+    return {
+        "title": ParagraphStyle(
+            f"{name}-Title",
+            parent=base['Heading1'],
+            fontName=bold,
+            fontSize=font_size + 7,
+            textColor=accent,
+            spaceAfter=12,
+            alignment=TA_CENTER
+        ),
+        "section": ParagraphStyle(
+            f"{name}-Section",
+            parent=base['Heading2'],
+            fontName=bold,
+            fontSize=font_size + 3,
+            textColor=accent,
+            spaceAfter=6,
+            spaceBefore=12
+        ),
+        "body": ParagraphStyle(
+            f"{name}-Body",
+            parent=base['BodyText'],
+            fontName=regular,
+            fontSize=font_size,
+            textColor=colors.black,
+            spaceAfter=8
+        ),
+        "watermark": ParagraphStyle(
+            f"{name}-Watermark",
+            parent=base['Normal'],
+            fontName=regular,
+            fontSize=10,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ),
+    }
+
+
+# Page geometry per template layout.
+#   margin:   page margin in inches
+#   sidebar:  None for a single flow, else (side, width as fraction of the body)
+#   header:   height (inches) of a full-width first-page header band, or None
+#   top_sections: sections placed in the header band (hybrid)
+LAYOUTS = {
+    "single-column": {"margin": 0.75, "sidebar": None, "header": None, "top_sections": ()},
+    "executive": {"margin": 1.0, "sidebar": None, "header": None, "top_sections": ()},
+    "two-column": {"margin": 0.6, "sidebar": ("left", 0.32), "header": 1.1, "top_sections": ()},
+    "creative": {"margin": 0.5, "sidebar": ("left", 0.28), "header": 1.1, "top_sections": ()},
+    "hybrid": {"margin": 0.6, "sidebar": ("right", 0.30), "header": 2.2, "top_sections": ("summary",)},
+}
+
+# Sections that go in the sidebar column of two-column layouts
+SIDEBAR_SECTIONS = {"skills", "certifications", "achievements", "languages", "tools"}
+
+# Template section names -> Resume.content keys
+SECTION_ALIASES = {
+    "objective": "summary",
+    "executive_summary": "summary",
+    "executive_profile": "summary",
+    "technical_skills": "skills",
+    "core_competencies": "skills",
+    "technical_expertise": "skills",
+    "key_projects": "projects",
+    "project_experience": "projects",
+    "project_highlights": "projects",
+    "portfolio": "projects",
+    "key_achievements": "achievements",
+    "awards": "achievements",
+    "internships": "experience",
+    "leadership_experience": "experience",
+    "clinical_experience": "experience",
+    "board_certifications": "certifications",
+    "licenses": "certifications",
+}
+
+# Order used when no template is selected (and for leftover sections)
+DEFAULT_SECTION_ORDER = ["summary", "education", "skills", "projects", "experience", "achievements", "certifications"]
+
+
+class LayoutPlan:
+    """
+    A template's settings compiled into everything the renderer needs:
+    shared paragraph styles, frame geometry and section order.
+    Plans are immutable and shared between concurrent exports.
+    """
+    
+    def __init__(self, template_settings: Optional[Dict]):
+        template_settings = template_settings or {}
+        layout_name = template_settings.get("layout", "single-column")
+        layout = LAYOUTS.get(layout_name, LAYOUTS["single-column"])
+        
+        self.layout = layout_name if layout_name in LAYOUTS else "single-column"
+        self.template_settings = template_settings or None  # For re-compiling in render workers
+        self.style_key = style_key(template_settings or None)
+        self.styles = PDFService.get_styles(template_settings or None)
+        self.margin = layout["margin"] * inch
+        self.sidebar = layout["sidebar"]
+        self.header_height = layout["header"] * inch if layout["header"] else None
+        self.top_sections = set(layout["top_sections"])
+        self.sections = self._compile_sections(template_settings.get("sections"))
+        self.page_frames = self._compile_frames()
+    
+    @staticmethod
+    def _compile_sections(template_sections: Optional[List[str]]) -> List[Tuple[str, str]]:
+        """Resolve template section names into (content_key, heading) pairs."""
+        sections = []
+        seen = set()
+        for name in (template_sections or []) + DEFAULT_SECTION_ORDER:
+            key = SECTION_ALIASES.get(name, name)
+            if key in seen:
+                continue
+            seen.add(key)
+            heading = "PROFESSIONAL SUMMARY" if name == "summary" else name.replace("_", " ").upper()
+            sections.append((key, heading))
+        return sections
+    
+    def _compile_frames(self) -> Dict[str, List[Tuple[str, float, float, float, float]]]:
+        """
+        Frame rectangles (id, x, y, width, height) per page template.
+        'first' is used for page one, 'later' for following pages.
+        """
+        page_width, page_height = letter
+        m = self.margin
+        body_width = page_width - 2 * m
+        body_height = page_height - 2 * m
+        
+        full_page = [("main", m, m, body_width, body_height)]
+        if self.sidebar is None:
+            return {"first": full_page, "later": full_page}
+        
+        side, fraction = self.sidebar
+        gutter = 0.2 * inch
+        side_width = body_width * fraction
+        main_width = body_width - side_width - gutter
+        if side == "left":
+            side_x, main_x = m, m + side_width + gutter
+        else:
+            main_x, side_x = m, m + main_width + gutter
+        
+        # Columns only on page one; the sidebar is filled first (and shrunk to
+        # fit) so that main column overflow continues full-width on the
+        # following pages.
+        column_height = body_height - self.header_height
+        first = [
+            ("header", m, m + column_height, body_width, self.header_height),
+            ("sidebar", side_x, m, side_width, column_height),
+            ("main", main_x, m, main_width, column_height),
+        ]
+        return {"first": first, "later": full_page}
+    
+    def build_page_templates(self) -> List[PageTemplate]:
+        """Fresh Frame objects for one build (frames are stateful while rendering)."""
+        return [
+            PageTemplate(
+                id=template_id,
+                frames=[
+                    Frame(x, y, w, h, id=frame_id)
+                    for frame_id, x, y, w, h in frames
+                ]
+            )
+            for template_id, frames in self.page_frames.items()
+        ]
+    
+
+
+_PLAN_CACHE: Dict[Any, LayoutPlan] = {}
+
+
+def _section_flowables(key: str, heading: str, value: Any, styles: Dict[str, ParagraphStyle]) -> List[Flowable]:
+    """Render one Resume.content section to flowables."""
+    body_style = styles["body"]
+    flowables = [Paragraph(heading, styles["section"])]
+    
+    if isinstance(value, str):
+        flowables.append(Paragraph(value.replace("\n", "<br/>"), body_style))
+        if key == "summary":
+            flowables.append(Spacer(1, 0.1*inch))
+        return flowables
+    
+    if key == "skills" and all(isinstance(item, str) for item in value):
+        flowables.append(Paragraph(", ".join(value), body_style))
+        return flowables
+    
+    for item in value:
+        if isinstance(item, dict):
+            if key == "education":
+                text = f"<b>{item.get('degree', '')}</b> - {item.get('institution', '')}<br/>{item.get('year', '')}"
+            elif key == "projects":
+                text = f"<b>{item.get('name', '')}</b><br/>{item.get('description', '')}"
+            else:
+                values = [str(v) for v in item.values() if v]
+                text = f"<b>{values[0]}</b><br/>{' | '.join(values[1:])}" if values else ""
+        else:
+            text = f"• {item}"
+        flowables.append(Paragraph(text, body_style))
+    return flowables
+
+
+# Section flowables keyed by (style key, section, heading, content hash).
+# Paragraph markup parsing dominates render time, so unchanged sections
+# are reused between renders (e.g. successive live previews).
+FLOWABLE_CACHE_SIZE = 2048
+_FLOWABLE_CACHE: "OrderedDict[Tuple, List[Flowable]]" = OrderedDict()
+_FLOWABLE_LOCK = threading.Lock()
+
+
+def _cached_section_flowables(
+    key_of_styles: StyleKey,
+    key: str,
+    heading: str,
+    value: Any,
+    styles: Dict[str, ParagraphStyle]
+) -> List[Flowable]:
+    """_section_flowables, reusing the parsed flowables of unchanged sections."""
+    content_hash = hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    cache_key = (key_of_styles, key, heading, content_hash)
+    
+    with _FLOWABLE_LOCK:
+        flowables = _FLOWABLE_CACHE.get(cache_key)
+        if flowables is not None:
+            _FLOWABLE_CACHE.move_to_end(cache_key)
+    
+    if flowables is None:
+        flowables = _section_flowables(key, heading, value, styles)
+        with _FLOWABLE_LOCK:
+            _FLOWABLE_CACHE[cache_key] = flowables
+            while len(_FLOWABLE_CACHE) > FLOWABLE_CACHE_SIZE:
+                _FLOWABLE_CACHE.popitem(last=False)
+    
+    # Flowables carry layout state while a document builds; each render
+    # gets shallow copies sharing the parsed text
+    return [copy.copy(flowable) for flowable in flowables]
+
+
 class PDFService:
     """Service for generating ATS-safe PDF resumes."""
     
     @staticmethod
-    def generate_resume_pdf(resume_data: Dict, user_plan: PlanTier) -> BytesIO:
+    def get_styles(template_settings: Optional[Dict] = None) -> Dict[str, ParagraphStyle]:
+        """
+        Get compiled paragraph styles for a template's settings.
+        Styles are built once per (font, font_size, color_scheme, layout)
+        and shared by every export using them.
+        """
+        key = style_key(template_settings)
+        styles = _STYLE_CACHE.get(key)
+        if styles is None:
+            styles = _STYLE_CACHE.setdefault(key, _compile_styles(key))
+        return styles
+    
+    @staticmethod
+    def warm_style_cache(templates: Iterable[Dict]) -> int:
+        """
+        Precompile styles for every template definition (called at startup).
+        
+        Returns:
+            Number of distinct compiled style sets
+        """
+        PDFService.get_styles(None)
+        for template in templates:
+            PDFService.get_styles(template.get("settings"))
+        return len(_STYLE_CACHE)
+    
+    @staticmethod
+    def get_layout_plan(template_settings: Optional[Dict] = None, template_id: Optional[int] = None) -> LayoutPlan:
+        """
+        Get the compiled layout plan for a template.
+        Plans are cached by template id when given, otherwise by settings.
+        """
+        cache_key = ("template", template_id) if template_id is not None else (
+            "settings", style_key(template_settings), tuple((template_settings or {}).get("sections") or ())
+        )
+        plan = _PLAN_CACHE.get(cache_key)
+        if plan is None:
+            plan = _PLAN_CACHE.setdefault(cache_key, LayoutPlan(template_settings))
+        return plan
+    
+    @staticmethod
+    def cached_layout_plan(template_id: Optional[int]) -> Optional[LayoutPlan]:
+        """Return the cached plan for a template id without compiling one."""
+        if template_id is None:
+            return None
+        return _PLAN_CACHE.get(("template", template_id))
+    
+    @staticmethod
+    def warm_layout_plans(templates: Iterable[Tuple[int, Optional[Dict]]]) -> int:
+        """
+        Precompile layout plans for (template_id, settings) pairs (called at startup).
+        
+        Returns:
+            Number of cached plans
+        """
+        for template_id, template_settings in templates:
+            PDFService.get_layout_plan(template_settings, template_id=template_id)
+        return len(_PLAN_CACHE)
+    
+    @staticmethod
+    def invalidate_layout_plans() -> None:
+        """Drop compiled layout plans (call after template settings change)."""
+        _PLAN_CACHE.clear()
+    
+    @staticmethod
+    def generate_resume_pdf(
+        resume_data: Dict,
+        user_plan: PlanTier,
+        template_settings: Optional[Dict] = None,
+        layout_plan: Optional[LayoutPlan] = None
+    ) -> BytesIO:
         """
         Generate PDF resume.
         FREE tier: WITH watermark
         PRO/ULTIMATE tier: NO watermark
+        
+        Renders against a precompiled layout plan (frames, styles, section
+        order); only the flowables are built per export.
         """
+        plan = layout_plan or PDFService.get_layout_plan(template_settings)
+        styles = plan.styles
         buffer = BytesIO()
         
-        # Create PDF
-        doc = SimpleDocTemplate(
+        doc = BaseDocTemplate(
             buffer,
             pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
-        
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            textColor=colors.black,
-            spaceAfter=12,
-            alignment=TA_CENTER
-        )
-        
-        section_style = ParagraphStyle(
-            'Section',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.black,
-            spaceAfter=6,
-            spaceBefore=12
-        )
-        
-        body_style = ParagraphStyle(
-            'Body',
-            parent=styles['BodyText'],
-            fontSize=11,
-            textColor=colors.black,
-            spaceAfter=8
+            rightMargin=plan.margin,
+            leftMargin=plan.margin,
+            topMargin=plan.margin,
+            bottomMargin=plan.margin,
+            pageTemplates=plan.build_page_templates()
         )
         
-        # Build content
-        content = []
+        # Header - Name and contact
+        personal_info = resume_data.get("personal_info") or {}
+        name = personal_info.get("name", "Your Name")
+        contact_text = personal_info.get("contact") or f"{personal_info.get('email', '')} | {personal_info.get('phone', '')}"
+        header = [
+            Paragraph(name.upper(), styles["title"]),
+            Paragraph(contact_text, styles["body"]),
+            Spacer(1, 0.2*inch),
+        ]
         
-        # Header - Name
-        name = resume_data.get("personal_info", {}).get("name", "Your Name")
-        content.append(Paragraph(name.upper(), title_style))
-        
-        # Contact Info
-        email = resume_data.get("personal_info", {}).get("email", "")
-        phone = resume_data.get("personal_info", {}).get("phone", "")
-        contact_text = f"{email} | {phone}"
-        content.append(Paragraph(contact_text, body_style))
-        content.append(Spacer(1, 0.2*inch))
-        
-        # Summary (if exists)
-        summary = resume_data.get("summary", "")
-        if summary:
-            content.append(Paragraph("PROFESSIONAL SUMMARY", section_style))
-            content.append(Paragraph(summary, body_style))
-            content.append(Spacer(1, 0.1*inch))
-        
-        # Education
-        if "education" in resume_data and resume_data["education"]:
-            content.append(Paragraph("EDUCATION", section_style))
-            for edu in resume_data["education"]:
-                edu_text = f"<b>{edu.get('degree', '')}</b> - {edu.get('institution', '')}<br/>{edu.get('year', '')}"
-                content.append(Paragraph(edu_text, body_style))
-        
-        # Skills
-        if "skills" in resume_data and resume_data["skills"]:
-            content.append(Paragraph("SKILLS", section_style))
-            skills_text = ", ".join(resume_data["skills"])
-            content.append(Paragraph(skills_text, body_style))
-        
-        # Projects
-        if "projects" in resume_data and resume_data["projects"]:
-            content.append(Paragraph("PROJECTS", section_style))
-            for project in resume_data["projects"]:
-                proj_text = f"<b>{project.get('name', '')}</b><br/>{project.get('description', '')}"
-                content.append(Paragraph(proj_text, body_style))
+        # Sections in template order, routed to their column
+        columns: Dict[str, List[Flowable]] = {"header": [], "sidebar": [], "main": []}
+        for key, heading in plan.sections:
+            value = resume_data.get(key)
+            if not value:
+                continue
+            if key in plan.top_sections:
+                column = "header"
+            elif plan.sidebar and key in SIDEBAR_SECTIONS:
+                column = "sidebar"
+            else:
+                column = "main"
+            columns[column].extend(_cached_section_flowables(plan.style_key, key, heading, value, styles))
         
         # Watermark for FREE tier
         if user_plan == PlanTier.FREE:
-            content.append(Spacer(1, 0.3*inch))
-            watermark_style = ParagraphStyle(
-                'Watermark',
-                parent=styles['Normal'],
-                fontSize=10,
-                textColor=colors.grey,
-                alignment=TA_CENTER
+            columns["main"].append(Spacer(1, 0.3*inch))
+            columns["main"].append(Paragraph("Created with AI Resume Coach - Upgrade to remove watermark", styles["watermark"]))
+        
+        if plan.sidebar is None:
+            content = header + columns["header"] + columns["main"]
+        else:
+            # Header band and sidebar exist on page one only; shrink their
+            # content rather than spill into the next frame (a sidebar spilling
+            # into the main column would push all main content to page two)
+            content = (
+                [KeepInFrame(0, 0, header + columns["header"], mode="shrink")]
+                + [NextPageTemplate("later"), FrameBreak()]
+                + [KeepInFrame(0, 0, columns["sidebar"], mode="shrink"), FrameBreak()]
+                + columns["main"]
             )
-            content.append(Paragraph("Created with AI Resume Coach - Upgrade to remove watermark", watermark_style))
         
         # Build PDF
         doc.build(content)
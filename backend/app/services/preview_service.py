@@ -0,0 +1,112 @@
+"""
+Resume Preview Service
+Low-resolution page images for live editing previews.
+
+Preview renders reuse the per-section flowable cache in PDFService, so
+an edit only re-parses the sections that changed. The rendered PDF and
+rasterized pages are kept in a small in-memory LRU, so paging through a
+preview does not re-render.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+import fitz  # PyMuPDF
+from app.core.metrics import PDF_RENDER_DURATION, record_cache
+from app.models.user import PlanTier
+from app.services.pdf_service import PDFService, LayoutPlan
+
+
+PREVIEW_CACHE_SIZE = 256
+
+_preview_cache: "OrderedDict[Tuple, Tuple[bytes, int]]" = OrderedDict()
+_preview_lock = threading.Lock()
+
+
+def _cache_get(key: Tuple):
+    with _preview_lock:
+        value = _preview_cache.get(key)
+        if value is not None:
+            _preview_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: Tuple, value) -> None:
+    with _preview_lock:
+        _preview_cache[key] = value
+        while len(_preview_cache) > PREVIEW_CACHE_SIZE:
+            _preview_cache.popitem(last=False)
+
+
+class PreviewPageOutOfRange(ValueError):
+    """Requested preview page does not exist."""
+
+
+class PreviewService:
+    """Service for rendering resume preview images."""
+
+    @staticmethod
+    def preview_key(content: Dict, user_plan: PlanTier, layout_plan: LayoutPlan) -> Tuple:
+        content_hash = hashlib.sha1(
+            json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return (layout_plan.layout, layout_plan.style_key, tuple(layout_plan.sections), user_plan == PlanTier.FREE, content_hash)
+
+    @staticmethod
+    def render_pdf(content: Dict, user_plan: PlanTier, layout_plan: LayoutPlan) -> Tuple[bytes, int]:
+        """
+        Render (or reuse) the preview PDF.
+
+        Returns:
+            (pdf bytes, page count)
+        """
+        key = ("pdf",) + PreviewService.preview_key(content, user_plan, layout_plan)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        with PDF_RENDER_DURATION.time(kind="preview"):
+            pdf_bytes = PDFService.generate_resume_pdf(content, user_plan, layout_plan=layout_plan).getvalue()
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            page_count = doc.page_count
+        _cache_put(key, (pdf_bytes, page_count))
+        return pdf_bytes, page_count
+
+    @staticmethod
+    def render_page_png(
+        content: Dict,
+        user_plan: PlanTier,
+        layout_plan: LayoutPlan,
+        page: int = 1,
+        dpi: int = 60
+    ) -> Tuple[bytes, int]:
+        """
+        Rasterize one preview page.
+
+        Args:
+            page: 1-based page number
+            dpi: Output resolution (previews are deliberately low-res)
+
+        Returns:
+            (PNG bytes, page count)
+
+        Raises:
+            PreviewPageOutOfRange: page out of range
+            ValueError: content has invalid markup
+        """
+        key = ("png", page, dpi) + PreviewService.preview_key(content, user_plan, layout_plan)
+        cached = _cache_get(key)
+        record_cache("preview", cached is not None)
+        if cached is not None:
+            return cached
+
+        pdf_bytes, page_count = PreviewService.render_pdf(content, user_plan, layout_plan)
+        if page < 1 or page > page_count:
+            raise PreviewPageOutOfRange(f"Page {page} out of range (1-{page_count})")
+
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            pixmap = doc[page - 1].get_pixmap(dpi=dpi)
+            png = pixmap.tobytes("png")
+        _cache_put(key, (png, page_count))
+        return png, page_count
@@ -0,0 +1,211 @@
+"""
+PDF Render Pool - runs ReportLab exports in worker processes.
+
+Rendering is CPU-bound and holds the GIL, so exports and live previews
+run in a bounded process pool instead of the API threadpool. Workers write the PDF
+straight to a file (normally a temp file inside the PDF cache), so only
+a path crosses the process boundary. Renders that exceed
+PDF_RENDER_TIMEOUT_SECONDS are abandoned: new renders go to a fresh pool,
+and the old one is terminated (killing the stuck worker) once every
+render it was given has finished or timed out.
+ReportLab is only imported inside the workers (or on first in-process render).
+"""
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.metrics import PDF_RENDER_DURATION
+from app.models.user import PlanTier
+from app.services.template_data import RESUME_TEMPLATES
+
+
+logger = logging.getLogger(__name__)
+
+
+class RenderPoolBusy(Exception):
+    """Too many renders queued, or the pool was recycled mid-render."""
+
+
+class RenderTimeout(Exception):
+    """A render did not finish within the timeout."""
+
+
+def _init_worker(templates: Iterable[Dict]) -> None:
+    """Precompile styles once per worker process."""
+    from app.services.pdf_service import PDFService
+    PDFService.warm_style_cache(templates)
+
+
+def render_to_file(resume_data: Dict, user_plan: str, template_settings: Optional[Dict], out_path: str) -> int:
+    """
+    Render a resume PDF into out_path (runs inside a worker process).
+
+    Returns:
+        Size of the written PDF in bytes
+    """
+    from app.services.pdf_service import PDFService
+
+    buffer = PDFService.generate_resume_pdf(resume_data, PlanTier(user_plan), template_settings)
+    with open(out_path, "wb") as f:
+        f.write(buffer.getbuffer())
+    return buffer.getbuffer().nbytes
+
+
+def render_preview_png(
+    resume_data: Dict,
+    user_plan: str,
+    template_settings: Optional[Dict],
+    page: int,
+    dpi: int
+) -> Tuple[bytes, int]:
+    """
+    Rasterize one preview page (runs inside a worker process).
+
+    Returns:
+        (PNG bytes, page count)
+    """
+    from app.services.pdf_service import PDFService
+    from app.services.preview_service import PreviewService
+
+    layout_plan = PDFService.get_layout_plan(template_settings)
+    return PreviewService.render_page_png(resume_data, PlanTier(user_plan), layout_plan, page=page, dpi=dpi)
+
+
+class RenderPool:
+    """
+    Bounded process pool for PDF exports.
+
+    workers=0 renders in the threadpool (tests and development only): a
+    thread cannot be stopped, so a timed-out render keeps its thread busy
+    until it finishes on its own.
+    """
+
+    def __init__(self, workers: int, queue_limit: int, timeout: float):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._retired: List[ProcessPoolExecutor] = []  # Replaced after a timeout, not yet terminated
+        self._pending = 0
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # Spawn, not fork: the API process has running threads
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(RESUME_TEMPLATES,)
+            )
+        return self._pool
+
+    async def render(
+        self,
+        resume_data: Dict,
+        user_plan: PlanTier,
+        template_settings: Optional[Dict],
+        out_path: str
+    ) -> int:
+        """
+        Render a resume PDF into out_path.
+
+        Raises:
+            RenderPoolBusy: queue full or pool recycled
+            RenderTimeout: render exceeded the timeout
+        """
+        job = partial(render_to_file, resume_data, PlanTier(user_plan).value, template_settings, out_path)
+        return await self._run(job, kind="export")
+
+    async def render_preview(
+        self,
+        resume_data: Dict,
+        user_plan: PlanTier,
+        template_settings: Optional[Dict],
+        page: int,
+        dpi: int
+    ) -> Tuple[bytes, int]:
+        """
+        Rasterize one preview page (render time is recorded by PreviewService).
+
+        Returns:
+            (PNG bytes, page count)
+
+        Raises:
+            RenderPoolBusy: queue full or pool recycled
+            RenderTimeout: render exceeded the timeout
+            PreviewPageOutOfRange: page out of range
+            ValueError: content has invalid markup
+        """
+        job = partial(render_preview_png, resume_data, PlanTier(user_plan).value, template_settings, page, dpi)
+        return await self._run(job)
+
+    async def _run(self, job: Callable, kind: Optional[str] = None):
+        if self._pending >= self.queue_limit:
+            raise RenderPoolBusy("Too many PDF renders in progress")
+
+        self._pending += 1
+        try:
+            with PDF_RENDER_DURATION.time(kind=kind) if kind else contextlib.nullcontext():
+                if self.workers <= 0:
+                    return await asyncio.wait_for(run_in_threadpool(job), self.timeout)
+                loop = asyncio.get_running_loop()
+                pool = self._executor()
+                try:
+                    return await asyncio.wait_for(loop.run_in_executor(pool, job), self.timeout)
+                except asyncio.TimeoutError:
+                    if pool is self._pool:
+                        logger.error(f"PDF render timed out after {self.timeout}s, replacing render pool")
+                        self._pool = None
+                        # Renders already in the old pool get their full timeout
+                        self._retired.append(pool)
+                        loop.call_later(self.timeout, self._terminate, pool)
+                    raise
+                except BrokenProcessPool:
+                    if pool is self._pool:
+                        self._pool = None
+                        self._retired.append(pool)
+                        self._terminate(pool)
+                    raise
+        except asyncio.TimeoutError:
+            raise RenderTimeout("PDF rendering timed out")
+        except BrokenProcessPool:
+            raise RenderPoolBusy("PDF render pool restarted")
+        finally:
+            self._pending -= 1
+
+    def _terminate(self, pool: ProcessPoolExecutor) -> None:
+        """Kill a retired pool's workers (a stuck render cannot be cancelled)."""
+        if pool not in self._retired:
+            return
+        self._retired.remove(pool)
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        for retired in list(self._retired):
+            self._terminate(retired)
+
+
+_render_pool: Optional[RenderPool] = None
+
+
+def get_render_pool() -> RenderPool:
+    """Get the process-wide render pool."""
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = RenderPool(
+            workers=settings.PDF_RENDER_WORKERS,
+            queue_limit=settings.PDF_RENDER_QUEUE_LIMIT,
+            timeout=settings.PDF_RENDER_TIMEOUT_SECONDS
+        )
+    return _render_pool
@@ -3,7 +3,10 @@ Resume Analyzer Service - AI-powered resume analysis and enhancement suggestions
 """
 from typing import Dict, List, Tuple
 from app.services.ai_service import AIService, SYSTEM_PROMPT
+from app.services.skill_extraction_service import SkillExtractionService
+from app.services.writing_rules import PASSIVE_INDICATORS
 from app.core.security import sanitize_input
+from app.core.tracing import span
 
 
 class ResumeAnalyzerService:
@@ -73,8 +76,7 @@ class ResumeAnalyzerService:
         
         # Check for passive voice (basic check)
         text_lower = (parsed_data.get("experience", "") + parsed_data.get("projects", "")).lower()
-        passive_indicators = ["was", "were", "been", "being"]
-        passive_count = sum(text_lower.count(word) for word in passive_indicators)
+        passive_count = sum(text_lower.count(word) for word in PASSIVE_INDICATORS)
         
         if passive_count > 5:
             score -= 10
@@ -160,6 +162,25 @@ class ResumeAnalyzerService:
                 "accepted": False
             })
         
+        # Check for skills used elsewhere but missing from the skills list
+        if skills_text:
+            unlisted = [
+                skill["name"] for skill in SkillExtractionService.extract_from_resume(parsed_data)
+                if "skills" not in skill["sections"] and skill["category"] != "Soft Skills"
+            ]
+            if unlisted:
+                score -= 5
+                suggestions.append({
+                    "category": "ats_optimization",
+                    "section": "skills",
+                    "severity": "low",
+                    "issue": "Skills used in your experience are not listed",
+                    "suggestion": f"Add {', '.join(unlisted[:5])} to your Skills section so ATS keyword filters find them",
+                    "original_text": "",
+                    "enhanced_text": ", ".join(unlisted),
+                    "accepted": False
+                })
+        
         # Check for common ATS-friendly keywords for freshers
         fresher_keywords = ["internship", "project", "coursework", "certification", "training"]
         full_text = " ".join(parsed_data.values()).lower()
@@ -422,22 +443,55 @@ Provide ONLY the improved text, nothing else."""
         Returns:
             Complete analysis results
         """
-        # Analyze each category
-        content_score, content_suggestions = ResumeAnalyzerService.analyze_content_quality(
-            parsed_data, metrics
-        )
+        results = ResumeAnalyzerService.analyze_rules(parsed_data, metrics)
         
-        ats_score, ats_suggestions = ResumeAnalyzerService.analyze_ats_optimization(
-            parsed_data, metrics
-        )
-        
-        structure_score, structure_suggestions = ResumeAnalyzerService.analyze_structure(
-            parsed_data, metrics
-        )
+        # Generate AI enhancements for top suggestions
+        with span("analyzer.ai_enhancements", tier=getattr(user_tier, "value", user_tier)):
+            enhanced_suggestions = await ResumeAnalyzerService.generate_ai_enhancements(
+                results["suggestions"],
+                parsed_data,
+                user_tier
+            )
+        
+        results.update({
+            "suggestions": enhanced_suggestions,
+            "total_suggestions": len(enhanced_suggestions),
+            "critical_issues": len([s for s in enhanced_suggestions if s["severity"] == "critical"])
+        })
+        return results
+    
+    @staticmethod
+    def analyze_rules(parsed_data: Dict, metrics: Dict) -> Dict:
+        """
+        Run the rule-based analyzers and scoring only (no AI calls, blocking).
         
-        fresher_score, fresher_suggestions = ResumeAnalyzerService.analyze_fresher_specific(
-            parsed_data, metrics
-        )
+        Args:
+            parsed_data: Parsed resume structure
+            metrics: Extracted metrics
+            
+        Returns:
+            Analysis results without AI enhancements
+        """
+        # Analyze each category
+        with span("analyzer.content_quality"):
+            content_score, content_suggestions = ResumeAnalyzerService.analyze_content_quality(
+                parsed_data, metrics
+            )
+        
+        with span("analyzer.ats_optimization"):
+            ats_score, ats_suggestions = ResumeAnalyzerService.analyze_ats_optimization(
+                parsed_data, metrics
+            )
+        
+        with span("analyzer.structure"):
+            structure_score, structure_suggestions = ResumeAnalyzerService.analyze_structure(
+                parsed_data, metrics
+            )
+        
+        with span("analyzer.fresher_specific"):
+            fresher_score, fresher_suggestions = ResumeAnalyzerService.analyze_fresher_specific(
+                parsed_data, metrics
+            )
         
         # Calculate overall score
         category_scores = {
@@ -461,18 +515,11 @@ Provide ONLY the improved text, nothing else."""
         severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
         all_suggestions.sort(key=lambda x: severity_order.get(x["severity"], 4))
         
-        # Generate AI enhancements for top suggestions
-        enhanced_suggestions = await ResumeAnalyzerService.generate_ai_enhancements(
-            all_suggestions,
-            parsed_data,
-            user_tier
-        )
-        
         return {
             "overall_score": overall_score,
             "category_scores": category_scores,
-            "suggestions": enhanced_suggestions,
-            "total_suggestions": len(enhanced_suggestions),
-            "critical_issues": len([s for s in enhanced_suggestions if s["severity"] == "critical"]),
+            "suggestions": all_suggestions,
+            "total_suggestions": len(all_suggestions),
+            "critical_issues": len([s for s in all_suggestions if s["severity"] == "critical"]),
             "metrics": metrics
         }
@@ -0,0 +1,150 @@
+"""
+Resume Lint Service - instant, rule-based checks for live editing.
+
+Runs the deterministic checks of ResumeAnalyzerService (weak verbs,
+passive voice, missing metrics, length) on a single bullet or section,
+without AI calls or quota use. The word lists are shared with the
+analyzer (app/services/writing_rules.py) and compiled into regular
+expressions or sets at import, so linting a section is a handful of
+regex scans and takes well under a millisecond.
+
+Issues carry character offsets into the submitted text so the editor
+can underline them, and weak phrases come with stronger replacements.
+"""
+import re
+from typing import Dict, List, Optional
+from app.services.writing_rules import PASSIVE_PATTERN, STRONG_ACTION_VERBS, WEAK_VERB_PATTERN, WEAK_VERBS
+
+
+# Bullets in these sections should start with an action verb and show impact
+IMPACT_SECTIONS = {"experience", "projects"}
+
+METRIC_PATTERN = re.compile(r"\d")
+BULLET_PATTERN = re.compile(r"[^\n]+")
+BULLET_MARKERS = " \t\r•▪●◦‣*-–>"
+FIRST_WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z\-]*")
+
+MAX_BULLET_WORDS = 30
+MIN_METRIC_BULLET_WORDS = 6  # Shorter lines are usually titles or dates
+MAX_SUMMARY_WORDS = 60
+
+
+def _issue(rule: str, severity: str, issue: str, suggestion: str, start: int, end: int,
+           text: str, replacements: Optional[List[str]] = None) -> Dict:
+    return {
+        "rule": rule,
+        "severity": severity,
+        "issue": issue,
+        "suggestion": suggestion,
+        "start": start,
+        "end": end,
+        "original_text": text[start:end],
+        "replacements": replacements or [],
+    }
+
+
+class ResumeLintService:
+    """Service for linting resume bullets and sections as they are typed."""
+
+    @staticmethod
+    def lint_bullet(text: str, start: int, end: int, section: str) -> List[Dict]:
+        """
+        Lint one bullet (a line of text[start:end]).
+
+        Returns:
+            Issues with offsets into text
+        """
+        issues = []
+        bullet = text[start:end]
+        word_count = len(bullet.split())
+
+        weak_spans = []
+        for match in WEAK_VERB_PATTERN.finditer(bullet):
+            phrase = " ".join(match.group().lower().split())
+            weak_spans.append(match.start())
+            issues.append(_issue(
+                "weak_verb", "medium",
+                f"Weak phrase '{match.group()}'",
+                "Use a strong action verb that shows what you achieved",
+                start + match.start(), start + match.end(), text, WEAK_VERBS[phrase]
+            ))
+
+        for match in PASSIVE_PATTERN.finditer(bullet):
+            issues.append(_issue(
+                "passive_voice", "medium",
+                "Passive voice",
+                "Rewrite in active voice, starting with what you did",
+                start + match.start(), start + match.end(), text
+            ))
+
+        if section in IMPACT_SECTIONS:
+            first_word = FIRST_WORD_PATTERN.match(bullet)
+            if (
+                first_word and word_count >= MIN_METRIC_BULLET_WORDS
+                and first_word.group().lower() not in STRONG_ACTION_VERBS and 0 not in weak_spans
+            ):
+                issues.append(_issue(
+                    "no_action_verb", "low",
+                    "Bullet does not start with an action verb",
+                    "Start with a verb like 'Developed', 'Improved' or 'Led'",
+                    start + first_word.start(), start + first_word.end(), text,
+                    ["Developed", "Improved", "Led"]
+                ))
+
+            if word_count >= MIN_METRIC_BULLET_WORDS and not METRIC_PATTERN.search(bullet):
+                issues.append(_issue(
+                    "missing_metric", "medium",
+                    "No measurable result",
+                    "Add a number that shows impact (users, %, time or cost saved)",
+                    start, end, text
+                ))
+
+        if section != "summary" and word_count > MAX_BULLET_WORDS:  # The summary is prose, checked as a whole
+            issues.append(_issue(
+                "too_long", "low",
+                f"Bullet is long ({word_count} words)",
+                f"Keep bullets under {MAX_BULLET_WORDS} words; split or trim this one",
+                start, end, text
+            ))
+
+        return issues
+
+    @staticmethod
+    def lint(text: str, section: str = "experience") -> Dict:
+        """
+        Lint a single bullet or a whole section.
+
+        Args:
+            text: Bullet or section text (one bullet per line)
+            section: Resume section the text belongs to
+
+        Returns:
+            Issues (sorted by position) and word/bullet counts
+        """
+        issues = []
+        bullets = 0
+        for line in BULLET_PATTERN.finditer(text):
+            content = line.group().lstrip(BULLET_MARKERS)
+            start = line.end() - len(content)
+            end = start + len(content.rstrip())
+            if start >= end:
+                continue
+            bullets += 1
+            issues.extend(ResumeLintService.lint_bullet(text, start, end, section))
+
+        word_count = len(text.split())
+        if section == "summary" and word_count > MAX_SUMMARY_WORDS:
+            issues.append(_issue(
+                "too_long", "medium",
+                f"Summary is long ({word_count} words)",
+                "Keep your summary to 2-3 sentences",
+                0, len(text.rstrip()), text
+            ))
+
+        issues.sort(key=lambda issue: (issue["start"], issue["end"]))
+        return {
+            "section": section,
+            "word_count": word_count,
+            "bullets": bullets,
+            "issues": issues,
+        }
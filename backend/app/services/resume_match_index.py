@@ -0,0 +1,178 @@
+"""
+Resume Match Index - rank a user's stored analyses against a job description.
+
+Each user's analyses form a sparse document-term matrix: one row per
+resume (its JDMatchService.vectorize_resume BM25 vector), stored both
+row-wise and column-wise (term -> {analysis id: coverage}). Ranking is a
+single sparse matrix-vector product with the job description vector
+followed by a heap for the top k.
+
+Indexes are cached per user and kept up to date incrementally: each
+ranking runs one id-only query, appends rows for new analyses and drops
+deleted ones, so the matrix is never rebuilt from scratch.
+"""
+import heapq
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.models.resume_analysis import ResumeAnalysis, load_parsed_content
+from app.services.jd_match_service import JDMatchService, SparseVector, get_jd_vocabulary
+
+
+LOAD_BATCH_SIZE = 200
+
+
+class ResumeMatchIndex:
+    """Sparse document-term matrix over one user's active analyses."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.rows: Dict[int, SparseVector] = {}  # analysis id -> {term id: coverage}
+        self.columns: Dict[int, Dict[int, float]] = {}  # term id -> {analysis id: coverage}
+        self.details: Dict[int, Tuple[str, float]] = {}  # analysis id -> (filename, overall score)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, analysis_id: int, filename: str, overall_score: float, parsed_data: Dict) -> None:
+        """Add (or replace) one resume row."""
+        if analysis_id in self.rows:
+            self.remove(analysis_id)
+        row = JDMatchService.vectorize_resume(parsed_data)
+        self.rows[analysis_id] = row
+        self.details[analysis_id] = (filename, overall_score or 0.0)
+        for term_id, coverage in row.items():
+            self.columns.setdefault(term_id, {})[analysis_id] = coverage
+
+    def remove(self, analysis_id: int) -> None:
+        """Drop one resume row."""
+        row = self.rows.pop(analysis_id, None)
+        self.details.pop(analysis_id, None)
+        for term_id in row or ():
+            column = self.columns[term_id]
+            column.pop(analysis_id, None)
+            if not column:
+                del self.columns[term_id]
+
+    def sync(self, db: Session) -> Tuple[int, int]:
+        """
+        Bring the matrix up to date with the user's active analyses.
+
+        Returns:
+            (rows added, rows removed)
+        """
+        active_ids = {
+            analysis_id for (analysis_id,) in db.query(ResumeAnalysis.id).filter(
+                ResumeAnalysis.user_id == self.user_id,
+                ResumeAnalysis.is_active == 1
+            )
+        }
+        removed = [analysis_id for analysis_id in self.rows if analysis_id not in active_ids]
+        for analysis_id in removed:
+            self.remove(analysis_id)
+
+        new_ids = sorted(active_ids - self.rows.keys())
+        for start in range(0, len(new_ids), LOAD_BATCH_SIZE):
+            # Plain column rows, so payloads never stay in the session
+            batch = db.query(
+                ResumeAnalysis.id,
+                ResumeAnalysis.original_filename,
+                ResumeAnalysis.overall_score,
+                ResumeAnalysis.extracted_text,
+                ResumeAnalysis._parsed_content
+            ).filter(
+                ResumeAnalysis.id.in_(new_ids[start:start + LOAD_BATCH_SIZE])
+            ).all()
+            for analysis_id, filename, overall_score, text, stored in batch:
+                parsed = load_parsed_content(text, stored) or {"unclassified": text or ""}
+                self.add(analysis_id, filename, overall_score, parsed)
+
+        return len(new_ids), len(removed)
+
+    def rank(self, job_vector: SparseVector, top_k: int) -> List[Tuple[int, float]]:
+        """
+        Top resumes for a job description vector.
+
+        Returns:
+            [(analysis id, match score 0-100)], best first; resumes sharing
+            no keyword with the job description are left out
+        """
+        total = sum(job_vector.values())
+        if not total:
+            return []
+
+        # Sparse matrix-vector product, column by column
+        scores: Dict[int, float] = {}
+        for term_id, weight in job_vector.items():
+            for analysis_id, coverage in self.columns.get(term_id, {}).items():
+                scores[analysis_id] = scores.get(analysis_id, 0.0) + weight * coverage
+
+        top = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(analysis_id, round(100 * score / total, 1)) for analysis_id, score in top]
+
+    def rank_resumes(self, db: Session, job_description: str, top_k: int) -> Dict:
+        """
+        Sync with the database and rank the user's resumes.
+
+        Returns:
+            Ranked results with filenames, scores and matched keywords
+        """
+        vocabulary = get_jd_vocabulary()
+        job_vector = JDMatchService.vectorize_job_description(job_description)
+        with self._lock:
+            self.sync(db)
+            ranked = self.rank(job_vector, top_k)
+            indexed = len(self.rows)
+            results = []
+            for analysis_id, match_score in ranked:
+                row = self.rows[analysis_id]
+                filename, overall_score = self.details[analysis_id]
+                matched = sorted(
+                    (term_id for term_id in job_vector if term_id in row),
+                    key=lambda term_id: (-job_vector[term_id], term_id)
+                )
+                results.append({
+                    "analysis_id": analysis_id,
+                    "filename": filename,
+                    "match_score": match_score,
+                    "overall_score": overall_score,
+                    "matched_keywords": [vocabulary.terms[term_id] for term_id in matched],
+                })
+
+        return {
+            "job_keywords": len(job_vector),
+            "resumes_indexed": indexed,
+            "results": results,
+        }
+
+
+_indexes: "OrderedDict[int, ResumeMatchIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_resume_match_index(user_id: int) -> ResumeMatchIndex:
+    """Get the cached index for a user (least recently used indexes are evicted)."""
+    with _indexes_lock:
+        index = _indexes.get(user_id)
+        record_cache("resume_match_index", index is not None)
+        if index is None:
+            index = ResumeMatchIndex(user_id)
+            _indexes[user_id] = index
+            while len(_indexes) > max(1, settings.RESUME_MATCH_INDEX_USERS):
+                _indexes.popitem(last=False)
+        else:
+            _indexes.move_to_end(user_id)
+        return index
+
+
+def clear_resume_match_indexes(user_id: Optional[int] = None) -> None:
+    """Drop one user's cached index, or all of them."""
+    with _indexes_lock:
+        if user_id is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(user_id, None)
@@ -0,0 +1,203 @@
+"""
+Skill Extraction - find and normalize skills with the bundled taxonomy.
+
+Every spelling in skills_taxonomy.py is compiled into one word-level
+trie. Text is tokenized once and scanned left to right; at each word the
+trie is walked as far as the text allows and the longest spelling wins
+("react native" over "react"). The walk is bounded by the longest
+spelling (a few words), so extraction is a single linear pass however
+large the taxonomy grows.
+
+Matches are reported as canonical names ("JS", "javascript" and "ES6"
+all become "JavaScript"), which feed the analyzer and the skills list
+stored on analyzer-generated resumes. Job description matching uses the
+same trie and tokenizer, extended with its non-skill keywords.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+from app.services.skills_taxonomy import SKILLS_TAXONOMY, SKILLS_SECTION_ONLY
+
+
+TOKEN_PATTERN = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:[./'\-][a-z0-9+#]+)*")
+SPLIT_PATTERN = re.compile(r"[./'\-]")
+
+# Separators between items of a skills list ("Python, SQL | Git • Docker")
+ITEM_SEPARATORS = re.compile(r"[,;|•·▪●\n\t]+")
+ITEM_BULLETS = " -*–>•"
+MAX_UNRECOGNISED_ITEM_LENGTH = 40
+
+# Sections whose text never holds skills
+SKIPPED_SECTIONS = {"contact", "personal_info"}
+
+_TERMINAL = ""  # Trie key holding (skill id, skills section only); never a word
+
+
+class SkillTrie:
+    """Word-level trie over every taxonomy spelling."""
+
+    def __init__(self, extra_terms: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        """
+        Args:
+            extra_terms: More terms in the shape of SKILLS_TAXONOMY
+                ({category: {name: aliases}}); their ids follow the
+                taxonomy's, and no spelling may belong to two terms
+        """
+        self.names: List[str] = []
+        self.categories: List[str] = []
+        self.root: Dict = {}
+        self.known_words = set()
+        for category, skills in list(SKILLS_TAXONOMY.items()) + list((extra_terms or {}).items()):
+            for name, aliases in skills.items():
+                skill_id = len(self.names)
+                self.names.append(name)
+                self.categories.append(category)
+                for spelling in [name.lower()] + aliases:
+                    self._insert(spelling, skill_id)
+
+    def _insert(self, spelling: str, skill_id: int) -> None:
+        node = self.root
+        for word in spelling.split():
+            node = node.setdefault(word, {})
+            self.known_words.add(word)
+        existing = node.get(_TERMINAL)
+        if existing is not None and existing[0] != skill_id:
+            raise ValueError(
+                f"'{spelling}' is both {self.names[existing[0]]} and {self.names[skill_id]}"
+            )
+        node[_TERMINAL] = (skill_id, spelling in SKILLS_SECTION_ONLY)
+
+    def _words(self, text: str) -> List[str]:
+        words = []
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            if token.isalnum() or token in self.known_words:
+                parts = [token]  # Plain word or known compound token (node.js, c++)
+            else:
+                # Split the rest (python/django) and drop a leading dot
+                parts = [part for part in SPLIT_PATTERN.split(token) if part]
+            for word in parts:
+                if len(word) > 3 and word not in self.known_words and word.endswith("s") and word[:-1] in self.known_words:
+                    word = word[:-1]  # apis -> api
+                words.append(word)
+        return words
+
+    def find(self, text: str, skills_section: bool = False) -> List[int]:
+        """
+        Skill ids mentioned in text, in order (repeats kept).
+
+        Args:
+            text: Any resume or job text
+            skills_section: Whether text is a list of skills, which also
+                enables spellings in SKILLS_SECTION_ONLY
+        """
+        root = self.root
+        words = self._words(text)
+        found = []
+        i = 0
+        while i < len(words):
+            if words[i] not in root:
+                i += 1  # Most words start no spelling
+                continue
+            node = root
+            match: Optional[Tuple[int, int]] = None  # (skill id, end)
+            j = i
+            while j < len(words) and words[j] in node:
+                node = node[words[j]]
+                j += 1
+                terminal = node.get(_TERMINAL)
+                if terminal is not None and (skills_section or not terminal[1]):
+                    match = (terminal[0], j)
+            if match:
+                found.append(match[0])
+                i = match[1]
+            else:
+                i += 1
+        return found
+
+
+_skill_trie: Optional[SkillTrie] = None
+
+
+def get_skill_trie() -> SkillTrie:
+    """Get the process-wide skill trie (compiled on first use)."""
+    global _skill_trie
+    if _skill_trie is None:
+        _skill_trie = SkillTrie()
+    return _skill_trie
+
+
+class SkillExtractionService:
+    """Service for extracting and normalizing resume skills."""
+
+    @staticmethod
+    def extract_skills(text: str, skills_section: bool = False) -> List[str]:
+        """
+        Canonical names of the skills mentioned in text.
+
+        Args:
+            text: Any resume or job text
+            skills_section: Whether text is a list of skills
+
+        Returns:
+            Canonical skill names in order of first mention
+        """
+        trie = get_skill_trie()
+        ids = dict.fromkeys(trie.find(text, skills_section=skills_section))
+        return [trie.names[skill_id] for skill_id in ids]
+
+    @staticmethod
+    def extract_from_resume(parsed_data: Dict) -> List[Dict]:
+        """
+        Skills mentioned anywhere in a parsed resume.
+
+        Args:
+            parsed_data: Parsed resume structure (section -> text)
+
+        Returns:
+            [{name, category, sections}] with skills-section entries first,
+            then in order of first mention
+        """
+        trie = get_skill_trie()
+        found: Dict[int, List[str]] = {}
+        sections = sorted(parsed_data, key=lambda section: section != "skills")
+        for section in sections:
+            text = parsed_data[section]
+            if section in SKIPPED_SECTIONS or not isinstance(text, str):
+                continue
+            for skill_id in trie.find(text, skills_section=section == "skills"):
+                mentioned_in = found.setdefault(skill_id, [])
+                if section not in mentioned_in:
+                    mentioned_in.append(section)
+
+        return [
+            {"name": trie.names[skill_id], "category": trie.categories[skill_id], "sections": mentioned_in}
+            for skill_id, mentioned_in in found.items()
+        ]
+
+    @staticmethod
+    def normalize_skills(skills_text: str) -> List[str]:
+        """
+        Turn a free-text skills section into a clean list of skills.
+
+        Recognised skills become their canonical names; list items the
+        taxonomy does not know are kept as written (labels such as
+        "Languages:" removed), so nothing the candidate listed is lost.
+
+        Args:
+            skills_text: Skills section text
+
+        Returns:
+            Skill names without duplicates, in the order listed
+        """
+        trie = get_skill_trie()
+        skills: Dict[str, str] = {}  # lowercase -> as shown
+        for item in ITEM_SEPARATORS.split(skills_text or ""):
+            item = item.rsplit(":", 1)[-1].strip(ITEM_BULLETS + "\r")
+            if not item:
+                continue
+            ids = trie.find(item, skills_section=True)
+            names = [trie.names[skill_id] for skill_id in ids]
+            if not names and len(item) <= MAX_UNRECOGNISED_ITEM_LENGTH:
+                names = [item]
+            for name in names:
+                skills.setdefault(name.lower(), name)
+        return list(skills.values())
@@ -0,0 +1,197 @@
+"""
+Skill Suggest Index - typeahead over the skills taxonomy.
+
+Every spelling of every skill (canonical name, aliases, and each word
+of the canonical name onwards, so "learning" finds "Machine Learning")
+is kept in one sorted array. A query is two binary searches for the
+range of keys starting with it; the matching skills are ranked by how
+many stored resumes list them.
+
+Suggestions are served from an immutable in-process snapshot and never
+touch the database. Counting means decoding every stored resume, so it
+is done offline by count_skill_popularity.py (e.g. hourly from cron),
+which stores the counts in the skill_popularity table. Each API worker
+only reloads that small table every SKILL_POPULARITY_REFRESH_SECONDS and
+swaps in a new snapshot; until counts exist, skills rank by taxonomy
+order.
+"""
+import asyncio
+import bisect
+import heapq
+import logging
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.resume import Resume
+from app.models.skill_popularity import SkillPopularity
+from app.services.skill_extraction_service import get_skill_trie
+from app.services.skills_taxonomy import SKILLS_TAXONOMY
+
+
+logger = logging.getLogger(__name__)
+
+LOAD_BATCH_SIZE = 500
+
+
+class SkillSuggestIndex:
+    """Sorted prefix array over taxonomy spellings, ranked by popularity."""
+
+    def __init__(self, popularity: Optional[Dict[int, int]] = None):
+        trie = get_skill_trie()
+        self.names = trie.names
+        self.categories = trie.categories
+        self.popularity: Dict[int, int] = popularity or {}
+        skill_ids = {name: skill_id for skill_id, name in enumerate(trie.names)}
+
+        entries = set()
+        for skills in SKILLS_TAXONOMY.values():
+            for name, aliases in skills.items():
+                skill_id = skill_ids[name]
+                words = name.lower().split()
+                for start in range(len(words)):
+                    entries.add((" ".join(words[start:]), skill_id))
+                for alias in aliases:
+                    entries.add((alias, skill_id))
+
+        ordered = sorted(entries)
+        self.keys: List[str] = [key for key, _ in ordered]
+        self.key_skills: List[int] = [skill_id for _, skill_id in ordered]
+        # Most used first, then shorter names ("Java" before "JavaScript" at equal use)
+        self._rank = [
+            (-self.popularity.get(skill_id, 0), len(name), skill_id)
+            for skill_id, name in enumerate(self.names)
+        ]
+
+    def suggest(self, query: str, limit: int) -> List[Dict]:
+        """
+        Skills with a spelling starting with query.
+
+        Args:
+            query: What the user has typed so far (case-insensitive)
+            limit: Maximum number of suggestions
+
+        Returns:
+            [{name, category}], exact spellings first, then most popular
+        """
+        prefix = " ".join(query.lower().split())
+        if not prefix:
+            return []
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, prefix + "\uffff", start)
+
+        exact = set()
+        candidates = set()
+        for position in range(start, end):
+            skill_id = self.key_skills[position]
+            candidates.add(skill_id)
+            if self.keys[position] == prefix:
+                exact.add(skill_id)
+
+        best = heapq.nsmallest(
+            limit, candidates, key=lambda skill_id: (skill_id not in exact, self._rank[skill_id])
+        )
+        return [{"name": self.names[skill_id], "category": self.categories[skill_id]} for skill_id in best]
+
+
+def count_skill_popularity(db: Session) -> Dict[int, int]:
+    """
+    Number of active resumes listing each taxonomy skill.
+
+    Returns:
+        {skill id: resume count}
+    """
+    trie = get_skill_trie()
+    counts: Counter = Counter()
+    rows = db.query(Resume.content).filter(Resume.is_active == 1).yield_per(LOAD_BATCH_SIZE)
+    for (content,) in rows:
+        skills = (content or {}).get("skills") or []
+        if isinstance(skills, str):
+            skills = [skills]
+        listed = set()
+        for skill in skills:
+            if isinstance(skill, str):
+                listed.update(trie.find(skill, skills_section=True))
+        counts.update(listed)
+    return dict(counts)
+
+
+def store_skill_popularity(db: Session) -> int:
+    """
+    Recount popularity from stored resumes and replace the stored counts.
+
+    Returns:
+        Total skill listings counted
+    """
+    names = get_skill_trie().names
+    counts = count_skill_popularity(db)
+    db.query(SkillPopularity).delete()
+    db.add_all(
+        SkillPopularity(skill=names[skill_id], resume_count=count)
+        for skill_id, count in counts.items()
+    )
+    db.commit()
+    return sum(counts.values())
+
+
+def load_skill_popularity(db: Session) -> Dict[int, int]:
+    """
+    Stored popularity counts (skills no longer in the taxonomy are skipped).
+
+    Returns:
+        {skill id: resume count}
+    """
+    skill_ids = {name: skill_id for skill_id, name in enumerate(get_skill_trie().names)}
+    return {
+        skill_ids[skill]: count
+        for skill, count in db.query(SkillPopularity.skill, SkillPopularity.resume_count)
+        if skill in skill_ids
+    }
+
+
+_skill_suggest_index: Optional[SkillSuggestIndex] = None
+_skill_suggest_index_lock = threading.Lock()
+
+
+def get_skill_suggest_index() -> SkillSuggestIndex:
+    """Get the current snapshot (taxonomy order until popularity is loaded)."""
+    global _skill_suggest_index
+    if _skill_suggest_index is None:
+        with _skill_suggest_index_lock:
+            # Must not replace a snapshot the refresher swapped in meanwhile
+            if _skill_suggest_index is None:
+                _skill_suggest_index = SkillSuggestIndex()
+    return _skill_suggest_index
+
+
+def refresh_skill_suggest_index() -> SkillSuggestIndex:
+    """Reload the stored popularity counts and swap in a new snapshot."""
+    global _skill_suggest_index
+    db = SessionLocal()
+    try:
+        index = SkillSuggestIndex(load_skill_popularity(db))
+    finally:
+        db.close()
+    with _skill_suggest_index_lock:
+        _skill_suggest_index = index
+    return index
+
+
+async def run_skill_popularity_refresher() -> None:
+    """
+    Background task: load the stored skill popularity at startup, then
+    reload it every SKILL_POPULARITY_REFRESH_SECONDS.
+    """
+    interval = settings.SKILL_POPULARITY_REFRESH_SECONDS
+    while True:
+        try:
+            index = await run_in_threadpool(refresh_skill_suggest_index)
+            logger.info(f"Skill popularity loaded ({sum(index.popularity.values())} listings)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Skill popularity refresh failed: {str(e)}")
+        await asyncio.sleep(interval)
@@ -0,0 +1,185 @@
+"""
+Skills Taxonomy
+Canonical skill names, the spellings that refer to them and their categories.
+Skill extraction and job description matching (jd_vocabulary.py adds the
+non-skill keywords) both read skills from here.
+
+Each category maps a canonical name (as shown on resumes) to its aliases.
+The canonical name itself is always recognised, case-insensitively, so
+aliases only list other spellings and abbreviations. Spellings in
+SKILLS_SECTION_ONLY are ordinary words elsewhere ("go", "excel at") and
+are only recognised inside a resume's skills section.
+"""
+
+SKILLS_TAXONOMY = {
+    "Programming Languages": {
+        "Python": ["python3", "python 3"],
+        "Java": ["core java", "java 8", "java 17"],
+        "JavaScript": ["js", "es6", "ecmascript", "vanilla js", "vanilla javascript"],
+        "TypeScript": ["ts"],
+        "C": ["c language", "c programming"],
+        "C++": ["cpp", "c plus plus"],
+        "C#": ["c sharp", "csharp"],
+        "Go": ["golang", "go-lang"],
+        "Rust": ["rust lang"],
+        "Kotlin": [],
+        "Swift": ["swift ui", "swiftui"],
+        "Dart": [],
+        "Scala": [],
+        "Ruby": [],
+        "PHP": ["php7", "php 8"],
+        "R": ["r programming", "r language", "rstudio"],
+        "MATLAB": [],
+        "SQL": ["structured query language", "pl/sql", "plsql", "t-sql", "tsql"],
+        "Bash": ["shell scripting", "shell script", "bash scripting"],
+        "PowerShell": [],
+        "HTML": ["html5"],
+        "CSS": ["css3"],
+        "Sass": ["scss"],
+        "Assembly": ["assembly language", "x86 assembly"],
+        "Solidity": [],
+    },
+    "Web Development": {
+        "React": ["react.js", "reactjs", "react js"],
+        "Angular": ["angular.js", "angularjs", "angular js"],
+        "Vue.js": ["vue", "vuejs", "vue js"],
+        "Next.js": ["nextjs", "next js"],
+        "Node.js": ["node", "nodejs", "node js"],
+        "Express.js": ["express", "expressjs", "express js"],
+        "Django": ["django rest framework", "drf"],
+        "Flask": [],
+        "FastAPI": ["fast api"],
+        "Spring Boot": ["springboot", "spring"],
+        "ASP.NET": ["asp.net core", "asp net"],
+        ".NET": ["dotnet", "net core", "net framework"],
+        "Ruby on Rails": ["rails", "ror"],
+        "Laravel": [],
+        "jQuery": [],
+        "Redux": ["redux toolkit"],
+        "GraphQL": [],
+        "REST APIs": ["rest api", "rest", "restful", "restful api", "restful apis", "rest apis"],
+        "Tailwind CSS": ["tailwind", "tailwindcss"],
+        "Bootstrap": [],
+        "WordPress": ["wordpress.com"],
+    },
+    "Mobile Development": {
+        "Android": ["android development", "android sdk"],
+        "iOS": ["ios development"],
+        "Flutter": [],
+        "React Native": ["react-native"],
+        "Jetpack Compose": [],
+    },
+    "Data Science & Machine Learning": {
+        "Machine Learning": ["ml"],
+        "Deep Learning": ["dl"],
+        "Natural Language Processing": ["nlp"],
+        "Computer Vision": ["cv"],
+        "Data Analysis": ["data analytics"],
+        "Data Visualization": ["data viz"],
+        "Statistics": ["statistical analysis"],
+        "Pandas": [],
+        "NumPy": [],
+        "scikit-learn": ["sklearn", "scikit learn"],
+        "TensorFlow": ["tensor flow", "tf2"],
+        "PyTorch": ["torch"],
+        "Keras": [],
+        "OpenCV": ["open cv"],
+        "Matplotlib": [],
+        "Seaborn": [],
+        "Hugging Face": ["huggingface", "hugging face transformers"],
+        "LangChain": [],
+        "Large Language Models": ["llm", "llms"],
+        "Apache Spark": ["spark", "pyspark"],
+        "Hadoop": ["apache hadoop"],
+        "Apache Kafka": ["kafka"],
+        "Apache Airflow": ["airflow"],
+        "Databricks": [],
+        "Tableau": [],
+        "Power BI": ["powerbi", "microsoft power bi"],
+        "Microsoft Excel": ["excel", "ms excel", "advanced excel"],
+        "Jupyter": ["jupyter notebook", "jupyter notebooks"],
+    },
+    "Databases": {
+        "MySQL": ["my sql"],
+        "PostgreSQL": ["postgres", "postgre sql", "psql"],
+        "MongoDB": ["mongo", "mongo db"],
+        "Redis": [],
+        "SQLite": [],
+        "Oracle Database": ["oracle", "oracle db", "oracle sql"],
+        "Microsoft SQL Server": ["sql server", "mssql", "ms sql"],
+        "Elasticsearch": ["elastic search"],
+        "DynamoDB": ["dynamo db"],
+        "Firebase": ["firestore"],
+        "Cassandra": ["apache cassandra"],
+        "Snowflake": [],
+        "NoSQL": ["no sql"],
+    },
+    "Cloud & DevOps": {
+        "AWS": ["amazon web services", "aws cloud"],
+        "Microsoft Azure": ["azure"],
+        "Google Cloud": ["gcp", "google cloud platform"],
+        "Docker": [],
+        "Kubernetes": ["k8s"],
+        "Terraform": [],
+        "Ansible": [],
+        "Jenkins": [],
+        "GitHub Actions": [],
+        "CI/CD": ["ci cd", "continuous integration"],
+        "Linux": ["ubuntu", "unix"],
+        "Nginx": [],
+        "Heroku": [],
+        "Vercel": [],
+        "Netlify": [],
+    },
+    "Testing": {
+        "Selenium": [],
+        "Cypress": [],
+        "Jest": [],
+        "pytest": ["py.test"],
+        "JUnit": ["junit5"],
+        "Postman": [],
+        "Unit Testing": ["unit tests"],
+    },
+    "Tools & Platforms": {
+        "Git": [],
+        "GitHub": ["github.com"],
+        "GitLab": [],
+        "Jira": [],
+        "VS Code": ["vscode", "visual studio code"],
+        "Salesforce": [],
+        "SAP": [],
+        "AutoCAD": ["auto cad"],
+        "SolidWorks": ["solid works"],
+        "Arduino": [],
+        "Raspberry Pi": [],
+        "Microsoft Office": ["ms office", "ms-office"],
+        "Microsoft Word": ["ms word"],
+        "Microsoft PowerPoint": ["powerpoint", "ms powerpoint"],
+    },
+    "Design": {
+        "Figma": [],
+        "Adobe Photoshop": ["photoshop"],
+        "Adobe Illustrator": ["illustrator"],
+        "Adobe XD": [],
+        "Canva": [],
+        "UI/UX Design": ["ui/ux", "ui ux", "ux design", "ui design", "user experience", "ux", "ui"],
+        "Responsive Design": ["responsive web design"],
+    },
+    "Soft Skills": {
+        "Communication": ["communication skills", "verbal communication", "written communication"],
+        "Teamwork": ["team player", "team work"],
+        "Leadership": ["team leadership"],
+        "Problem Solving": ["problem-solving", "problem solving skills"],
+        "Critical Thinking": [],
+        "Time Management": [],
+        "Public Speaking": [],
+        "Project Management": [],
+        "Adaptability": [],
+    },
+}
+
+# Spellings that are ordinary words outside a list of skills
+SKILLS_SECTION_ONLY = {
+    "c", "r", "go", "rust", "swift", "dart", "ruby", "spring", "express", "rest", "node",
+    "rails", "excel", "oracle", "sap", "spark", "torch", "ts", "cv", "ml", "dl", "unix", "ui",
+}
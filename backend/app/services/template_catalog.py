@@ -0,0 +1,234 @@
+"""
+Template Catalog - in-memory snapshot of the resume template catalog.
+
+The catalog is small and nearly static, so template endpoints serve it
+from a process-wide snapshot with precomputed facet indexes instead of
+querying the database. A background task reloads it periodically; the
+snapshot version (and ETag) only changes when the catalog content does.
+Usage recorded between reloads re-ranks the snapshot in place.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.template import ResumeTemplate
+from app.models.user import PlanTier
+from app.services.usage_counter import get_template_usage_counter
+
+
+logger = logging.getLogger(__name__)
+
+# Fields exposed by the template endpoints
+TEMPLATE_FIELDS = (
+    "id", "name", "display_name", "description", "industry", "position_type",
+    "category", "tier_required", "preview_image", "is_featured",
+)
+
+# Indexed facets: facet -> value -> template ids in display order
+FACETS = ("industry", "category", "position_type", "tier_required")
+
+TIER_LEVELS = {
+    PlanTier.FREE: 0,
+    PlanTier.PRO: 1,
+    PlanTier.ULTIMATE: 2
+}
+
+FEATURED_LIMIT = 6
+
+
+class TemplateCatalog:
+    """Snapshot of the active templates. Only the popularity ranking changes after load."""
+
+    def __init__(self, rows: Iterable[ResumeTemplate], version: int = 1):
+        # Featured first, then most used (id breaks ties for a stable order)
+        ordered = sorted(
+            (t for t in rows if t.is_active),
+            key=lambda t: (not t.is_featured, -(t.usage_count or 0), t.id)
+        )
+
+        self.version = version
+        self.templates: Dict[int, Dict] = {
+            t.id: {field: getattr(t, field) for field in TEMPLATE_FIELDS} for t in ordered
+        }
+        self.settings: Dict[int, Optional[Dict]] = {t.id: t.settings for t in ordered}
+        self.order: List[int] = [t.id for t in ordered]
+        self.usage: Dict[int, int] = {t.id: t.usage_count or 0 for t in ordered}
+        self._is_featured: Dict[int, bool] = {t.id: bool(t.is_featured) for t in ordered}
+        self._position: Dict[int, int] = {template_id: i for i, template_id in enumerate(self.order)}
+        self._rank_lock = threading.Lock()
+        self.rank_version = 0
+
+        self.facets: Dict[str, Dict[str, List[int]]] = {facet: {} for facet in FACETS}
+        for template_id in self.order:
+            template = self.templates[template_id]
+            for facet in FACETS:
+                value = template[facet]
+                if value:
+                    self.facets[facet].setdefault(value, []).append(template_id)
+
+        # Usage counts are excluded: they are synced in place on reload
+        fingerprint = json.dumps([self.templates, self.settings], sort_keys=True, default=str)
+        self.content_etag = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+
+    @property
+    def etag(self) -> str:
+        """Changes with the content and with every re-ranking."""
+        return f"{self.content_etag}.{self.rank_version}"
+
+    def _sort_key(self, template_id: int):
+        return (not self._is_featured[template_id], -self.usage[template_id], template_id)
+
+    def record_usage(self, template_id: int, count: int = 1) -> int:
+        """
+        Add usage to a template and move it up the ranking.
+        Only neighbours it overtakes are shifted (insertion step).
+
+        Returns:
+            The template's usage count including this increment
+        """
+        with self._rank_lock:
+            self.usage[template_id] += count
+            position = self._position[template_id]
+            key = self._sort_key(template_id)
+            moved = False
+            while position > 0 and key < self._sort_key(self.order[position - 1]):
+                above = self.order[position - 1]
+                self.order[position - 1], self.order[position] = template_id, above
+                self._position[above] = position
+                position -= 1
+                moved = True
+            self._position[template_id] = position
+            if moved:
+                self.rank_version += 1
+            return self.usage[template_id]
+
+    def sync_usage(self, usage: Dict[int, int]) -> None:
+        """Replace usage counts (e.g. totals reloaded from the database) and re-rank."""
+        with self._rank_lock:
+            self.usage.update({i: usage[i] for i in self.order if i in usage})
+            order = sorted(self.order, key=self._sort_key)
+            if order != self.order:
+                self.order[:] = order
+                self._position = {template_id: i for i, template_id in enumerate(order)}
+                self.rank_version += 1
+
+    def get(self, template_id: int) -> Optional[Dict]:
+        return self.templates.get(template_id)
+
+    def filter(self, **filters: Optional[str]) -> List[Dict]:
+        """
+        Templates matching every given facet value, in display order.
+        e.g. catalog.filter(industry="Tech", category=None)
+        """
+        id_lists = [
+            self.facets[facet].get(value, [])
+            for facet, value in filters.items() if value
+        ]
+        if not id_lists:
+            return [self.templates[i] for i in list(self.order)]
+
+        # Walk the smallest list, checking membership in the others
+        id_lists.sort(key=len)
+        others = [set(ids) for ids in id_lists[1:]]
+        matches = [i for i in id_lists[0] if all(i in ids for ids in others)]
+        # Facet lists keep load order; re-rank by current popularity
+        matches.sort(key=self._position.__getitem__)
+        return [self.templates[i] for i in matches]
+
+    def facet_values(self, facet: str) -> List[str]:
+        return sorted(self.facets[facet])
+
+    def featured_templates(self) -> List[Dict]:
+        """Featured templates with their settings and usage as well as TEMPLATE_FIELDS."""
+        featured = [i for i in list(self.order) if self._is_featured[i]]
+        return [
+            {**self.templates[i], "settings": self.settings[i], "is_active": True, "usage_count": self.usage[i]}
+            for i in featured[:FEATURED_LIMIT]
+        ]
+
+    @staticmethod
+    def count_available(templates: List[Dict], plan: PlanTier) -> int:
+        """Number of templates the given plan can use."""
+        user_level = TIER_LEVELS.get(plan, 0)
+        return sum(
+            1 for t in templates
+            if TIER_LEVELS.get(PlanTier[t["tier_required"]], 0) <= user_level
+        )
+
+
+_catalog: Optional[TemplateCatalog] = None
+
+
+def load_template_catalog(db: Session) -> TemplateCatalog:
+    """
+    (Re)load the catalog snapshot from the database.
+    The version is bumped only when the content changed; otherwise the
+    current snapshot is kept and only its usage counts are refreshed.
+    Usage recorded in this process but not yet flushed is carried over.
+    """
+    global _catalog
+    # No flush may land between the two reads, or its batch is counted in neither
+    rows, pending = get_template_usage_counter().read_with_pending(lambda: db.query(ResumeTemplate).all())
+    catalog = TemplateCatalog(rows)
+    usage = {i: count + pending.get(i, 0) for i, count in catalog.usage.items()}
+
+    if _catalog is not None and catalog.content_etag == _catalog.content_etag:
+        _catalog.sync_usage(usage)
+        return _catalog
+
+    catalog.sync_usage(usage)
+    if _catalog is not None:
+        catalog.version = _catalog.version + 1
+    _catalog = catalog
+    return catalog
+
+
+def get_template_catalog() -> TemplateCatalog:
+    """Get the current catalog snapshot (loaded at startup)."""
+    if _catalog is None:
+        db = SessionLocal()
+        try:
+            return load_template_catalog(db)
+        finally:
+            db.close()
+    return _catalog
+
+
+def invalidate_template_catalog() -> TemplateCatalog:
+    """Reload the catalog now (call after changing templates in-process)."""
+    db = SessionLocal()
+    try:
+        return load_template_catalog(db)
+    finally:
+        db.close()
+
+
+async def run_catalog_refresher(on_change=None) -> None:
+    """
+    Background task: periodically reload the catalog so changes made by
+    other processes (e.g. init_templates.py) are picked up.
+
+    Args:
+        on_change: Optional callback invoked with the new snapshot when
+            its version changes
+    """
+    interval = settings.TEMPLATE_CATALOG_REFRESH_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            previous = _catalog.version if _catalog else None
+            catalog = await run_in_threadpool(invalidate_template_catalog)
+            if catalog.version != previous:
+                logger.info(f"Template catalog reloaded (version {catalog.version})")
+                if on_change:
+                    on_change(catalog)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Template catalog refresh failed: {str(e)}")
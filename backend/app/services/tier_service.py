@@ -3,10 +3,13 @@ CRITICAL: Tier Enforcement Service
 All tier-based access control logic is centralized here.
 Backend is the SINGLE SOURCE OF TRUTH for tier limits.
 """
+from sqlalchemy import case, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from app.models.user import User, PlanTier
 from app.models.usage_limit import UsageLimit
+from app.models.resume_analysis import ResumeAnalysis
 from app.core.config import settings
 from fastapi import HTTPException, status
 
@@ -139,6 +142,84 @@ class TierService:
             usage.resume_count += 1
         db.commit()
     
+    @staticmethod
+    def _live_reservations():
+        """SQL expression for a user's reserved analyses, ignoring expired reservations."""
+        expires_before = datetime.utcnow() - timedelta(minutes=settings.BULK_ANALYZE_RESERVATION_MINUTES)
+        return case(
+            (UsageLimit.analyses_reserved_at >= expires_before, UsageLimit.analyses_reserved),
+            else_=0
+        )
+    
+    @staticmethod
+    def reserved_analyses(user: User, db: Session) -> int:
+        """Analyses currently held by the user's in-flight bulk uploads."""
+        reserved = db.query(TierService._live_reservations()).filter(UsageLimit.user_id == user.id).scalar()
+        return reserved or 0
+    
+    @staticmethod
+    def reserve_analyses(user: User, count: int, limit: int, since: datetime, db: Session) -> bool:
+        """
+        Reserve analyses against the monthly limit before a bulk upload runs.
+        
+        One conditional UPDATE checks the analyses stored since `since` plus
+        the live reservations against the limit, so concurrent uploads
+        cannot both pass the check.
+        
+        Args:
+            user: User the analyses count against
+            count: Number of analyses to reserve
+            limit: Monthly analysis limit
+            since: Start of the current quota period
+            db: Database session
+            
+        Returns:
+            True if the analyses were reserved, False if they exceed the limit
+        """
+        if db.query(UsageLimit.id).filter(UsageLimit.user_id == user.id).first() is None:
+            db.add(UsageLimit(user_id=user.id))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()  # Created by a concurrent request
+        
+        # Lock the row first so the count below sees analyses committed by a
+        # concurrent upload that held it (no-op on SQLite, which locks on write)
+        db.query(UsageLimit.id).filter(UsageLimit.user_id == user.id).with_for_update().first()
+        
+        reserved = TierService._live_reservations()
+        used = select(func.count(ResumeAnalysis.id)).where(
+            ResumeAnalysis.user_id == user.id,
+            ResumeAnalysis.created_at >= since,
+            ResumeAnalysis.is_active == 1
+        ).scalar_subquery()
+        result = db.execute(
+            update(UsageLimit)
+            .where(UsageLimit.user_id == user.id, used + reserved + count <= limit)
+            .values(analyses_reserved=reserved + count, analyses_reserved_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount == 1
+    
+    @staticmethod
+    def release_analyses(user_id: int, count: int, db: Session) -> None:
+        """
+        Give back reserved analyses, either unused or now stored as rows.
+        
+        Does not commit, so a stored analysis and the reservation it used
+        are committed together.
+        """
+        if count <= 0:
+            return
+        remaining = UsageLimit.analyses_reserved - count
+        db.execute(
+            update(UsageLimit)
+            .where(UsageLimit.user_id == user_id)
+            .values(analyses_reserved=case((remaining > 0, remaining), else_=0))
+            .execution_options(synchronize_session=False)
+        )
+    
     @staticmethod
     def can_use_feature(user: User, feature: str) -> bool:
         """
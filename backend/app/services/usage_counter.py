@@ -0,0 +1,117 @@
+"""
+Template Usage Counter - write-behind aggregation of template usage.
+
+Selecting a template only bumps an in-memory counter. A background task
+flushes the accumulated counts with one atomic
+``UPDATE ... SET usage_count = usage_count + n`` per template, so
+concurrent clicks are never lost and popular rows are not written on
+every request.
+"""
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.template import ResumeTemplate
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TemplateUsageCounter:
+    """Thread-safe buffer of per-template usage increments."""
+
+    def __init__(self):
+        self._pending: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        # Held from draining a batch until it is committed
+        self._flush_lock = threading.Lock()
+
+    def increment(self, template_id: int, count: int = 1) -> None:
+        with self._lock:
+            self._pending[template_id] = self._pending.get(template_id, 0) + count
+
+    def pending(self) -> Dict[int, int]:
+        """Snapshot of increments not yet flushed."""
+        with self._lock:
+            return dict(self._pending)
+
+    def read_with_pending(self, read: Callable[[], T]) -> Tuple[T, Dict[int, int]]:
+        """
+        Run a database read, then snapshot the pending increments, with no
+        flush in between (a batch drained but not yet committed would be
+        missing from both).
+
+        Returns:
+            (read() result, pending increments)
+        """
+        with self._flush_lock:
+            return read(), self.pending()
+
+    def flush(self, db: Session) -> int:
+        """
+        Write buffered increments to the database in one transaction.
+        On failure the increments are put back for the next flush.
+
+        Returns:
+            Number of templates updated
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            try:
+                for template_id, count in batch.items():
+                    db.execute(
+                        update(ResumeTemplate)
+                        .where(ResumeTemplate.id == template_id)
+                        .values(usage_count=func.coalesce(ResumeTemplate.usage_count, 0) + count)
+                    )
+                db.commit()
+            except Exception:
+                db.rollback()
+                with self._lock:
+                    for template_id, count in batch.items():
+                        self._pending[template_id] = self._pending.get(template_id, 0) + count
+                raise
+            return len(batch)
+
+
+_usage_counter: Optional[TemplateUsageCounter] = None
+
+
+def get_template_usage_counter() -> TemplateUsageCounter:
+    """Get the process-wide template usage counter."""
+    global _usage_counter
+    if _usage_counter is None:
+        _usage_counter = TemplateUsageCounter()
+    return _usage_counter
+
+
+def flush_template_usage() -> int:
+    db = SessionLocal()
+    try:
+        return get_template_usage_counter().flush(db)
+    finally:
+        db.close()
+
+
+async def run_usage_flusher() -> None:
+    """Background task: periodically flush buffered template usage."""
+    interval = settings.TEMPLATE_USAGE_FLUSH_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(flush_template_usage)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Template usage flush failed: {str(e)}")
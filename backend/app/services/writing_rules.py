@@ -0,0 +1,102 @@
+"""
+Writing Rules
+Word lists shared by the resume analyzer, the PDF metrics extractor and
+the live lint: weak phrases with stronger replacements, action verbs,
+and passive voice markers.
+"""
+import re
+
+
+# Weak phrase -> stronger alternatives
+WEAK_VERBS = {
+    "worked on": ["Developed", "Built", "Implemented"],
+    "helped": ["Supported", "Contributed to", "Enabled"],
+    "assisted": ["Supported", "Collaborated on", "Contributed to"],
+    "responsible for": ["Led", "Owned", "Managed"],
+    "in charge of": ["Led", "Directed", "Managed"],
+    "tasked with": ["Led", "Delivered", "Executed"],
+    "duties included": ["Led", "Managed", "Delivered"],
+    "participated in": ["Contributed to", "Collaborated on", "Co-led"],
+    "involved in": ["Contributed to", "Drove", "Delivered"],
+    "was part of": ["Contributed to", "Collaborated on", "Co-built"],
+    "did": ["Executed", "Performed", "Completed"],
+    "made": ["Built", "Created", "Designed"],
+    "handled": ["Managed", "Resolved", "Coordinated"],
+    "used": ["Applied", "Leveraged", "Employed"],
+    "utilized": ["Applied", "Leveraged", "Employed"],
+    "tried": ["Tested", "Experimented with", "Piloted"],
+    "got": ["Achieved", "Earned", "Secured"],
+    "learned": ["Mastered", "Acquired", "Trained in"],
+    "looked into": ["Investigated", "Researched", "Evaluated"],
+    "dealt with": ["Resolved", "Managed", "Addressed"],
+}
+
+# Action verbs counted by PDFParserService.extract_key_metrics
+METRIC_ACTION_VERBS = (
+    "developed", "created", "implemented", "designed", "built", "managed",
+    "led", "achieved", "improved", "increased", "reduced", "optimized",
+    "analyzed", "coordinated", "executed", "launched", "delivered",
+)
+
+# Auxiliaries counted by ResumeAnalyzerService.analyze_content_quality
+PASSIVE_INDICATORS = ("was", "were", "been", "being")
+
+# Verbs the lint accepts at the start of a bullet
+STRONG_ACTION_VERBS = set(METRIC_ACTION_VERBS) | {
+    "architected", "automated", "engineered", "deployed", "migrated",
+    "integrated", "refactored", "debugged", "tested", "researched", "evaluated", "investigated",
+    "streamlined", "accelerated", "scaled", "secured", "modernized", "established", "founded",
+    "organized", "directed", "mentored", "trained", "presented", "published", "authored",
+    "won", "earned", "awarded", "ranked", "collaborated", "contributed", "co-led", "co-built",
+    "owned", "drove", "spearheaded", "initiated", "prototyped", "modeled", "visualized",
+    "configured", "maintained", "monitored", "resolved", "supported", "enabled", "applied",
+    "leveraged", "employed", "performed", "completed", "piloted", "mastered", "acquired",
+    "addressed", "conducted", "planned", "produced", "wrote", "translated", "negotiated",
+    "reviewed", "documented", "cut", "saved", "generated", "grew", "boosted", "expanded",
+}
+
+PASSIVE_PARTICIPLES = (
+    "built", "done", "made", "given", "taken", "written", "shown", "led", "run",
+    "held", "won", "chosen", "sent", "seen", "found", "taught", "brought", "kept", "put",
+)
+
+# Participles that usually describe the subject ("was excited", "is interested")
+ADJECTIVAL_PARTICIPLES = (
+    "excited", "interested", "motivated", "dedicated", "experienced", "skilled", "qualified",
+    "committed", "determined", "focused", "pleased", "thrilled", "delighted", "based",
+    "located", "certified", "talented", "organized", "inspired", "fascinated", "involved",
+)
+
+# Bare verbs that are only weak as the bullet's main verb: flagged at the
+# start of a bullet or before an object, not in "tool used by 500 engineers"
+# or "made-to-order"
+AMBIGUOUS_WEAK_VERBS = ("did", "made", "used", "got")
+OBJECT_WORDS = (
+    "a", "an", "the", "my", "our", "their", "his", "her", "its", "it", "them", "this",
+    "that", "these", "those", "some", "several", "multiple", "many", "various",
+)
+
+
+def _alternation(phrases) -> str:
+    return "|".join(
+        re.escape(phrase).replace(r"\ ", r"\s+")
+        for phrase in sorted(phrases, key=len, reverse=True)  # Longest phrase wins
+    )
+
+
+_UNAMBIGUOUS_WEAK = _alternation(phrase for phrase in WEAK_VERBS if phrase not in AMBIGUOUS_WEAK_VERBS)
+_AMBIGUOUS_WEAK = _alternation(AMBIGUOUS_WEAK_VERBS)
+
+# The whole match is the weak phrase; match bullets without their markers
+WEAK_VERB_PATTERN = re.compile(
+    r"\b(?:" + _UNAMBIGUOUS_WEAK + r")\b"
+    r"|^(?:" + _AMBIGUOUS_WEAK + r")\b(?!-)"
+    r"|\b(?:" + _AMBIGUOUS_WEAK + r")(?=\s+(?:" + "|".join(OBJECT_WORDS) + r")\b)",
+    re.IGNORECASE
+)
+PASSIVE_PATTERN = re.compile(
+    r"\b(?:am|is|are|was|were|be|been|being)\s+(?:\w+ly\s+)?"
+    r"(?!(?:" + _alternation(ADJECTIVAL_PARTICIPLES) + r")\b)"
+    r"(?:\w+ed|" + "|".join(PASSIVE_PARTICIPLES) + r")\b(?!-)",
+    re.IGNORECASE
+)
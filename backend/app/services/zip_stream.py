@@ -0,0 +1,70 @@
+"""
+Streaming ZIP writer.
+
+Builds a ZIP archive incrementally and yields its bytes as each entry is
+added, so archives are never held in memory. Entries are written with
+data descriptors (the output stream is not seekable).
+"""
+import zipfile
+from typing import AsyncIterator, BinaryIO, List, Tuple, Union
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _ZipOutput:
+    """Write-only sink that buffers zip output between yields."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+async def stream_zip(entries: AsyncIterator[Tuple[str, Union[str, BinaryIO, bytes]]]) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP archive.
+
+    Args:
+        entries: Async iterator of (archive name, file path, open binary
+            file or bytes), in the order they should be added (e.g. as
+            renders complete). Open files are read but not closed.
+
+    Yields:
+        Archive bytes
+    """
+    output = _ZipOutput()
+    # PDFs are already compressed - store them as-is
+    with zipfile.ZipFile(output, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        async for name, source in entries:
+            if isinstance(source, bytes):
+                archive.writestr(name, source)
+                yield output.drain()
+                continue
+            src = open(source, "rb") if isinstance(source, str) else source
+            try:
+                with archive.open(name, mode="w") as dest:
+                    while True:
+                        chunk = src.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        dest.write(chunk)
+                        data = output.drain()
+                        if data:
+                            yield data
+            finally:
+                if src is not source:
+                    src.close()
+            yield output.drain()
+    yield output.drain()
+
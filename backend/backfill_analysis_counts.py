@@ -0,0 +1,79 @@
+"""
+Database update script - add and backfill resume_analyses summary counts.
+
+Adds columns introduced after the table was first created (the summary
+counts and the upload blob reference) and the (user_id, created_at, id)
+history index to an existing database, then fills the counts from the
+stored suggestions JSON. Also adds the usage_limits columns that hold
+bulk analysis quota reservations. Safe to run more than once.
+"""
+import os
+import sys
+from sqlalchemy import create_engine, inspect, text
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.compression import CompressedJSON
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+
+def backfill_analysis_counts():
+    engine = create_engine(DATABASE_URL)
+
+    existing_columns = {c["name"] for c in inspect(engine).get_columns("resume_analyses")}
+    existing_usage_columns = {c["name"] for c in inspect(engine).get_columns("usage_limits")}
+
+    with engine.begin() as conn:
+        new_columns = {
+            "suggestion_count": "INTEGER NOT NULL DEFAULT 0",
+            "critical_count": "INTEGER NOT NULL DEFAULT 0",
+            "upload_digest": "VARCHAR(64)",
+        }
+        for column, ddl in new_columns.items():
+            if column not in existing_columns:
+                conn.execute(text(f"ALTER TABLE resume_analyses ADD COLUMN {column} {ddl}"))
+                print(f"➕ Added column {column}")
+
+        usage_columns = {
+            "analyses_reserved": "INTEGER NOT NULL DEFAULT 0",
+            "analyses_reserved_at": "TIMESTAMP",
+        }
+        for column, ddl in usage_columns.items():
+            if column not in existing_usage_columns:
+                conn.execute(text(f"ALTER TABLE usage_limits ADD COLUMN {column} {ddl}"))
+                print(f"➕ Added column usage_limits.{column}")
+
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_resume_analyses_user_created_id "
+            "ON resume_analyses (user_id, created_at, id)"
+        ))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_resume_analyses_upload_digest "
+            "ON resume_analyses (upload_digest)"
+        ))
+
+        rows = conn.execute(text("SELECT id, suggestions FROM resume_analyses")).fetchall()
+        updated = 0
+        for analysis_id, suggestions in rows:
+            # Handles both legacy JSON rows and compressed rows
+            suggestions = CompressedJSON().process_result_value(suggestions, None) or []
+            critical = sum(1 for s in suggestions if s.get("severity") == "critical")
+            conn.execute(
+                text(
+                    "UPDATE resume_analyses SET suggestion_count = :total, critical_count = :critical "
+                    "WHERE id = :id"
+                ),
+                {"total": len(suggestions), "critical": critical, "id": analysis_id}
+            )
+            updated += 1
+
+    print(f"✅ Backfilled counts for {updated} analyses")
+
+
+if __name__ == "__main__":
+    backfill_analysis_counts()
@@ -0,0 +1,7 @@
+"""
+Benchmarks and performance-test tooling for the resume pipeline.
+
+    python -m benchmarks.run                    # run and compare with baseline.json
+    python -m benchmarks.run --save-baseline    # record a new baseline
+    python -m benchmarks.openrouter_stub        # local OpenRouter stand-in on :8001
+"""
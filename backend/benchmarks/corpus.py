@@ -0,0 +1,92 @@
+"""
+Synthetic resume corpus.
+
+Resumes are generated with Faker from a fixed seed and rendered to PDF
+with PDFService, cycling through every template layout, so the same
+seed always gives the same corpus.
+"""
+import random
+from typing import Dict, List
+from faker import Faker
+from app.models.user import PlanTier
+from app.services.pdf_service import PDFService, LAYOUTS
+
+
+# Entries per list section: (education, projects, experience, achievements, skills)
+SIZES = {
+    "small": (1, 1, 1, 2, 6),
+    "medium": (2, 3, 2, 4, 12),
+    "large": (3, 8, 6, 10, 30),  # Spills onto a second page
+}
+
+ACTION_VERBS = ["Developed", "Led", "Built", "Designed", "Implemented", "Improved", "Managed", "Created"]
+SKILLS = [
+    "Python", "JavaScript", "React", "SQL", "Git", "Docker", "AWS", "Java", "C++", "Excel",
+    "Machine Learning", "Data Analysis", "Node.js", "TypeScript", "Kubernetes", "Figma",
+    "Communication", "Leadership", "Pandas", "FastAPI", "PostgreSQL", "Linux", "Tableau", "Go",
+]
+
+# Matched against every resume by the "match" benchmark stage
+JOB_DESCRIPTION = """Software Engineer (Fresher). B.Tech in Computer Science or a related field.
+Strong Python, JavaScript and SQL; experience with React and Node.js; familiarity with
+Docker, AWS and CI/CD. Knowledge of data structures, algorithms, REST APIs and machine
+learning is a plus. Good communication, teamwork and problem-solving skills."""
+
+
+def _bullet(fake: Faker, rng: random.Random) -> str:
+    return f"{rng.choice(ACTION_VERBS)} {fake.bs()} for {rng.randint(2, 500)}+ users, improving {fake.word()} by {rng.randint(5, 60)}%"
+
+
+def generate_resume(fake: Faker, rng: random.Random, size: str) -> Dict:
+    """One Resume.content dictionary of the given size."""
+    education, projects, experience, achievements, skills = SIZES[size]
+    return {
+        "personal_info": {"name": fake.name(), "email": fake.email(), "phone": fake.phone_number()},
+        "summary": " ".join(fake.sentences(nb=3 if size == "small" else 5)),
+        "education": [
+            {"degree": f"B.Tech in {fake.job()}", "institution": f"{fake.city()} University", "year": str(rng.randint(2018, 2025))}
+            for _ in range(education)
+        ],
+        "skills": rng.sample(SKILLS, skills) if skills <= len(SKILLS) else SKILLS,
+        "projects": [
+            {"name": fake.catch_phrase(), "description": ". ".join(_bullet(fake, rng) for _ in range(2))}
+            for _ in range(projects)
+        ],
+        "experience": [
+            {"title": fake.job(), "company": fake.company(), "duration": f"{rng.randint(2, 12)} months", "details": _bullet(fake, rng)}
+            for _ in range(experience)
+        ],
+        "achievements": [_bullet(fake, rng) for _ in range(achievements)],
+    }
+
+
+def build_corpus(count: int = 12, seed: int = 1234) -> List[Dict]:
+    """
+    Generate and render count resumes.
+
+    Returns:
+        List of dicts with 'name', 'size', 'layout', 'content',
+        'template_settings' and the rendered 'pdf' bytes
+    """
+    fake = Faker()
+    fake.seed_instance(seed)
+    rng = random.Random(seed)
+    layouts = sorted(LAYOUTS)
+    sizes = list(SIZES)
+
+    corpus = []
+    for i in range(count):
+        size = sizes[i % len(sizes)]
+        layout = layouts[i % len(layouts)]
+        content = generate_resume(fake, rng, size)
+        template_settings = {"layout": layout}
+        pdf = PDFService.generate_resume_pdf(content, PlanTier.PRO, template_settings).getvalue()
+        corpus.append({
+            "name": f"resume-{i:03d}-{size}-{layout}.pdf",
+            "size": size,
+            "layout": layout,
+            "content": content,
+            "template_settings": template_settings,
+            "pdf": pdf,
+        })
+    return corpus
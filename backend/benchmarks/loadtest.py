@@ -0,0 +1,291 @@
+"""
+End-to-end load test with SLO checks.
+
+Each virtual user runs the journey
+    register -> login -> analyze upload -> enhance -> export PDF -> chat rewrite
+with --concurrency users in flight at once. By default the API
+(uvicorn app.main:app) and the OpenRouter stub are started as
+subprocesses against a fresh local SQLite database; --url targets an
+already running deployment instead.
+
+The report gives per-step throughput, p50/p95/p99 and error rate, checked
+against the declared SLOs (DEFAULT_SLOS, or --slos FILE with the same
+shape). Exits 1 if any SLO is missed.
+
+Usage:
+    python -m benchmarks.loadtest --users 50 --concurrency 10
+    python -m benchmarks.loadtest --ai-latency lognormal:800:0.4 --api-workers 4
+    python -m benchmarks.loadtest --url https://staging.example.com --users 20
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+# The corpus renders with PDFService, which reads app settings
+os.environ.setdefault("SECRET_KEY", "loadtest-secret-key-0123456789abcdef")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./loadtest.db")
+os.environ.setdefault("OPENROUTER_API_KEY", "stub")
+
+import httpx
+from benchmarks.corpus import build_corpus
+from benchmarks.run import summarize
+
+
+STEPS = ["register", "login", "analyze", "enhance", "export_pdf", "chat_rewrite"]
+
+# p95 latency (ms) and maximum error rate per step
+DEFAULT_SLOS = {
+    "register": {"p95_ms": 1500, "max_error_rate": 0.01},  # bcrypt hashing
+    "login": {"p95_ms": 1500, "max_error_rate": 0.01},
+    "analyze": {"p95_ms": 8000, "max_error_rate": 0.01},  # Total analysis target
+    "enhance": {"p95_ms": 1000, "max_error_rate": 0.01},
+    "export_pdf": {"p95_ms": 3000, "max_error_rate": 0.01},
+    "chat_rewrite": {"p95_ms": 5000, "max_error_rate": 0.01},
+}
+
+REWRITE_TEXTS = [
+    "worked on a website for college fest",
+    "helped team with data analysis in excel",
+    "made an android app for attendance",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_healthy(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not start within {timeout:.0f}s")
+
+
+class LocalStack:
+    """API + OpenRouter stub subprocesses on free ports with a fresh SQLite database."""
+
+    def __init__(self, ai_latency: str, ai_error_rate: float, api_workers: int, database_url: Optional[str]):
+        self.ai_latency = ai_latency
+        self.ai_error_rate = ai_error_rate
+        self.api_workers = api_workers
+        self.db_path = None if database_url else os.path.join(BACKEND_DIR, "loadtest.db")
+        self.database_url = database_url or f"sqlite:///{self.db_path}"
+        self.processes: List[subprocess.Popen] = []
+        self.base_url = ""
+
+    def __enter__(self) -> "LocalStack":
+        if self.db_path and os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        stub_port, api_port = _free_port(), _free_port()
+
+        stub = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.openrouter_stub", "--port", str(stub_port),
+             "--latency", self.ai_latency, "--rate-5xx", str(self.ai_error_rate)],
+            cwd=BACKEND_DIR
+        )
+        self.processes.append(stub)
+        _wait_healthy(f"http://127.0.0.1:{stub_port}/stub/stats", stub)
+
+        env = dict(
+            os.environ,
+            DATABASE_URL=self.database_url,
+            DB_CREATE_TABLES_ON_STARTUP="true",
+            OPENROUTER_BASE_URL=f"http://127.0.0.1:{stub_port}/api/v1",
+        )
+        api = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(api_port),
+             "--workers", str(self.api_workers), "--log-level", "warning"],
+            cwd=BACKEND_DIR, env=env
+        )
+        self.processes.append(api)
+        self.base_url = f"http://127.0.0.1:{api_port}"
+        _wait_healthy(f"{self.base_url}/health", api)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for process in reversed(self.processes):
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self.db_path and os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+
+class LoadTest:
+    """Runs user journeys and collects per-step latencies and errors."""
+
+    def __init__(self, base_url: str, pdfs: List[bytes], timeout: float = 60.0, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = base_url.rstrip("/")
+        self.pdfs = pdfs
+        self.timeout = timeout
+        self.transport = transport  # e.g. httpx.ASGITransport for in-process runs
+        self.samples: Dict[str, List[float]] = {step: [] for step in STEPS}
+        self.errors: Dict[str, Dict[str, int]] = {step: {} for step in STEPS}
+        self.completed_journeys = 0
+
+    async def _step(self, client: httpx.AsyncClient, step: str, method: str, path: str, expect: int = 200, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+            outcome = None if response.status_code == expect else str(response.status_code)
+        except httpx.HTTPError as e:
+            response, outcome = None, type(e).__name__
+        self.samples[step].append((time.perf_counter() - started) * 1000)
+        if outcome is not None:
+            self.errors[step][outcome] = self.errors[step].get(outcome, 0) + 1
+            return None
+        return response
+
+    async def journey(self, client: httpx.AsyncClient, user_index: int) -> None:
+        """One user's journey; stops at the first failed step."""
+        email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+        password = "LoadTest-Password-1"
+
+        if not await self._step(client, "register", "POST", "/api/v1/auth/register", expect=201,
+                                json={"email": email, "password": password, "full_name": f"Load User {user_index}"}):
+            return
+        response = await self._step(client, "login", "POST", "/api/v1/auth/login",
+                                    json={"email": email, "password": password})
+        if not response:
+            return
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        pdf = self.pdfs[user_index % len(self.pdfs)]
+        response = await self._step(client, "analyze", "POST", "/api/v1/resume/analyze", headers=headers,
+                                    files={"file": (f"resume-{user_index}.pdf", pdf, "application/pdf")})
+        if not response:
+            return
+        analysis = response.json()
+
+        accepted = list(range(min(3, len(analysis["suggestions"]))))
+        response = await self._step(client, "enhance", "POST", f"/api/v1/resume/enhance/{analysis['analysis_id']}",
+                                    headers=headers, json=accepted)
+        if not response:
+            return
+
+        if not await self._step(client, "export_pdf", "GET", response.json()["download_url"], headers=headers):
+            return
+        if not await self._step(client, "chat_rewrite", "POST", "/api/v1/chat/rewrite", headers=headers,
+                                json={"text": REWRITE_TEXTS[user_index % len(REWRITE_TEXTS)], "tone": "professional"}):
+            return
+        self.completed_journeys += 1
+
+    async def run(self, users: int, concurrency: int) -> float:
+        """Run users journeys, concurrency at a time. Returns wall time in seconds."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for i in range(users):
+            queue.put_nowait(i)
+
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=limits, transport=self.transport) as client:
+            async def worker():
+                while not queue.empty():
+                    await self.journey(client, queue.get_nowait())
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            return time.perf_counter() - started
+
+    def report(self, wall_s: float, slos: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Per-step stats with SLO verdicts."""
+        results = {}
+        for step in STEPS:
+            samples = self.samples[step]
+            if not samples:
+                continue
+            error_count = sum(self.errors[step].values())
+            stats = summarize(samples, 0)
+            stats.pop("peak_kib")
+            stats["throughput_rps"] = round(len(samples) / wall_s, 2)
+            stats["error_rate"] = round(error_count / len(samples), 4)
+            stats["errors"] = self.errors[step]
+            slo = slos.get(step)
+            stats["slo_ok"] = slo is None or (
+                stats["p95_ms"] <= slo["p95_ms"] and stats["error_rate"] <= slo["max_error_rate"]
+            )
+            results[step] = stats
+        return results
+
+
+def print_report(results: Dict[str, Dict], slos: Dict[str, Dict], journeys: int, users: int, wall_s: float) -> None:
+    print(f"\n{'step':<14} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} {'SLO p95':>8}  ")
+    for step, r in results.items():
+        slo = slos.get(step, {})
+        verdict = "✅" if r["slo_ok"] else "❌"
+        print(f"{step:<14} {r['throughput_rps']:>7.2f} {r['p50_ms']:>8.0f} {r['p95_ms']:>8.0f} {r['p99_ms']:>8.0f} "
+              f"{r['error_rate'] * 100:>6.1f}% {slo.get('p95_ms', '-'):>8}  {verdict}")
+        if r["errors"]:
+            print(f"{'':<14} errors: {', '.join(f'{k} x{v}' for k, v in r['errors'].items())}")
+    print(f"\n👥 {journeys}/{users} journeys completed in {wall_s:.1f}s ({journeys / wall_s:.2f} journeys/s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="End-to-end load test with SLO checks")
+    parser.add_argument("--users", type=int, default=20, help="Journeys to run (one new user each)")
+    parser.add_argument("--concurrency", type=int, default=5, help="Journeys in flight at once")
+    parser.add_argument("--url", help="Target a running API instead of starting one locally")
+    parser.add_argument("--api-workers", type=int, default=1, help="uvicorn workers for the local API")
+    parser.add_argument("--database-url", help="Database for the local API (default: fresh SQLite file)")
+    parser.add_argument("--ai-latency", default="lognormal:300:0.3", help="Stub latency spec (see openrouter_stub)")
+    parser.add_argument("--ai-error-rate", type=float, default=0.0, help="Stub 5xx rate")
+    parser.add_argument("--slos", help="JSON file of per-step SLOs (same shape as DEFAULT_SLOS)")
+    parser.add_argument("--corpus", type=int, default=6, help="Distinct resume PDFs to upload")
+    parser.add_argument("--json", dest="json_out", help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    slos = dict(DEFAULT_SLOS)
+    if args.slos:
+        with open(args.slos) as f:
+            slos.update(json.load(f))
+
+    pdfs = [item["pdf"] for item in build_corpus(args.corpus)]
+
+    def run(base_url: str):
+        print(f"🚀 {args.users} journeys, concurrency {args.concurrency} -> {base_url}")
+        load_test = LoadTest(base_url, pdfs)
+        wall_s = asyncio.run(load_test.run(args.users, args.concurrency))
+        return load_test, wall_s
+
+    if args.url:
+        load_test, wall_s = run(args.url)
+    else:
+        with LocalStack(args.ai_latency, args.ai_error_rate, args.api_workers, args.database_url) as stack:
+            load_test, wall_s = run(stack.base_url)
+
+    results = load_test.report(wall_s, slos)
+    print_report(results, slos, load_test.completed_journeys, args.users, wall_s)
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump({"wall_s": wall_s, "journeys": load_test.completed_journeys, "steps": results}, f, indent=2)
+
+    missed = [step for step, r in results.items() if not r["slo_ok"]]
+    if missed:
+        print(f"❌ SLOs missed: {', '.join(missed)}")
+        return 1
+    print("✅ All SLOs met")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
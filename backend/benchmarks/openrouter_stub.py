@@ -0,0 +1,228 @@
+"""
+OpenRouter-compatible stub server for load tests and benchmarks.
+
+Implements POST /api/v1/chat/completions (buffered and "stream": true
+server-sent events) with:
+- deterministic canned responses (chosen by a hash of the prompt)
+- programmable latency: fixed:MS, uniform:MIN:MAX, normal:MEAN:SD,
+  lognormal:MEDIAN:SIGMA (milliseconds, seeded)
+- 429 / 5xx injection at configurable rates
+- per-request overrides via X-Stub-Status and X-Stub-Latency-Ms headers
+
+GET /stub/stats returns request counts; POST /stub/config changes the
+latency and error rates while running.
+
+Usage:
+    python -m benchmarks.openrouter_stub --port 8001 --latency lognormal:800:0.4 --rate-429 0.02
+    OPENROUTER_BASE_URL=http://localhost:8001/api/v1 uvicorn app.main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, field_validator
+
+
+CANNED_RESPONSES = [
+    "Developed a responsive web application using React and Node.js, serving 500+ users and cutting page load time by 40%.",
+    "Led a team of 4 students to build a machine learning model that predicts course demand with 87% accuracy.",
+    "Implemented RESTful APIs in Python (FastAPI) with automated tests, reducing integration bugs by 30%.",
+    "Motivated computer science graduate with hands-on experience in full-stack development, cloud deployment and agile teamwork.",
+    "Designed and deployed a data pipeline processing 1M+ records daily using Python, SQL and AWS Lambda.",
+    "Optimized database queries for a campus portal, improving response times by 60% for 2,000 daily users.",
+]
+
+SERVER_ERRORS = (500, 502, 503)
+
+
+def parse_latency(spec: str):
+    """
+    Parse a latency distribution spec into a sampler returning milliseconds.
+
+    Raises:
+        ValueError: unknown distribution or bad parameters
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(":")] if params else []
+    samplers = {
+        "fixed": (1, lambda rng, ms: ms),
+        "uniform": (2, lambda rng, low, high: rng.uniform(low, high)),
+        "normal": (2, lambda rng, mean, sd: rng.gauss(mean, sd)),
+        "lognormal": (2, lambda rng, median, sigma: median * rng.lognormvariate(0, sigma)),
+    }
+    if kind not in samplers or len(values) != samplers[kind][0]:
+        raise ValueError(f"Bad latency spec {spec!r} (fixed:MS, uniform:MIN:MAX, normal:MEAN:SD, lognormal:MEDIAN:SIGMA)")
+    sample = samplers[kind][1]
+    return lambda rng: max(0.0, sample(rng, *values))
+
+
+class StubConfig(BaseModel):
+    latency: str = "fixed:0"
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    seed: int = 42
+
+    @field_validator("latency")
+    @classmethod
+    def _valid_latency(cls, value: str) -> str:
+        parse_latency(value)
+        return value
+
+    @field_validator("rate_429", "rate_5xx")
+    @classmethod
+    def _valid_rate(cls, value: float) -> float:
+        if not 0 <= value <= 1:
+            raise ValueError("rates must be between 0 and 1")
+        return value
+
+
+def canned_response(messages: List[Dict]) -> str:
+    """Same prompt -> same response."""
+    prompt = messages[-1].get("content", "") if messages else ""
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+    return CANNED_RESPONSES[digest[0] % len(CANNED_RESPONSES)]
+
+
+def _count_tokens(text: str) -> int:
+    return max(1, len(text.split()) * 4 // 3)  # Rough words -> tokens
+
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    app = FastAPI(title="OpenRouter stub")
+    state = {"config": config or StubConfig(), "stats": Counter()}
+    state["rng"] = random.Random(state["config"].seed)
+    state["latency"] = parse_latency(state["config"].latency)
+
+    def _error(status_code: int) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={"error": {"code": status_code, "message": "Injected by OpenRouter stub"}}
+        )
+
+    def _pick_status(request: Request) -> int:
+        forced = request.headers.get("x-stub-status")
+        if forced:
+            return int(forced)
+        cfg, roll = state["config"], state["rng"].random()
+        if roll < cfg.rate_429:
+            return 429
+        if roll < cfg.rate_429 + cfg.rate_5xx:
+            return state["rng"].choice(SERVER_ERRORS)
+        return 200
+
+    @app.post("/api/v1/chat/completions")
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        forced_latency = request.headers.get("x-stub-latency-ms")
+        latency_ms = float(forced_latency) if forced_latency else state["latency"](state["rng"])
+        status_code = _pick_status(request)
+        state["stats"]["requests"] += 1
+        state["stats"][f"status_{status_code}"] += 1
+
+        model = payload.get("model", "stub")
+        messages = payload.get("messages") or []
+        content = canned_response(messages)
+        max_tokens = payload.get("max_tokens")
+        if max_tokens:
+            content = " ".join(content.split()[:max(1, max_tokens * 3 // 4)])
+        prompt_tokens = sum(_count_tokens(m.get("content", "")) for m in messages)
+        completion_tokens = _count_tokens(content)
+        completion_id = f"gen-stub-{hashlib.sha1(json.dumps(messages).encode('utf-8')).hexdigest()[:12]}"
+        created = int(time.time())
+
+        if status_code != 200:
+            await asyncio.sleep(latency_ms / 1000 / 4)  # Errors come back faster
+            return _error(status_code)
+
+        if not payload.get("stream"):
+            await asyncio.sleep(latency_ms / 1000)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+
+        words = content.split(" ")
+
+        async def events():
+            # Latency is spread over the chunks: first token after ~1/4
+            await asyncio.sleep(latency_ms / 1000 / 4)
+            per_chunk = latency_ms * 3 / 4 / 1000 / len(words)
+            for i, word in enumerate(words):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "delta": {"content": word if i == 0 else " " + word},
+                        "finish_reason": None,
+                    }],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+                await asyncio.sleep(per_chunk)
+            final = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }
+            yield f"data: {json.dumps(final)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stub/stats")
+    def stats():
+        return dict(state["stats"])
+
+    @app.post("/stub/config")
+    def update_config(new_config: StubConfig):
+        state["config"] = new_config
+        state["rng"] = random.Random(new_config.seed)
+        state["latency"] = parse_latency(new_config.latency)
+        state["stats"].clear()
+        return new_config
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenRouter-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", default="fixed:0", help="fixed:MS | uniform:MIN:MAX | normal:MEAN:SD | lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Fraction of requests answered 500/502/503")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    stub_config = StubConfig(latency=args.latency, rate_429=args.rate_429, rate_5xx=args.rate_5xx, seed=args.seed)
+    uvicorn.run(create_stub_app(stub_config), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,250 @@
+"""
+Benchmark runner - times each pipeline stage over the synthetic corpus.
+
+Each stage runs in isolation (inputs are prepared up front) and the
+whole pipeline runs end to end. Latency percentiles and throughput come
+from plain timing passes (repeated for at least --min-time seconds);
+peak memory from a separate tracemalloc pass (tracing allocations slows
+everything down). Regressions are judged on the median against
+baseline.json (tail latencies are too noisy on short runs); p95 is
+checked against the targets in docs/PERFORMANCE_OPTIMIZATION.md.
+
+AI enhancements are not benchmarked here (they are network-bound);
+"analyze" covers the four rule-based analyzers and scoring, "match" the
+job description match of one parsed resume.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --count 24 --iterations 5 --stages render,analyze
+    python -m benchmarks.run --save-baseline
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import UploadFile
+from app.models.user import PlanTier
+from app.services import pdf_service
+from app.services.pdf_parser_service import PDFParserService
+from app.services.pdf_service import PDFService
+from app.services.resume_analyzer_service import ResumeAnalyzerService
+from app.services.jd_match_service import JDMatchService
+from benchmarks.corpus import JOB_DESCRIPTION, build_corpus
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# p95 targets in ms (docs/PERFORMANCE_OPTIMIZATION.md "Target Benchmarks")
+TARGETS_MS = {
+    "parse.extract_text": 2000,
+    "analyze": 5000,
+    "match": 10,
+    "render": 3000,
+    "end_to_end": 8000,
+}
+
+# Differences below this are timer noise, never regressions
+MIN_REGRESSION_MS = 0.5
+
+
+def _extract_text(loop: asyncio.AbstractEventLoop, pdf: bytes) -> str:
+    upload = UploadFile(file=io.BytesIO(pdf), filename="resume.pdf")
+    return loop.run_until_complete(PDFParserService.extract_text_from_pdf(upload))
+
+
+def _analyze(parsed: Dict, metrics: Dict) -> float:
+    scores = {
+        "content_quality": ResumeAnalyzerService.analyze_content_quality(parsed, metrics)[0],
+        "ats_optimization": ResumeAnalyzerService.analyze_ats_optimization(parsed, metrics)[0],
+        "structure": ResumeAnalyzerService.analyze_structure(parsed, metrics)[0],
+        "fresher_specific": ResumeAnalyzerService.analyze_fresher_specific(parsed, metrics)[0],
+    }
+    return ResumeAnalyzerService.calculate_overall_score(scores)
+
+
+def _render(item: Dict, cold: bool) -> bytes:
+    if cold:
+        pdf_service._FLOWABLE_CACHE.clear()  # As in a fresh export worker
+    return PDFService.generate_resume_pdf(item["content"], PlanTier.PRO, item["template_settings"]).getvalue()
+
+
+def build_stages(corpus: List[Dict], loop: asyncio.AbstractEventLoop) -> Dict[str, Callable[[Dict], object]]:
+    """Stage name -> function of one corpus item. Prepares per-item inputs first."""
+    for item in corpus:
+        item["text"] = _extract_text(loop, item["pdf"])
+        item["parsed"] = PDFParserService.parse_resume_structure(item["text"])
+        item["metrics"] = PDFParserService.extract_key_metrics(item["text"])
+
+    def end_to_end(item: Dict) -> float:
+        text = _extract_text(loop, _render(item, cold=True))
+        parsed = PDFParserService.parse_resume_structure(text)
+        return _analyze(parsed, PDFParserService.extract_key_metrics(text))
+
+    return {
+        "parse.extract_text": lambda item: _extract_text(loop, item["pdf"]),
+        "parse.structure": lambda item: PDFParserService.parse_resume_structure(item["text"]),
+        "parse.metrics": lambda item: PDFParserService.extract_key_metrics(item["text"]),
+        "analyze": lambda item: _analyze(item["parsed"], item["metrics"]),
+        "match": lambda item: JDMatchService.match(item["parsed"], JOB_DESCRIPTION),
+        "render": lambda item: _render(item, cold=True),
+        "render.warm": lambda item: _render(item, cold=False),
+        "end_to_end": end_to_end,
+    }
+
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    index = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[index]
+
+
+def summarize(samples_ms: List[float], peak_bytes: int) -> Dict[str, float]:
+    """Latency percentiles (ms), throughput (ops/s) and peak traced memory (KiB)."""
+    ordered = sorted(samples_ms)
+    total_s = sum(ordered) / 1000
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(total_s * 1000 / len(ordered), 3),
+        "p50_ms": round(_percentile(ordered, 50), 3),
+        "p95_ms": round(_percentile(ordered, 95), 3),
+        "p99_ms": round(_percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3),
+        "ops_per_s": round(len(ordered) / total_s, 1) if total_s else 0.0,
+        "peak_kib": round(peak_bytes / 1024, 1),
+    }
+
+
+def run_stage(fn: Callable[[Dict], object], corpus: List[Dict], iterations: int, min_time: float = 0.0) -> Dict[str, float]:
+    for item in corpus:  # Warm-up (imports, layout plans)
+        fn(item)
+
+    samples = []
+    passes = 0
+    deadline = time.perf_counter() + min_time
+    while passes < iterations or time.perf_counter() < deadline:
+        passes += 1
+        for item in corpus:
+            started = time.perf_counter()
+            fn(item)
+            samples.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        for item in corpus:
+            fn(item)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return summarize(samples, peak)
+
+
+def compare(results: Dict[str, Dict], baseline: Optional[Dict], tolerance: float) -> List[str]:
+    """
+    Problems found: median latency or peak memory more than tolerance
+    above the baseline, or p95 over its documented target.
+    """
+    problems = []
+    for stage, result in results.items():
+        target = TARGETS_MS.get(stage)
+        if target is not None and result["p95_ms"] > target:
+            problems.append(f"{stage}: p95 {result['p95_ms']:.1f} ms exceeds target {target} ms")
+
+        previous = (baseline or {}).get("stages", {}).get(stage)
+        if not previous:
+            continue
+        allowed = previous["p50_ms"] * (1 + tolerance)
+        if result["p50_ms"] > allowed and result["p50_ms"] - previous["p50_ms"] > MIN_REGRESSION_MS:
+            problems.append(f"{stage}: p50 {result['p50_ms']:.2f} ms vs baseline {previous['p50_ms']:.2f} ms")
+        if result["peak_kib"] > previous["peak_kib"] * (1 + tolerance) and result["peak_kib"] - previous["peak_kib"] > 64:
+            problems.append(f"{stage}: peak {result['peak_kib']:.0f} KiB vs baseline {previous['peak_kib']:.0f} KiB")
+    return problems
+
+
+def print_report(results: Dict[str, Dict], baseline: Optional[Dict]) -> None:
+    print(f"\n{'stage':<20} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KiB':>9} {'p50 vs base':>12}")
+    for stage, r in results.items():
+        previous = (baseline or {}).get("stages", {}).get(stage)
+        delta = f"{(r['p50_ms'] / previous['p50_ms'] - 1) * 100:+.0f}%" if previous and previous["p50_ms"] else "-"
+        print(f"{stage:<20} {r['ops_per_s']:>9.1f} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['peak_kib']:>9.0f} {delta:>12}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the resume parser, analyzer and renderer")
+    parser.add_argument("--count", type=int, default=12, help="Resumes in the corpus")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus seed")
+    parser.add_argument("--iterations", type=int, default=3, help="Minimum timed passes over the corpus per stage")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Minimum timed seconds per stage")
+    parser.add_argument("--stages", default="", help="Comma-separated stages (default: all)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--json", dest="json_out", help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    print(f"📄 Generating {args.count} resumes (seed {args.seed})...")
+    corpus = build_corpus(args.count, args.seed)
+    loop = asyncio.new_event_loop()
+    try:
+        stages = build_stages(corpus, loop)
+        selected = [s for s in args.stages.split(",") if s] or list(stages)
+        unknown = [s for s in selected if s not in stages]
+        if unknown:
+            print(f"❌ Unknown stages: {', '.join(unknown)} (choose from {', '.join(stages)})")
+            return 2
+
+        results = {}
+        for stage in selected:
+            print(f"⏱️  {stage}")
+            results[stage] = run_stage(stages[stage], corpus, args.iterations, args.min_time)
+    finally:
+        loop.close()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "count": args.count,
+            "seed": args.seed,
+            "iterations": args.iterations,
+            "min_time": args.min_time,
+        },
+        "stages": results,
+    }
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\n✅ Baseline saved to {args.baseline}")
+        return 0
+
+    problems = compare(results, baseline, args.tolerance)
+    for problem in problems:
+        print(f"⚠️  {problem}")
+    if not problems:
+        print("\n✅ No regressions" + ("" if baseline else " (no baseline to compare with)"))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Database update script - convert resume payload columns to compressed storage.
+
+Rewrites resume_analyses.extracted_text / parsed_content / suggestions and
+resumes.content into the compressed binary format used by
+app.db.compression, and stores parsed_content as line offsets into
+extracted_text where possible. Rows already converted are skipped, so the
+script is safe to run more than once.
+"""
+import os
+import sys
+from sqlalchemy import create_engine, inspect, text
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.compression import CompressedText, CompressedJSON
+from app.models.resume_analysis import SECTION_SPANS_KEY, encode_section_spans
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+COMPRESSED_COLUMNS = {
+    "resume_analyses": ["extracted_text", "parsed_content", "suggestions"],
+    "resumes": ["content"],
+}
+
+
+def _convert_column_types(conn, engine) -> None:
+    """Switch text/json columns to binary (PostgreSQL only; SQLite is typeless)."""
+    if engine.dialect.name != "postgresql":
+        return
+
+    inspector = inspect(engine)
+    for table, columns in COMPRESSED_COLUMNS.items():
+        types = {c["name"]: str(c["type"]).upper() for c in inspector.get_columns(table)}
+        for column in columns:
+            if types.get(column) == "BYTEA":
+                continue
+            conn.execute(text(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE bytea "
+                f"USING convert_to({column}::text, 'UTF8')"
+            ))
+            print(f"🔧 {table}.{column} -> bytea")
+
+
+def _is_compressed(value) -> bool:
+    return isinstance(value, (bytes, memoryview)) and len(value) > 0 and bytes(value[:1]) in (b"\x00", b"\x01")
+
+
+def compress_stored_content():
+    engine = create_engine(DATABASE_URL)
+    text_type = CompressedText()
+    json_type = CompressedJSON()
+
+    with engine.begin() as conn:
+        _convert_column_types(conn, engine)
+
+        rows = conn.execute(text(
+            "SELECT id, extracted_text, parsed_content, suggestions FROM resume_analyses"
+        )).fetchall()
+        converted = 0
+        for analysis_id, extracted_text, parsed_content, suggestions in rows:
+            if _is_compressed(extracted_text):
+                continue
+            extracted_text = text_type.process_result_value(_as_text(extracted_text), None)
+            parsed_content = json_type.process_result_value(_as_text(parsed_content), None)
+            suggestions = json_type.process_result_value(_as_text(suggestions), None)
+
+            if parsed_content and extracted_text:
+                spans = encode_section_spans(extracted_text, parsed_content)
+                if spans is not None:
+                    parsed_content = {SECTION_SPANS_KEY: spans}
+
+            conn.execute(
+                text(
+                    "UPDATE resume_analyses SET extracted_text = :text, "
+                    "parsed_content = :parsed, suggestions = :suggestions WHERE id = :id"
+                ),
+                {
+                    "text": text_type.process_bind_param(extracted_text, None),
+                    "parsed": json_type.process_bind_param(parsed_content, None),
+                    "suggestions": json_type.process_bind_param(suggestions, None),
+                    "id": analysis_id,
+                }
+            )
+            converted += 1
+        print(f"✅ Compressed {converted} analyses")
+
+        rows = conn.execute(text("SELECT id, content FROM resumes")).fetchall()
+        converted = 0
+        for resume_id, content in rows:
+            if _is_compressed(content):
+                continue
+            content = json_type.process_result_value(_as_text(content), None)
+            conn.execute(
+                text("UPDATE resumes SET content = :content WHERE id = :id"),
+                {"content": json_type.process_bind_param(content, None), "id": resume_id}
+            )
+            converted += 1
+        print(f"✅ Compressed {converted} resumes")
+
+
+def _as_text(value):
+    """Legacy values converted in-place to bytea are still plain UTF-8."""
+    if isinstance(value, (bytes, memoryview)):
+        return bytes(value).decode("utf-8")
+    return value
+
+
+if __name__ == "__main__":
+    compress_stored_content()
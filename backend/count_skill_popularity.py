@@ -0,0 +1,39 @@
+"""
+Skill Popularity Script
+Recounts how many stored resumes list each taxonomy skill and stores the
+counts in the skill_popularity table, which ranks /skills/suggest.
+
+Counting decodes every active resume, so it runs here (e.g. hourly from
+cron) rather than in each API worker; the API reloads the stored counts
+within SKILL_POPULARITY_REFRESH_SECONDS.
+
+Usage:
+    python count_skill_popularity.py
+"""
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.session import SessionLocal
+from app.services.skill_suggest_index import store_skill_popularity
+
+
+def main() -> int:
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        listings = store_skill_popularity(db)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return 1
+    finally:
+        db.close()
+    print(f"✅ Counted {listings} skill listings in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
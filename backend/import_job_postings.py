@@ -0,0 +1,191 @@
+"""
+Job Posting Import Script
+Loads job postings (e.g. a placement cell's or job board's export) into
+the database for /jobs/matches.
+
+Input is a JSON array or JSON Lines file of objects with external_id,
+title, description and optionally company, location and url. Postings
+are matched by external_id: new ones are inserted and changed ones
+updated with batched INSERT ... ON CONFLICT, so re-importing a feed is
+idempotent. The API picks changes up within
+JOB_POSTING_INDEX_REFRESH_SECONDS.
+
+Usage:
+    python import_job_postings.py postings.jsonl
+    python import_job_postings.py postings.json --dry-run
+    python import_job_postings.py postings.jsonl --deactivate-missing
+"""
+import argparse
+import json
+import sys
+import os
+import time
+from datetime import datetime
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+from app.models.job_posting import JobPosting
+
+
+# Columns owned by the feed (is_active is only changed by --deactivate-missing)
+MANAGED_COLUMNS = ["title", "company", "location", "url", "description"]
+
+BATCH_SIZE = 500
+
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def load_postings(path: str) -> List[Dict]:
+    """
+    Read postings from a JSON array or JSON Lines file.
+
+    Raises:
+        ValueError: a posting lacks external_id, title or description
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        postings = json.loads(stripped)
+    else:
+        postings = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    rows = []
+    for number, posting in enumerate(postings, start=1):
+        missing = [key for key in ("external_id", "title", "description") if not posting.get(key)]
+        if missing:
+            raise ValueError(f"Posting {number} is missing {', '.join(missing)}")
+        row = {"external_id": str(posting["external_id"])}
+        for column in MANAGED_COLUMNS:
+            row[column] = posting.get(column)
+        rows.append(row)
+    return rows
+
+
+def diff_postings(db: Session, rows: List[Dict]) -> Dict[str, List]:
+    """
+    Compare feed rows with the database by external_id.
+
+    Returns:
+        Dictionary with 'insert' and 'update' rows, 'unchanged' ids and
+        'missing' ids (active in the database but not in the feed)
+    """
+    existing = {
+        row.external_id: row
+        for row in db.query(
+            JobPosting.external_id, JobPosting.is_active, *[getattr(JobPosting, c) for c in MANAGED_COLUMNS]
+        ).filter(JobPosting.external_id.isnot(None))
+    }
+
+    result = {"insert": [], "update": [], "unchanged": [], "missing": []}
+    for row in rows:
+        current = existing.get(row["external_id"])
+        if current is None:
+            result["insert"].append(row)
+        elif not current.is_active or any(getattr(current, c) != row[c] for c in MANAGED_COLUMNS):
+            result["update"].append(row)
+        else:
+            result["unchanged"].append(row["external_id"])
+
+    in_feed = {row["external_id"] for row in rows}
+    result["missing"] = sorted(
+        external_id for external_id, current in existing.items()
+        if current.is_active and external_id not in in_feed
+    )
+    return result
+
+
+def upsert_postings(db: Session, rows: List[Dict]) -> None:
+    """Batched INSERT ... ON CONFLICT (external_id) DO UPDATE (re-activates postings)."""
+    if not rows:
+        return
+    insert = UPSERT_DIALECTS.get(db.bind.dialect.name)
+    if insert is None:
+        raise RuntimeError(f"Unsupported database for upsert: {db.bind.dialect.name}")
+
+    stmt = insert(JobPosting.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["external_id"],
+        set_={column: stmt.excluded[column] for column in MANAGED_COLUMNS + ["is_active", "updated_at"]}
+    )
+    now = datetime.utcnow()
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = [
+            dict(row, is_active=True, created_at=now, updated_at=now)
+            for row in rows[start:start + BATCH_SIZE]
+        ]
+        db.execute(stmt, batch)  # executemany
+
+
+def import_postings(db: Session, rows: List[Dict], dry_run: bool = False, deactivate_missing: bool = False) -> Dict[str, List]:
+    """Diff and apply feed rows. Returns the diff."""
+    diff = diff_postings(db, rows)
+    if dry_run:
+        return diff
+
+    upsert_postings(db, diff["insert"] + diff["update"])
+    if deactivate_missing and diff["missing"]:
+        db.query(JobPosting).filter(
+            JobPosting.external_id.in_(diff["missing"])
+        ).update({JobPosting.is_active: False, JobPosting.updated_at: datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+    return diff
+
+
+def main(path: str, dry_run: bool = False, deactivate_missing: bool = False) -> bool:
+    print(f"💼 Importing job postings from {path}..." + (" (dry run)" if dry_run else ""))
+
+    try:
+        rows = load_postings(path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        return False
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        diff = import_postings(db, rows, dry_run=dry_run, deactivate_missing=deactivate_missing)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        verb = "Would" if dry_run else "Did"
+        print(f"➕ {verb} insert {len(diff['insert'])}")
+        print(f"🔧 {verb} update {len(diff['update'])}")
+        print(f"✔️  Unchanged: {len(diff['unchanged'])}")
+        if diff["missing"]:
+            action = "deactivate" if deactivate_missing else "leave"
+            print(f"⚠️  Not in feed ({verb.lower()} {action}): {len(diff['missing'])}")
+        print(f"⏱️  {elapsed:.1f} ms")
+
+        if not dry_run:
+            print(f"✅ Job postings up to date ({len(rows)} in feed)")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import job postings into the database")
+    parser.add_argument("path", help="JSON array or JSON Lines file of postings")
+    parser.add_argument("--dry-run", action="store_true", help="Show changes without writing")
+    parser.add_argument(
+        "--deactivate-missing",
+        action="store_true",
+        help="Deactivate postings that are no longer in the feed"
+    )
+    args = parser.parse_args()
+
+    ok = main(args.path, dry_run=args.dry_run, deactivate_missing=args.deactivate_missing)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,34 @@
+"""
+Database schema script - create any missing tables.
+
+Outside development the API no longer runs create_all on startup, so
+run this once per deploy (before init_templates.py). Safe to run more
+than once; existing tables are left untouched.
+
+Usage:
+    python init_db.py
+"""
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.base_class import Base
+from app.db.session import engine
+from app.models import user, usage_limit, resume, chat_session, template, resume_analysis, upload_blob, job_posting, skill_popularity  # noqa: F401 - registers tables
+
+
+def init_db() -> bool:
+    print("🗄️  Creating database tables...")
+    try:
+        Base.metadata.create_all(bind=engine)
+        print(f"✅ {len(Base.metadata.tables)} tables ready")
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if init_db() else 1)
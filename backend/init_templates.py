@@ -1,76 +1,191 @@
 """
 Template Initialization Script
 Loads 50+ resume templates into the database
+
+Non-interactive and idempotent: templates are matched by name, new ones
+inserted and changed ones updated with batched INSERT ... ON CONFLICT.
+Every defined template is (re)activated; usage_count is never
+overwritten. Safe to run on every deploy.
+
+Usage:
+    python init_templates.py              # apply
+    python init_templates.py --dry-run    # show what would change
+    python init_templates.py --deactivate-missing
 """
+import argparse
 import sys
 import os
+import time
+from typing import Dict, List
 
 # Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
+from app.models import User  # noqa: F401 - configures the mappers a query needs
+from app.models import resume_analysis, upload_blob  # noqa: F401
 from app.models.template import ResumeTemplate
 from app.services.template_data import RESUME_TEMPLATES
 
 
-def init_templates():
+# Columns owned by template_data.py (usage_count is not). Defined
+# templates are always active; --deactivate-missing handles the rest
+MANAGED_COLUMNS = [
+    "display_name", "description", "industry", "position_type",
+    "category", "tier_required", "settings", "is_featured", "is_active",
+]
+
+BATCH_SIZE = 500
+
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _template_row(template_data: Dict) -> Dict:
+    row = {"name": template_data["name"]}
+    for column in MANAGED_COLUMNS:
+        row[column] = template_data.get(column, False if column == "is_featured" else None)
+    row["is_active"] = True
+    return row
+
+
+def diff_templates(db: Session, templates: List[Dict]) -> Dict[str, List]:
+    """
+    Compare template definitions with the database by name.
+
+    Returns:
+        Dictionary with 'insert' and 'update' rows, 'unchanged' names and
+        'missing' names (in the database but no longer defined)
+    """
+    existing = {
+        row.name: row
+        for row in db.query(ResumeTemplate.name, *[getattr(ResumeTemplate, c) for c in MANAGED_COLUMNS])
+    }
+
+    result = {"insert": [], "update": [], "unchanged": [], "missing": []}
+    for template_data in templates:
+        row = _template_row(template_data)
+        current = existing.get(row["name"])
+        if current is None:
+            result["insert"].append(row)
+        elif any(getattr(current, c) != row[c] for c in MANAGED_COLUMNS):
+            result["update"].append(row)
+        else:
+            result["unchanged"].append(row["name"])
+
+    defined = {t["name"] for t in templates}
+    result["missing"] = sorted(name for name in existing if name not in defined)
+    return result
+
+
+def upsert_templates(db: Session, rows: List[Dict]) -> None:
+    """Batched INSERT ... ON CONFLICT (name) DO UPDATE, leaving usage_count alone."""
+    if not rows:
+        return
+    insert = UPSERT_DIALECTS.get(db.bind.dialect.name)
+    if insert is None:
+        raise RuntimeError(f"Unsupported database for upsert: {db.bind.dialect.name}")
+
+    stmt = insert(ResumeTemplate.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={column: stmt.excluded[column] for column in MANAGED_COLUMNS}
+    )
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = [dict(row, usage_count=0) for row in rows[start:start + BATCH_SIZE]]
+        db.execute(stmt, batch)  # executemany
+
+
+def _names(rows: List[Dict], limit: int = 10) -> str:
+    names = [row["name"] for row in rows]
+    if not names:
+        return "-"
+    more = f" (+{len(names) - limit} more)" if len(names) > limit else ""
+    return ", ".join(names[:limit]) + more
+
+
+def seed_templates(db: Session, templates: List[Dict], dry_run: bool = False, deactivate_missing: bool = False) -> Dict[str, List]:
+    """Diff and apply template definitions. Returns the diff."""
+    diff = diff_templates(db, templates)
+    if dry_run:
+        return diff
+
+    upsert_templates(db, diff["insert"] + diff["update"])
+    if deactivate_missing and diff["missing"]:
+        db.query(ResumeTemplate).filter(
+            ResumeTemplate.name.in_(diff["missing"])
+        ).update({ResumeTemplate.is_active: False}, synchronize_session=False)
+    db.commit()
+    return diff
+
+
+def print_summary(db: Session) -> None:
+    print("\n📊 Templates by Industry:")
+    industries = db.query(
+        ResumeTemplate.industry,
+        func.count(ResumeTemplate.id)
+    ).group_by(ResumeTemplate.industry).all()
+
+    for industry, count in industries:
+        print(f"   {industry}: {count} templates")
+
+    print("\n📊 Templates by Tier:")
+    tiers = db.query(
+        ResumeTemplate.tier_required,
+        func.count(ResumeTemplate.id)
+    ).group_by(ResumeTemplate.tier_required).all()
+
+    for tier, count in tiers:
+        print(f"   {tier}: {count} templates")
+
+
+def init_templates(dry_run: bool = False, deactivate_missing: bool = False) -> bool:
     """Initialize resume templates in database"""
-    print("🎨 Initializing Resume Templates...")
-    
+    print("🎨 Initializing Resume Templates..." + (" (dry run)" if dry_run else ""))
+
     db = SessionLocal()
-    
+
     try:
-        # Check if templates already exist
-        existing_count = db.query(ResumeTemplate).count()
-        
-        if existing_count > 0:
-            print(f"⚠️  Found {existing_count} existing templates")
-            response = input("Do you want to reload all templates? (y/n): ")
-            if response.lower() != 'y':
-                print("❌ Cancelled")
-                return
-            
-            # Delete existing templates
-            db.query(ResumeTemplate).delete()
-            db.commit()
-            print("🗑️  Deleted existing templates")
-        
-        # Insert new templates
-        count = 0
-        for template_data in RESUME_TEMPLATES:
-            template = ResumeTemplate(**template_data)
-            db.add(template)
-            count += 1
-        
-        db.commit()
-        print(f"✅ Successfully loaded {count} templates!")
-        
-        # Print summary by industry
-        from sqlalchemy import func
-        print("\n📊 Templates by Industry:")
-        industries = db.query(
-            ResumeTemplate.industry,
-            func.count(ResumeTemplate.id)
-        ).group_by(ResumeTemplate.industry).all()
-        
-        for industry, count in industries:
-            print(f"   {industry}: {count} templates")
-        
-        print("\n📊 Templates by Tier:")
-        tiers = db.query(
-            ResumeTemplate.tier_required,
-            func.count(ResumeTemplate.id)
-        ).group_by(ResumeTemplate.tier_required).all()
-        
-        for tier, count in tiers:
-            print(f"   {tier}: {count} templates")
-        
+        started = time.perf_counter()
+        diff = seed_templates(db, RESUME_TEMPLATES, dry_run=dry_run, deactivate_missing=deactivate_missing)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        verb = "Would" if dry_run else "Did"
+        print(f"➕ {verb} insert {len(diff['insert'])}: {_names(diff['insert'])}")
+        print(f"🔧 {verb} update {len(diff['update'])}: {_names(diff['update'])}")
+        print(f"✔️  Unchanged: {len(diff['unchanged'])}")
+        if diff["missing"]:
+            action = "deactivate" if deactivate_missing else "leave"
+            print(f"⚠️  Not in template_data ({verb.lower()} {action}): {', '.join(diff['missing'])}")
+        print(f"⏱️  {elapsed:.1f} ms")
+
+        if not dry_run:
+            print(f"✅ Templates up to date ({len(RESUME_TEMPLATES)} defined)")
+            print_summary(db)
+        return True
+
     except Exception as e:
         print(f"❌ Error: {e}")
         db.rollback()
+        return False
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    init_templates()
+    parser = argparse.ArgumentParser(description="Load resume templates into the database")
+    parser.add_argument("--dry-run", action="store_true", help="Show changes without writing")
+    parser.add_argument(
+        "--deactivate-missing",
+        action="store_true",
+        help="Deactivate templates that are no longer defined (rows are kept for existing resumes)"
+    )
+    args = parser.parse_args()
+
+    ok = init_templates(dry_run=args.dry_run, deactivate_missing=args.deactivate_missing)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,75 @@
+"""
+Startup import profile - report how long each module takes to import.
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter
+and prints the slowest modules by self time, plus their cumulative time
+(the module and everything it imported first).
+
+Usage:
+    python profile_startup.py                  # top 25 modules
+    python profile_startup.py --top 50
+    python profile_startup.py --filter app.    # only our own modules
+    python profile_startup.py --module app.services.pdf_service
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def profile_imports(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Import module in a fresh interpreter with -X importtime.
+
+    Returns:
+        List of (module name, self microseconds, cumulative microseconds)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "import failed")
+        sys.exit(1)
+
+    rows = []
+    for line in result.stderr.splitlines():
+        # import time:      1234 |       5678 |   package.module
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def print_profile(rows: List[Tuple[str, int, int]], top: int, prefix: str = "") -> None:
+    total_ms = sum(self_us for _, self_us, _ in rows) / 1000
+    print(f"⏱️  {len(rows)} modules imported in {total_ms:.0f} ms\n")
+
+    selected = [r for r in rows if r[0].startswith(prefix)] if prefix else rows
+    selected.sort(key=lambda r: r[1], reverse=True)
+
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for name, self_us, cumulative_us in selected[:top]:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    heavy = [name for name in ("reportlab", "fitz", "requests") if any(r[0] == name for r in rows)]
+    if heavy:
+        print(f"\n⚠️  Imported at startup: {', '.join(heavy)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report per-module import cost of the API")
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to show")
+    parser.add_argument("--filter", default="", help="Only show modules with this prefix")
+    args = parser.parse_args()
+
+    print_profile(profile_imports(args.module), args.top, args.filter)
@@ -0,0 +1,43 @@
+"""
+Unit Tests for the benchmark suite (benchmarks/)
+"""
+import pytest
+
+from app.services.pdf_service import LAYOUTS
+from benchmarks.corpus import build_corpus
+from benchmarks.run import compare, summarize
+
+
+class TestBenchmarks:
+    """Test suite for corpus generation and regression checks"""
+
+    @pytest.mark.unit
+    def test_corpus_is_reproducible(self):
+        """The same seed gives the same resumes, covering every layout and size"""
+        first, second = build_corpus(5, seed=7), build_corpus(5, seed=7)
+
+        assert [r["content"] for r in first] == [r["content"] for r in second]
+        assert build_corpus(1, seed=8)[0]["content"] != first[0]["content"]
+        assert {r["layout"] for r in first} == set(LAYOUTS)
+        assert {r["size"] for r in first} == {"small", "medium", "large"}
+        assert all(r["pdf"].startswith(b"%PDF") for r in first)
+
+    @pytest.mark.unit
+    def test_compare_flags_regressions_and_targets(self):
+        """Slower medians, memory growth and missed targets are reported; noise is not"""
+        baseline = {"stages": {
+            "render": summarize([10.0] * 20, 1024 * 1024),
+            "parse.metrics": summarize([0.1] * 20, 1024),
+        }}
+        results = {
+            "render": summarize([14.0] * 20, 2 * 1024 * 1024),
+            "parse.metrics": summarize([0.3] * 20, 1024),  # 3x slower but below the noise floor
+            "analyze": summarize([6000.0] * 20, 1024),
+        }
+
+        problems = compare(results, baseline, tolerance=0.25)
+
+        assert any(p.startswith("render: p50") for p in problems)
+        assert any(p.startswith("render: peak") for p in problems)
+        assert any(p.startswith("analyze: p95") for p in problems)
+        assert not any(p.startswith("parse.metrics") for p in problems)
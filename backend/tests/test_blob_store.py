@@ -0,0 +1,181 @@
+"""
+Unit Tests for the upload blob store
+"""
+import hashlib
+import io
+import os
+import pytest
+from datetime import datetime, timedelta
+from fastapi import UploadFile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+from app.models import User
+from app.models.template import ResumeTemplate  # noqa: F401 - registers FK target table
+from app.models.resume_analysis import ResumeAnalysis
+from app.models.upload_blob import UploadBlob
+from app.services.blob_store import BlobStore, LocalBlobStore, BlobRefService
+
+
+PDF_BYTES = b"%PDF-1.4 fake resume content " * 5000
+
+
+def make_upload(content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename="resume.pdf")
+
+
+class TestBlobStore:
+    """Test suite for LocalBlobStore and BlobRefService"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LocalBlobStore(str(tmp_path / "blobs"))
+    
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_put_stream_is_content_addressed(self, store):
+        """Uploads are stored once under a sharded digest path"""
+        digest, size = await store.put_stream(make_upload(PDF_BYTES))
+        
+        assert digest == hashlib.sha256(PDF_BYTES).hexdigest()
+        assert size == len(PDF_BYTES)
+        assert store.path_for(digest).endswith(os.path.join(digest[:2], digest[2:4], digest))
+        with store.open(digest) as f:
+            assert f.read() == PDF_BYTES
+        
+        # Same content again - deduplicated, no temp files left behind
+        again, _ = await store.put_stream(make_upload(PDF_BYTES))
+        assert again == digest
+        assert [d for d, _ in store.iter_blobs()] == [digest]
+        assert not [n for n in os.listdir(store.root) if n.endswith(".part")]
+    
+    @pytest.mark.unit
+    def test_incomplete_backend_fails_on_creation(self):
+        """A backend missing a storage method cannot be instantiated"""
+        class PartialStore(BlobStore):
+            def exists(self, digest):
+                return False
+        
+        with pytest.raises(TypeError):
+            PartialStore()
+    
+    @pytest.mark.unit
+    def test_acquire_and_release_reference_counts(self, db):
+        """References accumulate across analyses and release decrements"""
+        BlobRefService.acquire(db, "a" * 64, 100)
+        db.commit()
+        BlobRefService.acquire(db, "a" * 64, 100)
+        db.commit()
+        
+        blob = db.query(UploadBlob).one()
+        assert blob.ref_count == 2
+        assert BlobRefService.total_size(db) == 100
+        
+        BlobRefService.release(db, "a" * 64)
+        BlobRefService.release(db, "a" * 64)
+        BlobRefService.release(db, "a" * 64)
+        db.commit()
+        db.refresh(blob)
+        assert blob.ref_count == 0
+    
+    @pytest.mark.unit
+    def test_acquire_race_keeps_callers_pending_rows(self, db):
+        """A concurrent insert of the same blob only rolls back the blob insert"""
+        db.add(UploadBlob(digest="b" * 64, size=100, ref_count=1))
+        db.commit()
+        user = User(email="pending@example.com", hashed_password="x")
+        db.add(user)
+        
+        # Simulate losing the insert race: the UPDATE saw no row yet
+        query = db.query
+        def stale_query(model, *args):
+            result = query(model, *args)
+            if model is UploadBlob and not stale_query.called:
+                stale_query.called = True
+                result = result.filter(UploadBlob.digest == "missing")
+            return result
+        stale_query.called = False
+        db.query = stale_query
+        try:
+            BlobRefService.acquire(db, "b" * 64, 100)
+        finally:
+            db.query = query
+        db.commit()
+        
+        assert db.query(User).filter(User.email == "pending@example.com").count() == 1
+        assert db.query(UploadBlob).one().ref_count == 2
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_reupload_survives_concurrent_sweep(self, db, store):
+        """Re-uploading an unreferenced blob either keeps it or writes it again"""
+        digest, _ = await store.put_stream(make_upload(PDF_BYTES))
+        BlobRefService.acquire(db, digest, len(PDF_BYTES))
+        BlobRefService.release(db, digest)
+        db.commit()
+        
+        # Sweep after the upload claimed the blob - kept
+        await BlobRefService.store_upload(db, store, make_upload(PDF_BYTES))
+        db.commit()
+        assert BlobRefService.sweep(db, store, timedelta(hours=24))["deleted"] == 0
+        assert store.exists(digest)
+        
+        # Sweep between staging and the claim - the upload writes it again
+        BlobRefService.release(db, digest)
+        db.commit()
+        stage_stream = store.stage_stream
+        async def stage_then_sweep(file):
+            staged = await stage_stream(file)
+            assert BlobRefService.sweep(db, store, timedelta(hours=24))["deleted"] == 1
+            return staged
+        store.stage_stream = stage_then_sweep
+        
+        await BlobRefService.store_upload(db, store, make_upload(PDF_BYTES))
+        db.commit()
+        assert store.exists(digest)
+        assert db.query(UploadBlob).one().ref_count == 1
+    
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_sweep_removes_unreferenced_and_expired(self, db, store):
+        """Sweeper deletes unreferenced, expired and orphaned blobs only"""
+        live, _ = await store.put_stream(make_upload(b"live" * 100))
+        released, _ = await store.put_stream(make_upload(b"released" * 100))
+        expired, _ = await store.put_stream(make_upload(b"expired" * 100))
+        orphan, _ = await store.put_stream(make_upload(b"orphan" * 100))
+        old = datetime.utcnow() - timedelta(days=2)
+        os.utime(store.path_for(orphan), (old.timestamp(), old.timestamp()))
+        
+        user = User(email="test@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        for digest in (live, released, expired):
+            BlobRefService.acquire(db, digest, 400)
+        BlobRefService.release(db, released)
+        db.query(UploadBlob).filter(UploadBlob.digest == expired).update({UploadBlob.last_referenced_at: old})
+        analysis = ResumeAnalysis(
+            user_id=user.id, original_filename="r.pdf", extracted_text="text",
+            suggestions=[], upload_digest=expired
+        )
+        db.add(analysis)
+        db.commit()
+        
+        result = BlobRefService.sweep(db, store, timedelta(hours=24))
+        
+        assert result["deleted"] == 3
+        assert store.exists(live)
+        assert not store.exists(released)
+        assert not store.exists(expired)
+        assert not store.exists(orphan)
+        assert [b.digest for b in db.query(UploadBlob).all()] == [live]
+        db.refresh(analysis)
+        assert analysis.upload_digest is None
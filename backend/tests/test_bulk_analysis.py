@@ -0,0 +1,168 @@
+"""
+Integration Tests for bulk resume analysis (ZIP in, NDJSON/CSV out)
+"""
+import csv
+import io
+import json
+import zipfile
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.dependencies import get_current_user
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.models.resume_analysis import ResumeAnalysis
+from app.models.usage_limit import UsageLimit
+from app.models.user import User, PlanTier
+from app.services import blob_store
+from app.services.blob_store import LocalBlobStore
+from app.services.tier_service import TierService
+from benchmarks.corpus import build_corpus
+
+
+USER_ID = 4242
+
+
+@pytest.fixture(scope="module")
+def resume_pdfs():
+    return [item["pdf"] for item in build_corpus(2)]
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client on the real database with a temporary blob store"""
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(blob_store, "_blob_store", LocalBlobStore(str(tmp_path / "blobs")))
+    yield TestClient(app)
+    app.dependency_overrides = {}
+    db = SessionLocal()
+    db.query(ResumeAnalysis).filter(ResumeAnalysis.user_id == USER_ID).delete()
+    db.query(UsageLimit).filter(UsageLimit.user_id == USER_ID).delete()
+    db.commit()
+    db.close()
+
+
+def login(plan: PlanTier):
+    user = Mock(spec=User)
+    user.id = USER_ID
+    user.plan = plan
+    app.dependency_overrides[get_current_user] = lambda: user
+    return user
+
+
+def make_zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class TestBulkAnalysis:
+    """Test suite for POST /resume/analyze/bulk"""
+
+    @pytest.mark.integration
+    def test_ndjson_streams_results_errors_and_summary(self, client, resume_pdfs):
+        """Every PDF gets a result or error line; other entries are skipped"""
+        login(PlanTier.ULTIMATE)
+        archive = make_zip([
+            ("batch/alice.pdf", resume_pdfs[0]),
+            ("batch/bob.pdf", resume_pdfs[1]),
+            ("batch/broken.pdf", b"not a pdf"),
+            ("batch/notes.txt", b"ignored"),
+            ("__MACOSX/batch/._alice.pdf", b"ignored"),
+        ])
+
+        response = client.post(
+            "/api/v1/resume/analyze/bulk",
+            files={"file": ("batch.zip", archive, "application/zip")}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        results = {line["filename"]: line for line in lines if line["type"] == "result"}
+        errors = [line for line in lines if line["type"] == "error"]
+        assert set(results) == {"batch/alice.pdf", "batch/bob.pdf"}
+        assert all(0 <= r["overall_score"] <= 100 and r["analysis_id"] for r in results.values())
+        assert [e["filename"] for e in errors] == ["batch/broken.pdf"]
+        assert lines[-1] == {
+            "type": "summary", "total": 3, "succeeded": 2, "failed": 1,
+            "analyses_used": 2, "analyses_limit": 999999
+        }
+
+        db = SessionLocal()
+        stored = db.query(ResumeAnalysis).filter(ResumeAnalysis.user_id == USER_ID).all()
+        assert sorted(a.original_filename for a in stored) == ["batch/alice.pdf", "batch/bob.pdf"]
+        assert all(a.upload_digest for a in stored)
+        db.close()
+
+    @pytest.mark.integration
+    def test_csv_summary(self, client, resume_pdfs):
+        """format=csv streams one row per PDF"""
+        login(PlanTier.ULTIMATE)
+        archive = make_zip([("alice.pdf", resume_pdfs[0]), ("empty.pdf", b"")])
+
+        response = client.post(
+            "/api/v1/resume/analyze/bulk?format=csv",
+            files={"file": ("batch.zip", archive, "application/zip")}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = {row["filename"]: row for row in csv.DictReader(io.StringIO(response.text))}
+        assert rows["alice.pdf"]["status"] == "completed"
+        assert float(rows["alice.pdf"]["overall_score"]) > 0
+        assert rows["empty.pdf"]["status"] == "failed" and rows["empty.pdf"]["error"]
+
+    @pytest.mark.integration
+    def test_batch_checked_against_quota_up_front(self, client, resume_pdfs):
+        """A batch larger than the remaining quota is rejected before any work"""
+        login(PlanTier.PRO)
+        archive = make_zip([(f"resume-{i}.pdf", resume_pdfs[i % 2]) for i in range(6)])
+
+        response = client.post(
+            "/api/v1/resume/analyze/bulk",
+            files={"file": ("batch.zip", archive, "application/zip")}
+        )
+
+        assert response.status_code == 403
+        assert "6 PDFs" in response.json()["detail"]
+
+        not_zip = client.post(
+            "/api/v1/resume/analyze/bulk",
+            files={"file": ("batch.zip", b"plain bytes", "application/zip")}
+        )
+        assert not_zip.status_code == 400
+
+    @pytest.mark.integration
+    def test_concurrent_batches_share_the_reserved_quota(self, client, resume_pdfs):
+        """Analyses reserved by an in-flight batch count against the limit until released"""
+        user = login(PlanTier.PRO)
+        since = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        db = SessionLocal()
+        try:
+            assert TierService.reserve_analyses(user, 4, 5, since, db)
+            assert not TierService.reserve_analyses(user, 2, 5, since, db)
+
+            archive = make_zip([("alice.pdf", resume_pdfs[0]), ("broken.pdf", b"not a pdf")])
+            rejected = client.post("/api/v1/resume/analyze/bulk", files={"file": ("batch.zip", archive, "application/zip")})
+            assert rejected.status_code == 403
+            assert "1 analyses left" in rejected.json()["detail"]
+
+            TierService.release_analyses(USER_ID, 4, db)
+            db.commit()
+            response = client.post("/api/v1/resume/analyze/bulk", files={"file": ("batch.zip", archive, "application/zip")})
+            assert response.status_code == 200
+            summary = json.loads(response.text.splitlines()[-1])
+            assert (summary["succeeded"], summary["failed"], summary["analyses_used"]) == (1, 1, 1)
+
+            # The stored analysis used its reservation and the failed one was released
+            assert TierService.reserved_analyses(user, db) == 0
+            assert TierService.reserve_analyses(user, 4, 5, since, db)
+            assert not TierService.reserve_analyses(user, 1, 5, since, db)
+        finally:
+            db.close()
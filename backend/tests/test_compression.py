@@ -0,0 +1,120 @@
+"""
+Unit Tests for compressed column storage
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+from app.db.compression import (
+    CompressedText, CompressedJSON, compress_bytes, decompress_bytes,
+    FORMAT_RAW, FORMAT_ZLIB_V1
+)
+from app.models import User, Resume
+from app.models.template import ResumeTemplate  # noqa: F401 - registers FK target table
+from app.models.resume_analysis import (
+    ResumeAnalysis, SECTION_SPANS_KEY, encode_section_spans, decode_section_spans
+)
+from app.services.pdf_parser_service import PDFParserService
+
+
+SAMPLE_TEXT = """John Doe
+john@example.com
+SUMMARY
+Computer science student passionate about backend development and data.
+EDUCATION
+B.Tech in Computer Science, XYZ University, 2024
+SKILLS
+Python, JavaScript, React, SQL, Git
+PROJECTS
+  Developed a REST API using FastAPI and PostgreSQL
+  Built a React dashboard for analytics"""
+
+
+class TestCompressedStorage:
+    """Test suite for compressed column types"""
+    
+    @pytest.fixture
+    def db(self):
+        """In-memory SQLite session with all tables"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+    
+    @pytest.mark.unit
+    def test_small_payload_stored_raw(self):
+        """Short values skip compression"""
+        blob = compress_bytes(b"short")
+        assert blob[0] == FORMAT_RAW
+        assert decompress_bytes(blob) == b"short"
+    
+    @pytest.mark.unit
+    def test_text_round_trip_compresses(self):
+        """Resume text compresses with the shared dictionary and round-trips"""
+        column = CompressedText()
+        blob = column.process_bind_param(SAMPLE_TEXT, None)
+        assert blob[0] == FORMAT_ZLIB_V1
+        assert len(blob) < len(SAMPLE_TEXT)
+        assert column.process_result_value(blob, None) == SAMPLE_TEXT
+    
+    @pytest.mark.unit
+    def test_json_round_trip_and_legacy_values(self):
+        """JSON round-trips, and legacy uncompressed values pass through"""
+        column = CompressedJSON()
+        value = [{"category": "structure", "severity": "high", "accepted": False}]
+        assert column.process_result_value(column.process_bind_param(value, None), None) == value
+        assert column.process_result_value(value, None) == value
+        assert column.process_result_value('{"a": 1}', None) == {"a": 1}
+        assert CompressedText().process_result_value("legacy", None) == "legacy"
+    
+    @pytest.mark.unit
+    def test_unknown_format_rejected(self):
+        """Unknown header bytes raise instead of returning garbage"""
+        with pytest.raises(ValueError):
+            decompress_bytes(b"\x7fgarbage")
+    
+    @pytest.mark.unit
+    def test_section_spans_round_trip(self):
+        """Parsed sections are reproduced exactly from line offsets"""
+        parsed = PDFParserService.parse_resume_structure(SAMPLE_TEXT)
+        spans = encode_section_spans(SAMPLE_TEXT, parsed)
+        
+        assert spans is not None
+        assert decode_section_spans(SAMPLE_TEXT, spans) == parsed
+    
+    @pytest.mark.unit
+    def test_section_spans_fallback_when_text_truncated(self):
+        """Sections that aren't in the stored text can't be encoded as spans"""
+        parsed = PDFParserService.parse_resume_structure(SAMPLE_TEXT)
+        assert encode_section_spans(SAMPLE_TEXT[:60], parsed) is None
+    
+    @pytest.mark.integration
+    def test_analysis_persists_parsed_content_as_spans(self, db):
+        """ResumeAnalysis stores spans but exposes the full parsed content"""
+        user = User(email="test@example.com", hashed_password="x")
+        db.add(user)
+        db.commit()
+        
+        parsed = PDFParserService.parse_resume_structure(SAMPLE_TEXT)
+        analysis = ResumeAnalysis(
+            user_id=user.id,
+            original_filename="resume.pdf",
+            parsed_content=parsed,  # Set before extracted_text: encoded at flush
+            extracted_text=SAMPLE_TEXT,
+            suggestions=[{"section": "summary", "severity": "low"}]
+        )
+        assert analysis.parsed_content == parsed
+        
+        resume = Resume(user_id=user.id, template_id=None, content={"summary": "Hello"})
+        db.add_all([analysis, resume])
+        db.commit()
+        assert SECTION_SPANS_KEY in analysis._parsed_content
+        db.expunge_all()
+        
+        loaded = db.query(ResumeAnalysis).first()
+        assert loaded.extracted_text == SAMPLE_TEXT
+        assert loaded.parsed_content == parsed
+        assert loaded.suggestions == [{"section": "summary", "severity": "low"}]
+        assert db.query(Resume).first().content == {"summary": "Hello"}
@@ -0,0 +1,74 @@
+"""
+Unit Tests for idempotent template seeding (init_templates.py)
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base_class import Base
+from app.models import User  # noqa: F401 - registers mappers
+from app.models.resume_analysis import ResumeAnalysis  # noqa: F401
+from app.models.template import ResumeTemplate
+from init_templates import seed_templates
+
+
+TEMPLATES = [
+    {"name": "alpha", "display_name": "Alpha", "description": "A", "industry": "Tech",
+     "position_type": "Entry-level", "category": "Modern", "tier_required": "FREE",
+     "is_featured": True, "settings": {"layout": "single-column"}},
+    {"name": "beta", "display_name": "Beta", "description": "B", "industry": "Finance",
+     "position_type": "Mid-level", "category": "Classic", "tier_required": "PRO",
+     "settings": {"layout": "two-column"}},
+]
+
+
+class TestInitTemplates:
+    """Test suite for seed_templates"""
+
+    @pytest.fixture
+    def db(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[ResumeTemplate.__table__])
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    @pytest.mark.unit
+    def test_seed_is_idempotent_and_preserves_usage(self, db):
+        """Re-seeding updates changed rows only and keeps usage_count"""
+        diff = seed_templates(db, TEMPLATES)
+        assert [r["name"] for r in diff["insert"]] == ["alpha", "beta"]
+
+        alpha = db.query(ResumeTemplate).filter_by(name="alpha").one()
+        alpha_id = alpha.id
+        alpha.usage_count = 42
+        db.commit()
+
+        assert seed_templates(db, TEMPLATES)["unchanged"] == ["alpha", "beta"]
+
+        changed = [dict(TEMPLATES[0], display_name="Alpha v2"), TEMPLATES[1]]
+        diff = seed_templates(db, changed)
+        assert [r["name"] for r in diff["update"]] == ["alpha"]
+
+        db.expire_all()
+        alpha = db.query(ResumeTemplate).filter_by(name="alpha").one()
+        assert (alpha.id, alpha.display_name, alpha.usage_count) == (alpha_id, "Alpha v2", 42)
+
+    @pytest.mark.unit
+    def test_dry_run_and_deactivate_missing(self, db):
+        """Dry runs write nothing; undefined templates can be deactivated and come back when redefined"""
+        diff = seed_templates(db, TEMPLATES, dry_run=True)
+        assert len(diff["insert"]) == 2
+        assert db.query(ResumeTemplate).count() == 0
+
+        seed_templates(db, TEMPLATES)
+        diff = seed_templates(db, TEMPLATES[:1], deactivate_missing=True)
+
+        assert diff["missing"] == ["beta"]
+        assert db.query(ResumeTemplate).filter_by(name="beta").one().is_active is False
+
+        # Defining it again brings it back
+        diff = seed_templates(db, TEMPLATES)
+        assert [r["name"] for r in diff["update"]] == ["beta"]
+        db.expire_all()
+        assert db.query(ResumeTemplate).filter_by(name="beta").one().is_active is True
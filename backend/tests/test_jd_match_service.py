@@ -0,0 +1,141 @@
+"""
+Unit Tests for the job description match engine
+"""
+import time
+import pytest
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.dependencies import get_current_user
+from app.db.session import get_db
+from app.models.user import User, PlanTier
+from app.services.jd_match_service import JDMatchService, get_jd_vocabulary
+from app.services.pdf_parser_service import PDFParserService
+from app.services.skill_extraction_service import get_skill_trie
+from benchmarks.corpus import JOB_DESCRIPTION, build_corpus
+
+
+JOB = """Backend Developer Intern. Requirements: Python, Django, PostgreSQL, Docker and
+REST APIs. Experience with AWS is a plus. Strong communication and teamwork."""
+
+
+def terms(text):
+    vocabulary = get_jd_vocabulary()
+    return [vocabulary.terms[term_id] for term_id in vocabulary.term_ids(text)]
+
+
+def parsed(skills="", experience="", summary=""):
+    return {"skills": skills, "experience": experience, "summary": summary, "contact": "python@example.com"}
+
+
+class TestJDMatchService:
+    """Test suite for tokenization and match scoring"""
+
+    @pytest.mark.unit
+    def test_tokenizer_handles_aliases_phrases_and_compounds(self):
+        """Aliases, multi-word phrases, dotted names and plurals map to one term"""
+        assert terms("Node.js, ReactJS, k8s and C++/Java") == ["Node.js", "React", "Kubernetes", "C++", "Java"]
+        assert terms("Machine learning and REST APIs; problem-solving") == [
+            "Machine Learning", "REST APIs", "Problem Solving"
+        ]
+        assert terms("Databases, data pipelines and a bachelor's degree in CSE") == [
+            "database", "data pipeline", "bachelor", "degree", "computer science"
+        ]
+        assert terms("We are looking for a go-getter who can excel") == []
+
+    @pytest.mark.unit
+    def test_skills_match_the_skills_taxonomy(self):
+        """Skills keep their skill extraction ids; ambiguous spellings count only in a skills list"""
+        vocabulary = get_jd_vocabulary()
+        trie = get_skill_trie()
+        text = "Python, JS, Go and Excel; machine learning and agile"
+
+        skill_ids = trie.find(text)
+        assert vocabulary.term_ids(text)[:len(skill_ids)] == skill_ids
+        assert vocabulary.terms[:len(trie.names)] == trie.names
+        assert terms(text) == ["Python", "JavaScript", "Machine Learning", "agile"]
+        assert [vocabulary.terms[t] for t in vocabulary.term_ids(text, skills_section=True)] == [
+            "Python", "JavaScript", "Go", "Microsoft Excel", "Machine Learning", "agile"
+        ]
+        assert [vocabulary.categories[t] for t in vocabulary.term_ids(text)] == ["skill", "skill", "concept", "concept"]
+
+    @pytest.mark.unit
+    def test_score_and_missing_keywords(self):
+        """Better coverage scores higher; missing skills outrank missing soft skills"""
+        strong = JDMatchService.match(parsed(
+            skills="Python, Django, PostgreSQL, Docker, AWS",
+            experience="Built REST APIs in Django; strong communication and teamwork",
+            summary="Backend developer"
+        ), JOB)
+        weak = JDMatchService.match(parsed(skills="Python, Excel"), JOB)
+
+        assert 0 <= weak["match_score"] < strong["match_score"] <= 100
+        assert not strong["missing_keywords"]
+        assert weak["matched_keywords"] == ["Python"]
+        missing = [m["keyword"] for m in weak["missing_keywords"]]
+        assert missing.index("Docker") < missing.index("REST APIs") < missing.index("Communication")
+        assert weak["missing_keywords"][0]["category"] == "skill"
+        assert weak["job_keywords"] == 9
+
+    @pytest.mark.unit
+    def test_keyword_stuffing_saturates(self):
+        """Repeating a keyword adds little; contact details are ignored"""
+        once = JDMatchService.match(parsed(skills="Python"), JOB)["match_score"]
+        stuffed = JDMatchService.match(parsed(skills="Python " * 50), JOB)["match_score"]
+        resume = JDMatchService.vectorize_resume(parsed(skills="Python " * 50))
+
+        assert once < stuffed < once * 1.6
+        assert max(resume.values()) < 1
+        assert JDMatchService.match(parsed(), JOB)["match_score"] == 0
+
+    @pytest.mark.unit
+    def test_match_is_fast_enough_to_run_inline(self):
+        """Matching a parsed resume takes well under 10 ms"""
+        resumes = [
+            PDFParserService.parse_resume_structure(PDFParserService.extract_text_from_bytes(item["pdf"]))
+            for item in build_corpus(6)
+        ]
+        JDMatchService.match(resumes[0], JOB_DESCRIPTION)
+
+        started = time.perf_counter()
+        for resume in resumes * 5:
+            JDMatchService.match(resume, JOB_DESCRIPTION)
+        per_pair_ms = (time.perf_counter() - started) * 1000 / (len(resumes) * 5)
+
+        assert per_pair_ms < 10
+
+
+class TestJDMatchEndpoint:
+    """Test suite for POST /resume/analysis/{id}/match"""
+
+    @pytest.mark.integration
+    def test_match_stored_analysis(self):
+        """Stored parsed content is matched; unknown analyses and keyword-free JDs are rejected"""
+        user = Mock(spec=User)
+        user.id = 1
+        user.plan = PlanTier.FREE
+        analysis = Mock()
+        analysis.id = 9
+        analysis.parsed_content = parsed(skills="Python, Docker")
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = analysis
+        app.dependency_overrides[get_current_user] = lambda: user
+        app.dependency_overrides[get_db] = lambda: db
+        client = TestClient(app)
+
+        try:
+            response = client.post("/api/v1/resume/analysis/9/match", json={"job_description": JOB})
+            assert response.status_code == 200
+            body = response.json()
+            assert body["analysis_id"] == 9
+            assert body["matched_keywords"] == ["Python", "Docker"]
+            assert 0 < body["match_score"] < 100
+
+            vague = client.post("/api/v1/resume/analysis/9/match", json={"job_description": "A great opportunity to join us!"})
+            assert vague.status_code == 400
+
+            db.query.return_value.filter.return_value.first.return_value = None
+            assert client.post("/api/v1/resume/analysis/9/match", json={"job_description": JOB}).status_code == 404
+        finally:
+            app.dependency_overrides = {}
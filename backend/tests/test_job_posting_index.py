@@ -0,0 +1,133 @@
+"""
+Integration Tests for job posting import, indexing and /jobs/matches
+"""
+import json
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.dependencies import get_current_user
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.models.job_posting import JobPosting
+from app.models.resume import Resume
+from app.models.user import User, PlanTier
+from app.services import job_posting_index
+from app.services.jd_match_service import JDMatchService
+from app.services.job_posting_index import JobPostingIndex
+from import_job_postings import import_postings, load_postings
+
+
+USER_ID = 6262
+
+FEED = [
+    {"external_id": "be-1", "title": "Backend Developer", "company": "Acme",
+     "description": "Python, Django, PostgreSQL and Docker. REST APIs. Good communication."},
+    {"external_id": "da-1", "title": "Data Analyst", "company": "Globex",
+     "description": "SQL, Excel, Tableau and statistics. Python is a plus."},
+    {"external_id": "ux-1", "title": "UI/UX Designer", "company": "Initech",
+     "description": "Figma, user research and responsive design."},
+]
+
+RESUME = {
+    "skills": "Python, Django, Docker, SQL",
+    "projects": "Built REST APIs for a college portal with Django and PostgreSQL",
+}
+
+
+@pytest.fixture
+def db(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(job_posting_index, "_job_posting_index", None)
+    session = SessionLocal()
+    session.query(JobPosting).delete()
+    session.commit()
+    yield session
+    session.query(JobPosting).delete()
+    session.query(Resume).filter(Resume.user_id == USER_ID).delete()
+    session.commit()
+    session.close()
+    app.dependency_overrides = {}
+
+
+def write_feed(tmp_path, postings):
+    path = tmp_path / "postings.jsonl"
+    path.write_text("\n".join(json.dumps(p) for p in postings))
+    return str(path)
+
+
+class TestJobPostingIndex:
+    """Test suite for job posting import and the inverted index"""
+
+    @pytest.mark.integration
+    def test_import_is_idempotent(self, db, tmp_path):
+        """Re-imports insert, update and deactivate by external_id"""
+        diff = import_postings(db, load_postings(write_feed(tmp_path, FEED)))
+        assert len(diff["insert"]) == 3
+
+        changed = [dict(FEED[0], description=FEED[0]["description"] + " Kubernetes."), FEED[1]]
+        diff = import_postings(db, load_postings(write_feed(tmp_path, changed)), deactivate_missing=True)
+
+        assert [r["external_id"] for r in diff["update"]] == ["be-1"]
+        assert diff["unchanged"] == ["da-1"] and diff["missing"] == ["ux-1"]
+        active = {p.external_id for p in db.query(JobPosting).filter(JobPosting.is_active == True)}  # noqa: E712
+        assert active == {"be-1", "da-1"}
+        with pytest.raises(ValueError):
+            load_postings(write_feed(tmp_path, [{"external_id": "x", "title": "No description"}]))
+
+    @pytest.mark.integration
+    def test_search_matches_pairwise_scores_and_syncs_incrementally(self, db, tmp_path):
+        """Index scores equal JDMatchService.match; edits and removals are picked up"""
+        import_postings(db, load_postings(write_feed(tmp_path, FEED)))
+        index = JobPostingIndex()
+        assert index.sync(db) == (3, 0)
+
+        matches = index.match_resume(db, RESUME, top_k=10)
+        titles = [r["title"] for r in matches["results"]]
+        assert titles == ["Backend Developer", "Data Analyst"]  # The designer role shares no keyword
+        for result in matches["results"]:
+            posting = db.get(JobPosting, result["posting_id"])
+            expected = JDMatchService.match(RESUME, f"{posting.title}\n{posting.description}")["match_score"]
+            assert result["match_score"] == pytest.approx(expected, abs=0.1)
+        assert "Communication" in matches["results"][0]["missing_keywords"]
+
+        analyst = db.query(JobPosting).filter(JobPosting.external_id == "da-1").one()
+        analyst.description = "Python, Django, Docker, SQL and REST APIs."
+        analyst.updated_at = datetime.utcnow() + timedelta(seconds=1)
+        db.query(JobPosting).filter(JobPosting.external_id == "be-1").update({JobPosting.is_active: False})
+        db.commit()
+
+        assert index.sync(db) == (0, 0)  # Within the refresh interval
+        assert index.sync(db, force=True) == (1, 1)
+        best = index.match_resume(db, RESUME, top_k=1)["results"]
+        assert [r["title"] for r in best] == ["Data Analyst"]
+        assert len(index) == 2
+
+    @pytest.mark.integration
+    def test_matches_endpoint(self, db, tmp_path):
+        """GET /jobs/matches ranks postings for a built resume"""
+        import_postings(db, load_postings(write_feed(tmp_path, FEED)))
+        resume = Resume(user_id=USER_ID, title="Mine", content={
+            "personal_info": {"name": "Dev", "email": "python@example.com"},
+            "skills": ["Figma", "User research"],
+            "education": [{"degree": "B.Des", "institution": "NID"}],
+        })
+        db.add(resume)
+        db.commit()
+        user = Mock(spec=User)
+        user.id = USER_ID
+        user.plan = PlanTier.FREE
+        app.dependency_overrides[get_current_user] = lambda: user
+        client = TestClient(app)
+
+        response = client.get(f"/api/v1/jobs/matches?resume_id={resume.id}&top_k=5")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["postings_indexed"] == 3
+        assert [r["title"] for r in body["results"]] == ["UI/UX Designer"]
+        assert body["results"][0]["matched_keywords"] == ["Figma", "user research"]
+        assert client.get("/api/v1/jobs/matches").status_code == 400
+        assert client.get("/api/v1/jobs/matches?resume_id=999999").status_code == 404
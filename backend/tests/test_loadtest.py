@@ -0,0 +1,45 @@
+"""
+Integration Tests for the load-test harness (benchmarks/loadtest.py)
+"""
+import httpx
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.db.base_class import Base
+from app.db.session import engine
+from app.services import blob_store, pdf_cache
+from app.services.blob_store import LocalBlobStore
+from app.services.pdf_cache import PDFCache
+from benchmarks.corpus import build_corpus
+from benchmarks.loadtest import LoadTest, STEPS
+from benchmarks.openrouter_stub import create_stub_app
+
+
+class TestLoadTest:
+    """Test suite for the user-journey load generator"""
+
+    @pytest.mark.integration
+    async def test_journeys_run_against_the_app(self, tmp_path, monkeypatch):
+        """Full journeys succeed in-process (AI via the stub) and meet loose SLOs"""
+        Base.metadata.create_all(bind=engine)
+        monkeypatch.setattr(pdf_cache, "_pdf_cache", PDFCache(str(tmp_path / "pdf"), 10 * 1024 * 1024))
+        monkeypatch.setattr(blob_store, "_blob_store", LocalBlobStore(str(tmp_path / "blobs")))
+        stub = TestClient(create_stub_app())
+
+        def post(url, headers=None, json=None, timeout=None):
+            return stub.post("/api/v1/chat/completions", json=json, headers=headers)
+
+        load_test = LoadTest("http://app", [item["pdf"] for item in build_corpus(2)],
+                             transport=httpx.ASGITransport(app=app))
+        with patch("requests.post", side_effect=post):
+            wall_s = await load_test.run(users=2, concurrency=2)
+
+        results = load_test.report(wall_s, {"register": {"p95_ms": 60000, "max_error_rate": 0.0}})
+
+        assert load_test.completed_journeys == 2
+        assert list(results) == STEPS
+        assert all(r["runs"] == 2 and r["error_rate"] == 0 for r in results.values())
+        assert results["register"]["slo_ok"]
+        assert stub.get("/stub/stats").json()["requests"] >= 2  # chat rewrites reached the stub
@@ -0,0 +1,88 @@
+"""
+Unit Tests for Prometheus metrics (app/core/metrics.py)
+"""
+import pytest
+from unittest.mock import Mock, patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.config import settings
+from app.core import metrics
+from app.core.metrics import Counter, Histogram, MetricsRegistry
+from app.services.ai_service import AIService
+
+
+class TestMetrics:
+    """Test suite for the metrics registry and instrumentation"""
+
+    @pytest.mark.unit
+    def test_text_exposition_format(self):
+        """Histograms render cumulative buckets, sum and count; labels are escaped"""
+        registry = MetricsRegistry()
+        latency = registry.register(Histogram("op_seconds", "Op latency", ("op",), buckets=(0.1, 1.0)))
+        calls = registry.register(Counter("calls_total", "Calls", ("name",)))
+        latency.observe(0.05, op="a")
+        latency.observe(0.5, op="a")
+        latency.observe(5, op="a")
+        calls.inc(name='say "hi"')
+
+        text = registry.render()
+
+        assert "# TYPE op_seconds histogram" in text
+        assert 'op_seconds_bucket{op="a",le="0.1"} 1' in text
+        assert 'op_seconds_bucket{op="a",le="1"} 2' in text
+        assert 'op_seconds_bucket{op="a",le="+Inf"} 3' in text
+        assert 'op_seconds_count{op="a"} 3' in text
+        assert 'op_seconds_sum{op="a"} 5.55' in text
+        assert 'calls_total{name="say \\"hi\\""} 1' in text
+
+        with pytest.raises(ValueError):
+            calls.inc(other="x")
+
+    @pytest.mark.integration
+    def test_route_latency_and_metrics_endpoint(self):
+        """Requests are recorded by route template; /metrics serves the registry"""
+        client = TestClient(app)
+        before = metrics.HTTP_REQUEST_DURATION.count(method="GET", route="/health", status="200")
+
+        client.get("/health")
+        client.get("/no-such-path")
+
+        assert metrics.HTTP_REQUEST_DURATION.count(method="GET", route="/health", status="200") == before + 1
+        assert metrics.HTTP_REQUEST_DURATION.count(method="GET", route="unmatched", status="404") >= 1
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+        assert 'db_pool_connections{state="size"}' in response.text
+
+    @pytest.mark.integration
+    def test_metrics_endpoint_access(self):
+        """Metrics default to development only and honour METRICS_TOKEN"""
+        production = type(settings)(ENVIRONMENT="production")
+        assert production.METRICS_ENABLED is False
+        assert type(settings)(ENVIRONMENT="production", METRICS_ENABLED=True).METRICS_ENABLED is True
+
+        client = TestClient(app)
+        with patch.object(settings, "METRICS_TOKEN", "s3cret"):
+            assert client.get("/metrics").status_code == 401
+            assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+            assert client.get("/metrics", headers={"Authorization": "Bearer s3cret"}).status_code == 200
+
+    @pytest.mark.unit
+    def test_openrouter_latency_and_tokens(self):
+        """OpenRouter calls record latency by status and token usage by model"""
+        model = settings.AI_MODEL
+        response = Mock(status_code=200)
+        response.json.return_value = {
+            "choices": [{"message": {"content": "Built a thing"}}],
+            "usage": {"prompt_tokens": 120, "completion_tokens": 30}
+        }
+        before = metrics.OPENROUTER_TOKENS.value(model=model, type="prompt")
+
+        with patch("requests.post", return_value=response):
+            assert AIService._call_openrouter("prompt") == "Built a thing"
+
+        assert metrics.OPENROUTER_TOKENS.value(model=model, type="prompt") == before + 120
+        assert metrics.OPENROUTER_REQUEST_DURATION.count(model=model, status="200") >= 1
@@ -0,0 +1,69 @@
+"""
+Unit Tests for the OpenRouter stub server (benchmarks/openrouter_stub.py)
+"""
+import json
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.services.ai_service import AIService
+from benchmarks.openrouter_stub import StubConfig, create_stub_app, parse_latency
+
+
+def chat(client, content, headers=None, **kwargs):
+    payload = {"model": "stub/model", "messages": [{"role": "user", "content": content}], **kwargs}
+    return client.post("/api/v1/chat/completions", json=payload, headers=headers or {})
+
+
+class TestOpenRouterStub:
+    """Test suite for the OpenRouter stub"""
+
+    @pytest.mark.unit
+    def test_buffered_responses_are_deterministic(self):
+        """Same prompt, same answer; usage is reported like OpenRouter"""
+        client = TestClient(create_stub_app())
+        first = chat(client, "Improve: built a website").json()
+        second = chat(client, "Improve: built a website").json()
+
+        assert first["choices"][0]["message"]["content"] == second["choices"][0]["message"]["content"]
+        assert first["usage"]["total_tokens"] == first["usage"]["prompt_tokens"] + first["usage"]["completion_tokens"]
+        assert client.get("/stub/stats").json() == {"requests": 2, "status_200": 2}
+
+    @pytest.mark.unit
+    def test_streaming_and_error_injection(self):
+        """Streams SSE chunks ending in [DONE]; injects 429/5xx by rate or header"""
+        client = TestClient(create_stub_app(StubConfig(rate_5xx=1.0)))
+        assert chat(client, "x").status_code in (500, 502, 503)
+        assert chat(client, "x", headers={"X-Stub-Status": "429"}).status_code == 429
+
+        client.post("/stub/config", json={"latency": "uniform:0:1"})
+        streamed = chat(client, "Improve: built a website", stream=True)
+        events = [line[len("data: "):] for line in streamed.text.splitlines() if line.startswith("data: ")]
+        text = "".join(json.loads(e)["choices"][0]["delta"].get("content", "") for e in events[:-1])
+
+        assert events[-1] == "[DONE]"
+        assert text == chat(client, "Improve: built a website").json()["choices"][0]["message"]["content"]
+
+        with pytest.raises(ValueError):
+            parse_latency("gamma:1:2")
+
+    @pytest.mark.unit
+    def test_ai_service_uses_configured_base_url(self):
+        """AIService talks to OPENROUTER_BASE_URL and maps stub errors"""
+        client = TestClient(create_stub_app())
+        calls = []
+
+        def post(url, headers=None, json=None, timeout=None):
+            calls.append(url)
+            return client.post(url.replace("http://stub.local", ""), json=json, headers=headers)
+
+        with patch("app.services.ai_service.settings.OPENROUTER_BASE_URL", "http://stub.local/api/v1/"), \
+                patch("requests.post", side_effect=post):
+            assert AIService._call_openrouter("Improve: built a website")
+            client.headers["X-Stub-Status"] = "429"
+            with pytest.raises(HTTPException) as exc:
+                AIService._call_openrouter("Improve: built a website")
+
+        assert calls[0] == "http://stub.local/api/v1/chat/completions"
+        assert exc.value.status_code == 429
@@ -0,0 +1,85 @@
+"""
+Unit Tests for the rendered PDF cache
+"""
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.services.pdf_cache import PDFCache, etag_matches
+
+
+def make_resume(resume_id=1, summary="Backend developer", updated_at=datetime(2024, 1, 1)):
+    return SimpleNamespace(id=resume_id, content={"summary": summary}, updated_at=updated_at)
+
+
+class TestPDFCache:
+    """Test suite for PDFCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return PDFCache(str(tmp_path / "pdf"), max_bytes=1000)
+
+    @pytest.mark.unit
+    def test_cache_key_tracks_revision_template_and_watermark(self):
+        """Anything that changes the rendered bytes changes the key"""
+        key = PDFCache.cache_key(make_resume(), 1, True)
+
+        assert key.startswith("1-")
+        assert PDFCache.cache_key(make_resume(), 1, True) == key
+        assert PDFCache.cache_key(make_resume(summary="Data analyst"), 1, True) != key
+        assert PDFCache.cache_key(make_resume(updated_at=datetime(2024, 2, 1)), 1, True) != key
+        assert PDFCache.cache_key(make_resume(), 2, True) != key
+        assert PDFCache.cache_key(make_resume(), 1, False) != key
+        restyled = PDFCache.cache_key(make_resume(), 1, True, {"layout": "two-column", "color_scheme": "blue"})
+        assert restyled != key
+        assert PDFCache.cache_key(make_resume(), 1, True, {"color_scheme": "blue", "layout": "two-column"}) == restyled
+
+    @pytest.mark.unit
+    def test_lru_eviction_by_size(self, cache):
+        """Least recently used entries are evicted once over the size limit"""
+        cache.put("1-a", b"a" * 400)
+        cache.put("2-b", b"b" * 400)
+        assert cache.get("1-a") == b"a" * 400  # 1-a is now most recent
+
+        cache.put("3-c", b"c" * 400)
+
+        assert cache.get("2-b") is None
+        assert cache.get("1-a") is not None
+        assert cache.get("3-c") is not None
+        assert cache.total_size() == 800
+
+    @pytest.mark.unit
+    def test_open_entry_survives_eviction(self, cache):
+        """A PDF being served stays readable when another render evicts it"""
+        cache.put("1-a", b"a" * 600)
+        f = cache.open("1-a")
+
+        cache.put("2-b", b"b" * 600)
+
+        assert cache.open("1-a") is None
+        with f:
+            assert f.read() == b"a" * 600
+
+    @pytest.mark.unit
+    def test_invalidate_drops_all_renderings_of_resume(self, cache, tmp_path):
+        """Updating a resume removes its entries only"""
+        cache.put("1-a", b"x" * 10)
+        cache.put("1-b", b"y" * 10)
+        cache.put("11-a", b"z" * 10)
+
+        assert cache.invalidate(1) == 2
+        assert cache.get("1-a") is None
+        assert cache.get("11-a") == b"z" * 10
+
+        # A fresh process rebuilds its index from disk
+        reopened = PDFCache(str(tmp_path / "pdf"), max_bytes=1000)
+        assert reopened.total_size() == 10
+
+    @pytest.mark.unit
+    def test_etag_matches(self):
+        """If-None-Match handles lists, weak validators and wildcards"""
+        assert etag_matches('"1-abc"', '"1-abc"')
+        assert etag_matches('"0-x", W/"1-abc"', '"1-abc"')
+        assert etag_matches("*", '"1-abc"')
+        assert not etag_matches('"1-abd"', '"1-abc"')
+        assert not etag_matches(None, '"1-abc"')
@@ -0,0 +1,143 @@
+"""
+Unit Tests for PDF Export Service
+"""
+import pytest
+import fitz  # PyMuPDF
+
+from app.models.user import PlanTier
+from app.services import pdf_service
+from app.services.pdf_service import PDFService, COLOR_SCHEMES, LAYOUTS
+from app.services.template_data import RESUME_TEMPLATES
+
+
+class TestPDFService:
+    """Test suite for PDFService"""
+    
+    @pytest.fixture
+    def sample_resume(self):
+        """Sample resume content as stored in Resume.content"""
+        return {
+            "personal_info": {"name": "Jane Doe", "email": "jane@example.com", "phone": "555-0100"},
+            "summary": "Final-year computer science student focused on backend systems.",
+            "education": [{"degree": "B.Tech CSE", "institution": "XYZ University", "year": "2025"}],
+            "skills": ["Python", "FastAPI", "SQL"],
+            "projects": [{"name": "Resume Coach", "description": "Built a resume analysis API."}]
+        }
+    
+    @staticmethod
+    def pdf_text(buffer) -> str:
+        with fitz.open(stream=buffer.getvalue(), filetype="pdf") as doc:
+            return "".join(page.get_text() for page in doc)
+    
+    @pytest.mark.unit
+    def test_styles_are_cached_per_settings(self):
+        """Same template settings reuse one compiled style set"""
+        settings = RESUME_TEMPLATES[0]["settings"]
+        
+        first = PDFService.get_styles(settings)
+        second = PDFService.get_styles(dict(settings))
+        
+        assert first is second
+        assert PDFService.get_styles(None) is not first
+    
+    @pytest.mark.unit
+    def test_styles_honor_template_settings(self):
+        """Font, size and colour scheme are applied to the compiled styles"""
+        styles = PDFService.get_styles({
+            "font": "Georgia", "font_size": 10, "color_scheme": "teal", "layout": "single-column"
+        })
+        
+        assert styles["body"].fontName == "Times-Roman"
+        assert styles["body"].fontSize == 10
+        assert styles["section"].textColor == COLOR_SCHEMES["teal"]
+    
+    @pytest.mark.unit
+    def test_warm_style_cache_covers_all_templates(self):
+        """Warming compiles one style set per distinct template style"""
+        count = PDFService.warm_style_cache(RESUME_TEMPLATES)
+        distinct = {
+            (t["settings"]["font"], t["settings"]["font_size"], t["settings"]["color_scheme"], t["settings"]["layout"])
+            for t in RESUME_TEMPLATES
+        }
+        assert count >= len(distinct)
+    
+    @pytest.mark.unit
+    def test_generate_pdf_free_has_watermark(self, sample_resume):
+        """FREE exports carry the watermark, paid exports don't"""
+        free_text = self.pdf_text(PDFService.generate_resume_pdf(sample_resume, PlanTier.FREE))
+        pro_text = self.pdf_text(PDFService.generate_resume_pdf(sample_resume, PlanTier.PRO))
+        
+        assert "JANE DOE" in free_text
+        assert "Upgrade to remove watermark" in free_text
+        assert "Upgrade to remove watermark" not in pro_text
+    
+    @pytest.mark.unit
+    def test_layout_plan_cached_per_template_id(self):
+        """Plans compile once per template id and can be invalidated"""
+        settings = RESUME_TEMPLATES[1]["settings"]
+        PDFService.invalidate_layout_plans()
+        assert PDFService.cached_layout_plan(1001) is None
+        
+        plan = PDFService.get_layout_plan(settings, template_id=1001)
+        
+        assert PDFService.cached_layout_plan(1001) is plan
+        assert PDFService.get_layout_plan(None, template_id=1001) is plan
+        PDFService.invalidate_layout_plans()
+        assert PDFService.cached_layout_plan(1001) is None
+    
+    @pytest.mark.unit
+    def test_layout_plan_section_order_and_frames(self):
+        """Template section order and column layout are compiled into the plan"""
+        plan = PDFService.get_layout_plan({
+            "font": "Arial", "font_size": 10, "color_scheme": "blue",
+            "layout": "two-column", "sections": ["education", "technical_skills", "objective"]
+        })
+        
+        keys = [key for key, _ in plan.sections]
+        assert keys[:3] == ["education", "skills", "summary"]
+        assert dict(plan.sections)["summary"] == "OBJECTIVE"
+        assert [frame[0] for frame in plan.page_frames["first"]] == ["header", "sidebar", "main"]
+        assert [frame[0] for frame in plan.page_frames["later"]] == ["main"]
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("layout", sorted(LAYOUTS))
+    def test_every_layout_renders_all_content(self, sample_resume, layout):
+        """Each layout renders every populated section"""
+        template = next(t for t in RESUME_TEMPLATES if t["settings"]["layout"] == layout)
+        resume = dict(sample_resume, experience="Backend Intern at ABC", certifications=["AWS Cloud Practitioner"])
+        
+        text = self.pdf_text(PDFService.generate_resume_pdf(resume, PlanTier.PRO, template["settings"]))
+        
+        for expected in ["JANE DOE", "FastAPI", "XYZ University", "Resume Coach", "Backend Intern", "AWS Cloud Practitioner"]:
+            assert expected in text
+    
+    @pytest.mark.unit
+    def test_long_sidebar_stays_on_page_one(self, sample_resume):
+        """A sidebar longer than the page shrinks instead of pushing main content to page two"""
+        template = next(t for t in RESUME_TEMPLATES if t["settings"]["layout"] == "two-column")
+        skills = [f"Skill number {i}" for i in range(120)]
+        resume = dict(sample_resume, skills=skills, experience="Backend Intern at ABC")
+        
+        buffer = PDFService.generate_resume_pdf(resume, PlanTier.PRO, template["settings"])
+        with fitz.open(stream=buffer.getvalue(), filetype="pdf") as doc:
+            first_page = doc[0].get_text()
+            assert doc.page_count == 1
+        
+        for expected in ["Skill number 0", "Skill number 119", "Resume Coach", "Backend Intern"]:
+            assert expected in first_page
+    
+    @pytest.mark.unit
+    def test_unchanged_sections_reuse_flowables(self, sample_resume):
+        """Only sections whose content changed are rebuilt between renders"""
+        pdf_service._FLOWABLE_CACHE.clear()
+        first = self.pdf_text(PDFService.generate_resume_pdf(sample_resume, PlanTier.PRO))
+        cached = len(pdf_service._FLOWABLE_CACHE)
+        
+        again = self.pdf_text(PDFService.generate_resume_pdf(sample_resume, PlanTier.PRO))
+        assert again == first
+        assert len(pdf_service._FLOWABLE_CACHE) == cached
+        
+        edited = dict(sample_resume, summary="Backend developer in training.")
+        text = self.pdf_text(PDFService.generate_resume_pdf(edited, PlanTier.PRO))
+        assert "Backend developer in training." in text
+        assert len(pdf_service._FLOWABLE_CACHE) == cached + 1
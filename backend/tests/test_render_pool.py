@@ -0,0 +1,110 @@
+"""
+Unit Tests for the PDF render pool
+"""
+import asyncio
+import os
+import time
+import pytest
+
+from app.models.user import PlanTier
+from app.services import render_pool
+from app.services.preview_service import PreviewPageOutOfRange
+from app.services.render_pool import RenderPool, RenderPoolBusy, RenderTimeout
+
+
+RESUME = {
+    "personal_info": {"name": "Jane Doe", "email": "jane@example.com", "phone": "9876543210"},
+    "summary": "Computer science graduate",
+    "skills": ["Python", "SQL"],
+}
+
+
+def slow_render(*args):
+    time.sleep(1)
+    return 0
+
+
+def timed_render(resume_data, user_plan, template_settings, out_path):
+    """Sleeps for the number of seconds the file name starts with."""
+    time.sleep(float(os.path.basename(out_path).split("-")[0]))
+    return 0
+
+
+class TestRenderPool:
+    """Test suite for RenderPool"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [0, 1])
+    async def test_render_writes_pdf_to_path(self, tmp_path, workers):
+        """Renders in-process (workers=0) or in a worker process"""
+        pool = RenderPool(workers=workers, queue_limit=4, timeout=30)
+        out_path = tmp_path / "resume.pdf"
+        try:
+            size = await pool.render(RESUME, PlanTier.FREE, None, str(out_path))
+        finally:
+            pool.shutdown()
+
+        assert size == out_path.stat().st_size
+        assert out_path.read_bytes().startswith(b"%PDF")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [0, 1])
+    async def test_render_preview_page(self, workers):
+        """Preview pages render in the pool; a missing page raises PreviewPageOutOfRange"""
+        pool = RenderPool(workers=workers, queue_limit=4, timeout=30)
+        try:
+            png, page_count = await pool.render_preview(RESUME, PlanTier.PRO, None, page=1, dpi=30)
+            with pytest.raises(PreviewPageOutOfRange):
+                await pool.render_preview(RESUME, PlanTier.PRO, None, page=2, dpi=30)
+        finally:
+            pool.shutdown()
+
+        assert png.startswith(b"\x89PNG")
+        assert page_count == 1
+
+    @pytest.mark.unit
+    async def test_render_timeout(self, tmp_path, monkeypatch):
+        """Renders over the timeout raise RenderTimeout"""
+        monkeypatch.setattr(render_pool, "render_to_file", slow_render)
+        pool = RenderPool(workers=0, queue_limit=4, timeout=0.05)
+
+        with pytest.raises(RenderTimeout):
+            await pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / "resume.pdf"))
+
+    @pytest.mark.unit
+    async def test_timeout_spares_other_renders(self, tmp_path, monkeypatch):
+        """A timed-out render is killed without failing renders that were running beside it"""
+        monkeypatch.setattr(render_pool, "render_to_file", timed_render)
+        pool = RenderPool(workers=2, queue_limit=4, timeout=30)
+        try:
+            await asyncio.gather(*[
+                pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / f"0-{i}.pdf")) for i in range(2)
+            ])  # Start both workers
+            pool.timeout = 2
+            old_pool = pool._pool
+            stuck = asyncio.ensure_future(pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / "30-stuck.pdf")))
+            await asyncio.sleep(1)
+            healthy = asyncio.ensure_future(pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / "1.3-ok.pdf")))
+
+            with pytest.raises(RenderTimeout):
+                await stuck
+            assert await healthy == 0
+            assert await pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / "0-new.pdf")) == 0
+            assert pool._pool is not old_pool
+
+            await asyncio.sleep(2.5)
+            assert pool._retired == [] and not old_pool._processes
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.unit
+    async def test_queue_limit(self, tmp_path, monkeypatch):
+        """Exports beyond the queue limit are rejected instead of queued"""
+        monkeypatch.setattr(render_pool, "render_to_file", slow_render)
+        pool = RenderPool(workers=0, queue_limit=1, timeout=5)
+
+        first = asyncio.ensure_future(pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / "a.pdf")))
+        await asyncio.sleep(0)
+        with pytest.raises(RenderPoolBusy):
+            await pool.render(RESUME, PlanTier.PRO, None, str(tmp_path / "b.pdf"))
+        await first
@@ -14,6 +14,8 @@ from app.db.session import get_db
 from app.models.user import User
 from app.core.config import settings
 from app.api.dependencies import get_current_user
+from app.services import blob_store
+from app.services.blob_store import LocalBlobStore
 from datetime import datetime
 
 
@@ -139,10 +141,12 @@ class TestResumeAnalyzerEndpoints:
     """Integration tests for resume analyzer endpoints"""
     
     @pytest.fixture(autouse=True)
-    def setup_overrides(self):
+    def setup_overrides(self, tmp_path, monkeypatch):
         """Setup dependency overrides"""
         # Mock database
         app.dependency_overrides[get_db] = lambda: AsyncMock()
+        # Keep uploads out of the real blob store
+        monkeypatch.setattr(blob_store, "_blob_store", LocalBlobStore(str(tmp_path / "blobs")))
         yield
         # Clear overrides
         app.dependency_overrides = {}
@@ -454,6 +458,67 @@ class TestResumeAnalyzerEndpoints:
             data = response.json()
             assert isinstance(data, list)
     
+    @pytest.mark.integration
+    @pytest.mark.asyncio
+    async def test_analysis_history_keyset_pagination(self, auth_headers):
+        """Test ULTIMATE history pages return a next cursor and honour it"""
+        mock_user = Mock(spec=User)
+        mock_user.id = 1
+        mock_user.plan = "ULTIMATE"
+        app.dependency_overrides[get_current_user] = lambda: mock_user
+        
+        def make_row(i):
+            row = Mock()
+            row.id = 100 - i
+            row.original_filename = f"resume_{i}.pdf"
+            row.overall_score = 80.0
+            row.ats_score = 80.0
+            row.content_score = 80.0
+            row.structure_score = 80.0
+            row.suggestion_count = 3
+            row.status = "completed"
+            row.enhanced_resume_id = None
+            row.created_at = datetime(2025, 1, 1, 12, 0, 0)
+            return row
+        
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            mock_db = Mock()
+            query = mock_db.query.return_value.filter.return_value
+            query.order_by.return_value.limit.return_value.all.return_value = [make_row(i) for i in range(3)]
+            app.dependency_overrides[get_db] = lambda: mock_db
+            
+            response = await client.get(
+                "/api/v1/resume/analysis-history",
+                params={"page_size": 2},
+                headers={**auth_headers, "Origin": "http://localhost:5173"}
+            )
+            
+            assert response.status_code == 200
+            assert "X-Next-Cursor" in response.headers["Access-Control-Expose-Headers"]  # Readable cross-origin
+            data = response.json()
+            assert [item["id"] for item in data] == [100, 99]
+            assert data[0]["total_suggestions"] == 3
+            query.order_by.return_value.limit.assert_called_with(3)
+            
+            cursor = response.headers["X-Next-Cursor"]
+            query.filter.return_value.order_by.return_value.limit.return_value.all.return_value = []
+            response = await client.get(
+                "/api/v1/resume/analysis-history",
+                params={"page_size": 2, "cursor": cursor},
+                headers=auth_headers
+            )
+            
+            assert response.status_code == 200
+            assert response.json() == []
+            assert "X-Next-Cursor" not in response.headers
+            
+            response = await client.get(
+                "/api/v1/resume/analysis-history",
+                params={"cursor": "not-a-cursor"},
+                headers=auth_headers
+            )
+            assert response.status_code == 400
+    
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_rate_limiting(self, auth_headers, sample_pdf_bytes):
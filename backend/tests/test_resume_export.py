@@ -0,0 +1,172 @@
+"""
+Integration Tests for resume PDF export endpoints
+"""
+import io
+import zipfile
+import pytest
+from datetime import datetime
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.config import settings
+from app.db.session import get_db
+from app.models.user import User, PlanTier
+from app.api.dependencies import get_current_user
+from app.services import pdf_cache, render_pool
+from app.services.pdf_cache import PDFCache
+from app.services.render_pool import RenderPool
+
+
+def make_resume(resume_id: int, title: str = "My Resume"):
+    resume = Mock()
+    resume.id = resume_id
+    resume.title = title
+    resume.template_id = None
+    resume.updated_at = datetime(2024, 1, 1)
+    resume.content = {
+        "personal_info": {"name": f"Candidate {resume_id}", "email": "c@example.com", "phone": "123"},
+        "summary": "Computer science graduate",
+    }
+    return resume
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client rendering in-process into a temporary cache"""
+    monkeypatch.setattr(pdf_cache, "_pdf_cache", PDFCache(str(tmp_path / "pdf"), 10 * 1024 * 1024))
+    monkeypatch.setattr(render_pool, "_render_pool", RenderPool(workers=0, queue_limit=8, timeout=30))
+    yield TestClient(app)
+    app.dependency_overrides = {}
+
+
+def login(plan: PlanTier, db: Mock):
+    user = Mock(spec=User)
+    user.id = 1
+    user.plan = plan
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_db] = lambda: db
+
+
+class TestResumeExport:
+    """Test suite for single and bulk PDF export and previews"""
+
+    @pytest.mark.integration
+    def test_export_pdf_etag_and_not_modified(self, client):
+        """Repeat downloads are served from cache and honour If-None-Match"""
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = make_resume(5)
+        login(PlanTier.FREE, db)
+
+        first = client.get("/api/v1/resume/5/pdf")
+        assert first.status_code == 200
+        assert first.content.startswith(b"%PDF")
+        etag = first.headers["etag"]
+
+        again = client.get("/api/v1/resume/5/pdf")
+        assert again.headers["etag"] == etag
+        assert again.content == first.content
+
+        not_modified = client.get("/api/v1/resume/5/pdf", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+    @pytest.mark.integration
+    def test_export_pdf_streams_large_files(self, client, monkeypatch):
+        """PDFs over the inline limit are streamed from the open cache file"""
+        monkeypatch.setattr(settings, "PDF_INLINE_MAX_KB", 0)
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = make_resume(6)
+        login(PlanTier.PRO, db)
+
+        rendered = client.get("/api/v1/resume/6/pdf")
+        cached = client.get("/api/v1/resume/6/pdf")
+
+        assert rendered.status_code == cached.status_code == 200
+        assert rendered.content.startswith(b"%PDF")
+        assert cached.content == rendered.content
+        assert cached.headers["content-length"] == str(len(rendered.content))
+
+    @pytest.mark.integration
+    def test_preview_returns_png_page(self, client):
+        """Preview renders unsaved content to a low-res PNG page"""
+        login(PlanTier.PRO, Mock())
+        content = make_resume(1).content
+
+        response = client.post("/api/v1/resume/preview", json={"content": content})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert response.content.startswith(b"\x89PNG")
+        assert response.headers["x-page-count"] == "1"
+
+        out_of_range = client.post("/api/v1/resume/preview", json={"content": content, "page": 3})
+        assert out_of_range.status_code == 404
+
+    @pytest.mark.integration
+    def test_preview_rejects_malformed_or_oversized_content(self, client, monkeypatch):
+        """Content the renderer cannot handle is a 422, large bodies a 413"""
+        login(PlanTier.PRO, Mock())
+
+        for content in ({"skills": 5}, {"personal_info": "x"}, {"education": [[1]]}, {"summary": "<b>unclosed"}):
+            response = client.post("/api/v1/resume/preview", json={"content": content})
+            assert response.status_code == 422, content
+
+        monkeypatch.setattr(settings, "PDF_PREVIEW_MAX_CONTENT_KB", 1)
+        response = client.post("/api/v1/resume/preview", json={"content": {"summary": "x" * 2000}})
+        assert response.status_code == 413
+
+    @pytest.mark.integration
+    def test_bulk_export_streams_zip(self, client):
+        """Bulk export returns one PDF per resume in a ZIP"""
+        db = Mock()
+        db.query.return_value.filter.return_value.all.return_value = [
+            make_resume(1, "Backend Roles"), make_resume(2, "Data/ML")
+        ]
+        login(PlanTier.PRO, db)
+
+        response = client.post("/api/v1/resume/export", json={"resume_ids": [1, 2, 1]})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert sorted(archive.namelist()) == ["Backend_Roles_1.pdf", "Data_ML_2.pdf"]
+        assert archive.testzip() is None
+        assert all(archive.read(name).startswith(b"%PDF") for name in archive.namelist())
+
+    @pytest.mark.integration
+    def test_bulk_export_lists_failed_renders(self, client, monkeypatch):
+        """A render that crashes is reported in errors.txt, the rest still ship"""
+        db = Mock()
+        broken = make_resume(2, "Broken")
+        broken.content = {"personal_info": "not an object"}
+        db.query.return_value.filter.return_value.all.return_value = [make_resume(1, "Good"), broken]
+        login(PlanTier.PRO, db)
+
+        response = client.post("/api/v1/resume/export", json={"resume_ids": [1, 2]})
+
+        assert response.status_code == 200
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert sorted(archive.namelist()) == ["Good_1.pdf", "errors.txt"]
+        assert archive.read("errors.txt") == b"Broken_2.pdf: Rendering failed\n"
+
+    @pytest.mark.integration
+    def test_bulk_export_requires_paid_plan(self, client):
+        """FREE users cannot bulk export"""
+        login(PlanTier.FREE, Mock())
+
+        response = client.post("/api/v1/resume/export", json={"resume_ids": [1]})
+
+        assert response.status_code == 403
+
+    @pytest.mark.integration
+    def test_bulk_export_unknown_resume(self, client):
+        """Resumes not owned by the user are rejected before streaming"""
+        db = Mock()
+        db.query.return_value.filter.return_value.all.return_value = [make_resume(1)]
+        login(PlanTier.ULTIMATE, db)
+
+        response = client.post("/api/v1/resume/export", json={"resume_ids": [1, 99]})
+
+        assert response.status_code == 404
+        assert "99" in response.json()["detail"]
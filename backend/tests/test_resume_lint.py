@@ -0,0 +1,92 @@
+"""
+Tests for the rule-based resume lint and /resume/lint
+"""
+import pytest
+from unittest.mock import Mock, patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.dependencies import get_current_user
+from app.models.user import User, PlanTier
+from app.services.resume_lint_service import ResumeLintService
+
+
+SECTION = """• Worked on the placement portal using Django and React for final year students
+- Developed a REST API that cut page load time by 40%
+  The dashboard was built by our team and was quickly adopted across departments"""
+
+
+def rules(result):
+    return [(issue["rule"], issue["original_text"]) for issue in result["issues"]]
+
+
+class TestResumeLint:
+    """Test suite for ResumeLintService"""
+
+    @pytest.mark.unit
+    def test_lint_section(self):
+        """Weak verbs, passive voice, missing metrics and verbless bullets, with offsets"""
+        result = ResumeLintService.lint(SECTION, "experience")
+
+        assert result["bullets"] == 3
+        assert rules(result) == [
+            ("weak_verb", "Worked on"),
+            ("missing_metric", SECTION.splitlines()[0][2:]),
+            ("no_action_verb", "The"),
+            ("missing_metric", SECTION.splitlines()[2].strip()),
+            ("passive_voice", "was built"),
+            ("passive_voice", "was quickly adopted"),
+        ]
+        weak = result["issues"][0]
+        assert SECTION[weak["start"]:weak["end"]] == "Worked on"
+        assert weak["replacements"] == ["Developed", "Built", "Implemented"]
+
+    @pytest.mark.unit
+    def test_lint_rules_depend_on_section_and_length(self):
+        """Impact rules apply to experience and projects; long text is flagged"""
+        assert rules(ResumeLintService.lint("Developed a chatbot that answered 500 queries a day")) == []
+        assert rules(ResumeLintService.lint("Member of the coding club and the robotics society", "extra")) == []
+
+        long_bullet = "Developed " + "a very detailed feature " * 8 + "for 200 users"
+        assert [i["rule"] for i in ResumeLintService.lint(long_bullet, "projects")["issues"]] == ["too_long"]
+        summary = ResumeLintService.lint("Motivated engineer. " * 31, "summary")
+        assert [i["rule"] for i in summary["issues"]] == ["too_long"]
+
+    @pytest.mark.unit
+    def test_lint_ignores_non_verb_uses(self):
+        """Bare weak verbs need to lead the bullet or take an object; adjectival participles are not passive"""
+        for text in [
+            "Shipped a CLI tool used by 500 engineers across 3 teams",
+            "Launched made-to-order checkout for 40 stores",
+            "Was excited to mentor 12 juniors in the coding club",
+            "Is highly motivated and interested in 3 open source projects",
+        ]:
+            assert rules(ResumeLintService.lint(text, "extra")) == [], text
+
+        assert rules(ResumeLintService.lint("Used Docker to ship 4 services", "extra")) == [("weak_verb", "Used")]
+        assert rules(ResumeLintService.lint("Then made the build 30% faster", "extra")) == [("weak_verb", "made")]
+        assert rules(ResumeLintService.lint("Reports were generated weekly for 8 teams", "extra")) == [
+            ("passive_voice", "were generated")
+        ]
+
+    @pytest.mark.integration
+    def test_lint_endpoint_skips_ai(self):
+        """POST /resume/lint answers without AI calls"""
+        user = Mock(spec=User)
+        user.id = 1
+        user.plan = PlanTier.FREE
+        app.dependency_overrides[get_current_user] = lambda: user
+        client = TestClient(app)
+        try:
+            with patch("app.services.ai_service.AIService._call_openrouter") as ai:
+                response = client.post("/api/v1/resume/lint", json={"text": "Helped with testing the app", "section": "Projects"})
+                assert client.post("/api/v1/resume/lint", json={"text": ""}).status_code == 422
+        finally:
+            app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["section"] == "projects"
+        assert body["issues"][0]["rule"] == "weak_verb"
+        assert body["issues"][0]["replacements"] == ["Supported", "Contributed to", "Enabled"]
+        ai.assert_not_called()
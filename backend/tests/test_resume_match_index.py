@@ -0,0 +1,115 @@
+"""
+Integration Tests for ranking stored analyses against a job description
+"""
+import pytest
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.dependencies import get_current_user
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.models.resume_analysis import ResumeAnalysis
+from app.models.user import User, PlanTier
+from app.services.jd_match_service import JDMatchService
+from app.services.resume_match_index import ResumeMatchIndex, clear_resume_match_indexes
+
+
+USER_ID = 5151
+
+JOB = "Data Analyst intern: SQL, Python, Pandas, Tableau and statistics. Strong communication."
+
+CANDIDATES = {
+    "analyst.pdf": "Skills\nSQL, Python, Pandas, Tableau, Statistics\nExperience\nPresented dashboards; strong communication",
+    "python.pdf": "Skills\nPython, Pandas, Excel\nProjects\nCleaned survey data with Python",
+    "designer.pdf": "Skills\nFigma, Photoshop\nProjects\nRedesigned the college fest website",
+}
+
+
+def store(db, filename: str, text: str) -> ResumeAnalysis:
+    from app.services.pdf_parser_service import PDFParserService
+
+    analysis = ResumeAnalysis(
+        user_id=USER_ID,
+        original_filename=filename,
+        extracted_text=text,
+        overall_score=70.0,
+        suggestions=[],
+        status="completed"
+    )
+    analysis.parsed_content = PDFParserService.parse_resume_structure(text)
+    db.add(analysis)
+    db.commit()
+    return analysis
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    clear_resume_match_indexes()
+    yield session
+    session.query(ResumeAnalysis).filter(ResumeAnalysis.user_id == USER_ID).delete()
+    session.commit()
+    session.close()
+    clear_resume_match_indexes()
+    app.dependency_overrides = {}
+
+
+class TestResumeMatchIndex:
+    """Test suite for the per-user sparse resume matrix"""
+
+    @pytest.mark.integration
+    def test_rank_matches_pairwise_scores(self, db):
+        """Matrix ranking agrees with JDMatchService.match and orders best first"""
+        for filename, text in CANDIDATES.items():
+            store(db, filename, text)
+        index = ResumeMatchIndex(USER_ID)
+
+        assert index.sync(db) == (3, 0)
+        ranking = index.rank_resumes(db, JOB, top_k=10)
+
+        assert ranking["resumes_indexed"] == 3
+        assert [r["filename"] for r in ranking["results"]] == ["analyst.pdf", "python.pdf"]  # designer shares no keyword
+        for result in ranking["results"]:
+            analysis = db.get(ResumeAnalysis, result["analysis_id"])
+            assert result["match_score"] == JDMatchService.match(analysis.parsed_content, JOB)["match_score"]
+        assert ranking["results"][1]["matched_keywords"] == ["Python", "Pandas"]
+        assert len(index.rank(JDMatchService.vectorize_job_description(JOB), top_k=1)) == 1
+
+    @pytest.mark.integration
+    def test_sync_is_incremental(self, db):
+        """New analyses are appended and deleted ones dropped without a rebuild"""
+        first = store(db, "python.pdf", CANDIDATES["python.pdf"])
+        index = ResumeMatchIndex(USER_ID)
+        index.sync(db)
+        row = index.rows[first.id]
+
+        store(db, "analyst.pdf", CANDIDATES["analyst.pdf"])
+        first.is_active = 0
+        db.commit()
+
+        assert index.sync(db) == (1, 1)
+        assert first.id not in index.rows
+        assert all(first.id not in column for column in index.columns.values())
+        assert index.sync(db) == (0, 0)
+        assert row  # Rows are built once per analysis
+
+    @pytest.mark.integration
+    def test_rank_endpoint(self, db):
+        """POST /resume/rank returns top_k results for the current user"""
+        for filename, text in CANDIDATES.items():
+            store(db, filename, text)
+        user = Mock(spec=User)
+        user.id = USER_ID
+        user.plan = PlanTier.ULTIMATE
+        app.dependency_overrides[get_current_user] = lambda: user
+        client = TestClient(app)
+
+        response = client.post("/api/v1/resume/rank", json={"job_description": JOB, "top_k": 1})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["resumes_indexed"] == 3
+        assert [r["filename"] for r in body["results"]] == ["analyst.pdf"]
+        assert client.post("/api/v1/resume/rank", json={"job_description": "Join our friendly team today!"}).status_code == 400
@@ -0,0 +1,95 @@
+"""
+Tests for the skill typeahead index and /skills/suggest
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.db.base_class import Base
+from app.db.session import SessionLocal, engine
+from app.models.resume import Resume
+from app.services import skill_suggest_index
+from app.services.skill_suggest_index import (
+    SkillSuggestIndex, count_skill_popularity, refresh_skill_suggest_index, store_skill_popularity
+)
+
+
+USER_ID = 7373
+
+
+def names(suggestions):
+    return [s["name"] for s in suggestions]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(skill_suggest_index, "_skill_suggest_index", None)
+    session = SessionLocal()
+    yield session
+    session.query(Resume).filter(Resume.user_id == USER_ID).delete()
+    session.commit()
+    session.close()
+
+
+class TestSkillSuggest:
+    """Test suite for SkillSuggestIndex"""
+
+    @pytest.mark.unit
+    def test_prefix_alias_and_exact_matches(self):
+        """Prefixes match names, aliases and inner words; exact spellings lead"""
+        index = SkillSuggestIndex()
+
+        assert names(index.suggest("java", 5)) == ["Java", "JavaScript"]
+        assert names(index.suggest("JS", 5)) == ["JavaScript"]
+        assert names(index.suggest("  machine   le", 5)) == ["Machine Learning"]
+        assert "Machine Learning" in names(index.suggest("learn", 5))
+        assert len(index.suggest("a", 3)) == 3
+        assert index.suggest("zzz", 5) == [] and index.suggest(" ", 5) == []
+
+    @pytest.mark.integration
+    def test_popularity_from_stored_resumes(self, db):
+        """Skills listed on more resumes rank first once recounted offline; aliases count for the skill"""
+        store_skill_popularity(db)
+        before = count_skill_popularity(db)
+        for skills in (["JavaScript", "SQL"], ["js", "Jira"], ["Node.js, javascript"]):
+            db.add(Resume(user_id=USER_ID, title="Mine", content={"skills": skills}))
+        db.commit()
+
+        # Workers only reload the stored counts
+        assert refresh_skill_suggest_index().popularity == before
+        store_skill_popularity(db)
+        refreshed = refresh_skill_suggest_index()
+        added = {
+            skill_id: count - before.get(skill_id, 0)
+            for skill_id, count in refreshed.popularity.items() if count != before.get(skill_id, 0)
+        }
+        index = SkillSuggestIndex(added)
+
+        assert skill_suggest_index.get_skill_suggest_index() is refreshed
+        assert added[index.names.index("JavaScript")] == 3  # Once per resume
+        assert names(index.suggest("j", 3)) == ["JavaScript", "Jira", "Java"]
+
+    @pytest.mark.integration
+    def test_suggest_endpoint_skips_database(self, db):
+        """GET /skills/suggest needs no auth and runs no queries"""
+        client = TestClient(app)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/v1/skills/suggest?q=reac&limit=2")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        assert response.json()["suggestions"] == [
+            {"name": "React", "category": "Web Development"},
+            {"name": "React Native", "category": "Mobile Development"},
+        ]
+        assert statements == []
+        assert client.get("/api/v1/skills/suggest?q=").status_code == 422
@@ -0,0 +1,64 @@
+"""
+Unit Tests for the skills taxonomy and trie-based skill extraction
+"""
+import pytest
+from app.services.resume_analyzer_service import ResumeAnalyzerService
+from app.services.skill_extraction_service import SkillExtractionService, get_skill_trie
+from app.services.skills_taxonomy import SKILLS_TAXONOMY
+
+
+METRICS = {"has_email": True, "has_phone": True}
+
+
+class TestSkillExtraction:
+    """Test suite for SkillTrie and SkillExtractionService"""
+
+    @pytest.mark.unit
+    def test_aliases_map_to_canonical_names(self):
+        """Aliases and compound tokens normalize; the longest spelling wins"""
+        text = "Built apps with JS, ReactJS and React Native on Node.js/Express, Postgres and k8s"
+
+        skills = SkillExtractionService.extract_skills(text, skills_section=True)
+
+        assert skills == ["JavaScript", "React", "React Native", "Node.js", "Express.js", "PostgreSQL", "Kubernetes"]
+        assert len(get_skill_trie().names) == sum(len(skills) for skills in SKILLS_TAXONOMY.values())
+
+    @pytest.mark.unit
+    def test_ambiguous_words_only_count_in_skills_section(self):
+        """'go' and 'excel' are skills in a skills list, plain words in prose"""
+        prose = "Eager to go the extra mile and excel in a fast-paced team using Microsoft Excel"
+
+        assert SkillExtractionService.extract_skills(prose) == ["Microsoft Excel"]
+        assert SkillExtractionService.extract_skills("Go, Excel, C", skills_section=True) == [
+            "Go", "Microsoft Excel", "C"
+        ]
+
+    @pytest.mark.unit
+    def test_normalize_skills_section(self):
+        """Labels and bullets are dropped, duplicates merged, unknown items kept"""
+        skills_text = "Languages: Python, JS, C/C++\nFrameworks: Django | django\n• Arduino\n- Kicad, python3"
+
+        assert SkillExtractionService.normalize_skills(skills_text) == [
+            "Python", "JavaScript", "C", "C++", "Django", "Arduino", "Kicad"
+        ]
+        assert SkillExtractionService.normalize_skills("") == []
+
+    @pytest.mark.unit
+    def test_analyzer_suggests_unlisted_skills(self):
+        """Skills used in experience but missing from the skills list are suggested"""
+        parsed = {
+            "contact": "docker@example.com",
+            "education": "B.Tech in Computer Science",
+            "skills": "Python, SQL",
+            "experience": "Developed RESTful APIs in Python and deployed them with Docker; strong communication",
+        }
+
+        found = SkillExtractionService.extract_from_resume(parsed)
+        _, suggestions = ResumeAnalyzerService.analyze_ats_optimization(parsed, METRICS)
+
+        assert [(s["name"], s["sections"]) for s in found] == [
+            ("Python", ["skills", "experience"]), ("SQL", ["skills"]),
+            ("REST APIs", ["experience"]), ("Docker", ["experience"]), ("Communication", ["experience"]),
+        ]
+        unlisted = [s for s in suggestions if s["issue"] == "Skills used in your experience are not listed"]
+        assert unlisted[0]["enhanced_text"] == "REST APIs, Docker"
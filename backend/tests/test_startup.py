@@ -0,0 +1,44 @@
+"""
+Unit Tests for API cold start
+"""
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartup:
+    """Test suite for startup cost"""
+
+    @pytest.mark.unit
+    def test_heavy_libraries_imported_lazily(self):
+        """Importing the app does not pull in ReportLab, PyMuPDF or requests"""
+        code = (
+            "import sys, app.main; "
+            "print(','.join(m for m in ('reportlab', 'fitz', 'requests') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.unit
+    def test_schema_creation_skipped_outside_development(self):
+        """create_all only runs in development or when explicitly enabled"""
+        with patch("app.main.settings.ENVIRONMENT", "production"), \
+                patch("app.main.settings.DB_CREATE_TABLES_ON_STARTUP", False), \
+                patch("app.main.Base.metadata.create_all") as create_all, \
+                patch("app.main._warm_caches"):
+            with TestClient(app) as client:
+                assert client.get("/health").status_code == 200
+
+        create_all.assert_not_called()
@@ -0,0 +1,174 @@
+"""
+Unit Tests for the in-memory template catalog
+"""
+import threading
+import pytest
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.db.base_class import Base
+from app.models.template import ResumeTemplate
+from app.models.user import User, PlanTier
+from app.api.dependencies import get_current_user
+from app.services import template_catalog
+from app.services.template_catalog import TemplateCatalog, load_template_catalog
+from app.services.usage_counter import TemplateUsageCounter
+
+
+def make_template(template_id, industry, category, tier="FREE", featured=False, usage=0, active=True):
+    return ResumeTemplate(
+        id=template_id, name=f"t{template_id}", display_name=f"Template {template_id}",
+        industry=industry, position_type="Entry-level", category=category,
+        tier_required=tier, is_featured=featured, is_active=active, usage_count=usage,
+        settings={"layout": "single-column"}
+    )
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[ResumeTemplate.__table__])
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        make_template(1, "Tech", "Modern", usage=5),
+        make_template(2, "Tech", "Classic", tier="PRO", featured=True),
+        make_template(3, "Finance", "Modern", tier="ULTIMATE", usage=9),
+        make_template(4, "Tech", "Modern", usage=7),
+        make_template(5, "Healthcare", "Minimal", active=False),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def fresh_catalog(monkeypatch):
+    monkeypatch.setattr(template_catalog, "_catalog", None)
+    counter = TemplateUsageCounter()
+    monkeypatch.setattr(template_catalog, "get_template_usage_counter", lambda: counter)
+    return counter
+
+
+class TestTemplateCatalog:
+    """Test suite for TemplateCatalog"""
+
+    @pytest.mark.unit
+    def test_order_and_facets(self, db, fresh_catalog):
+        """Featured first then by usage; facets index active templates only"""
+        catalog = load_template_catalog(db)
+
+        assert catalog.order == [2, 3, 4, 1]
+        assert catalog.facets["industry"]["Tech"] == [2, 4, 1]
+        assert catalog.facet_values("industry") == ["Finance", "Tech"]
+        assert catalog.get(5) is None
+
+    @pytest.mark.unit
+    def test_filter_intersects_facets(self, db, fresh_catalog):
+        """Multiple filters intersect while keeping display order"""
+        catalog = load_template_catalog(db)
+
+        assert [t["id"] for t in catalog.filter(industry="Tech", category="Modern")] == [4, 1]
+        assert catalog.filter(industry="Tech", category="Minimal") == []
+        assert TemplateCatalog.count_available(catalog.filter(), PlanTier.PRO) == 3
+
+    @pytest.mark.unit
+    def test_version_changes_only_with_content(self, db, fresh_catalog):
+        """Reloading unchanged content keeps the snapshot; changes bump the version"""
+        first = load_template_catalog(db)
+        assert load_template_catalog(db) is first
+
+        db.get(ResumeTemplate, 1).display_name = "Renamed"
+        db.commit()
+        second = load_template_catalog(db)
+
+        assert second.version == first.version + 1
+        assert second.etag != first.etag
+        assert second.get(1)["display_name"] == "Renamed"
+
+    @pytest.mark.unit
+    def test_record_usage_reranks_incrementally(self, db, fresh_catalog):
+        """Usage moves a template past less used ones, never past featured ones"""
+        catalog = load_template_catalog(db)
+        etag = catalog.etag
+
+        assert catalog.record_usage(1, 3) == 8
+        assert catalog.order == [2, 3, 1, 4]
+        assert catalog.etag != etag
+        assert [t["id"] for t in catalog.filter(industry="Tech")] == [2, 1, 4]
+
+        catalog.record_usage(4, 100)
+        assert catalog.order == [2, 4, 3, 1]
+
+    @pytest.mark.unit
+    def test_usage_flush_is_additive(self, db, fresh_catalog):
+        """Buffered counts from several workers add up in the database"""
+        worker_a, worker_b = TemplateUsageCounter(), TemplateUsageCounter()
+        for _ in range(3):
+            worker_a.increment(1)
+        worker_b.increment(1, 2)
+        worker_b.increment(3)
+
+        assert worker_a.flush(db) == 1
+        assert worker_b.flush(db) == 2
+        assert worker_a.flush(db) == 0
+
+        db.expire_all()
+        assert db.get(ResumeTemplate, 1).usage_count == 10
+        assert db.get(ResumeTemplate, 3).usage_count == 10
+
+    @pytest.mark.unit
+    def test_reload_syncs_usage_with_pending(self, db, fresh_catalog):
+        """Reload keeps the snapshot, syncing flushed totals plus unflushed usage"""
+        catalog = load_template_catalog(db)
+        db.get(ResumeTemplate, 4).usage_count = 20  # flushed by another worker
+        db.commit()
+        fresh_catalog.increment(1, 30)  # recorded here, not yet flushed
+
+        assert load_template_catalog(db) is catalog
+        assert catalog.usage[4] == 20
+        assert catalog.usage[1] == 35
+        assert catalog.order == [2, 1, 4, 3]
+
+    @pytest.mark.unit
+    def test_reload_reads_are_not_split_by_a_flush(self, db, fresh_catalog):
+        """A flush waits until both the database and the pending counts are read"""
+        fresh_catalog.increment(1, 30)
+        flusher = threading.Thread(target=fresh_catalog.flush, args=(Mock(),))
+
+        def read():
+            flusher.start()
+            flusher.join(0.2)
+            assert flusher.is_alive()
+            return "rows"
+
+        assert fresh_catalog.read_with_pending(read) == ("rows", {1: 30})
+        flusher.join()
+        assert fresh_catalog.pending() == {}
+
+    @pytest.mark.integration
+    def test_templates_endpoint_etag(self, db, fresh_catalog):
+        """/templates is served from the catalog and honours If-None-Match"""
+        load_template_catalog(db)
+        user = Mock(spec=User)
+        user.plan = PlanTier.FREE
+        app.dependency_overrides[get_current_user] = lambda: user
+        client = TestClient(app)
+        try:
+            response = client.get("/api/v1/templates", params={"industry": "Tech"})
+            assert response.status_code == 200
+            body = response.json()
+            assert [t["id"] for t in body["templates"]] == [2, 4, 1]
+            assert body["available_to_user"] == 2
+
+            cached = client.get("/api/v1/templates", headers={"If-None-Match": response.headers["etag"]})
+            assert cached.status_code == 304
+
+            featured = client.get("/api/v1/templates/featured").json()["templates"][0]
+            assert featured["id"] == 2
+            assert featured["settings"] == {"layout": "single-column"}
+            assert (featured["is_active"], featured["usage_count"]) == (True, 0)
+        finally:
+            app.dependency_overrides = {}
@@ -0,0 +1,88 @@
+"""
+Unit Tests for request tracing (app/core/tracing.py)
+"""
+import json
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core import tracing
+from app.core.tracing import span, start_trace, server_timing
+from app.services.resume_analyzer_service import ResumeAnalyzerService
+
+
+class TestTracing:
+    """Test suite for spans, Server-Timing and OTLP export"""
+
+    @pytest.mark.unit
+    def test_span_tree_and_traceparent(self):
+        """Spans nest under the current span; traceparent continues a trace"""
+        with span("outside") as noop:
+            noop.set_attribute("ignored", True)  # No active trace - nothing recorded
+
+        root = start_trace("GET /x", "00-" + "a" * 32 + "-" + "b" * 16 + "-01")
+        token = tracing._current_span.set(root)
+        try:
+            with span("parse") as parse:
+                with span("parse.inner"):
+                    pass
+            with pytest.raises(ValueError):
+                with span("score"):
+                    raise ValueError("boom")
+        finally:
+            tracing._current_span.reset(token)
+        root.end()
+
+        names = {s.name: s for s in root.spans}
+        assert root.trace_id == "a" * 32 and root.parent_id == "b" * 16
+        assert names["parse.inner"].parent_id == parse.span_id
+        assert names["score"].status == tracing.STATUS_ERROR
+        assert server_timing(root).startswith("parse;dur=")
+        assert server_timing(root).endswith(f"total;dur={root.duration_ms:.1f}")
+
+    @pytest.mark.unit
+    async def test_analyzer_stages_and_upstream_calls_are_spans(self):
+        """Each analyzer stage and AI call is a span under the analysis"""
+        root = start_trace("POST /api/v1/resume/analyze")
+        token = tracing._current_span.set(root)
+        parsed = {"experience": "Worked on things at a company for a while", "skills": "Python and some Excel"}
+        metrics = {"word_count": 50, "bullet_points": 0, "quantifiable_achievements": 0,
+                   "action_verbs": 0, "has_email": False, "has_phone": False, "has_linkedin": False}
+        try:
+            with patch("requests.post", side_effect=ConnectionError("offline")):
+                await ResumeAnalyzerService.analyze_resume(parsed, metrics, "FREE")
+        finally:
+            tracing._current_span.reset(token)
+
+        names = [s.name for s in root.spans]
+        for stage in ("analyzer.content_quality", "analyzer.ats_optimization",
+                      "analyzer.structure", "analyzer.fresher_specific", "analyzer.ai_enhancements"):
+            assert stage in names
+        upstream = [s for s in root.spans if s.name == "openrouter.chat"]
+        assert upstream and upstream[0].kind == "client"
+        assert upstream[0].status == tracing.STATUS_ERROR
+
+    @pytest.mark.integration
+    def test_debug_header_and_otlp_export(self, tmp_path):
+        """X-Debug-Timing returns Server-Timing; finished traces are exported as OTLP/JSON"""
+        export_file = tmp_path / "traces.jsonl"
+        client = TestClient(app)
+        with patch.object(tracing.settings, "TRACE_EXPORT_FILE", str(export_file)):
+            plain = client.get("/health")
+            debug = client.get("/health", headers={"X-Debug-Timing": "1"})
+
+        assert "server-timing" not in plain.headers
+        assert debug.headers["server-timing"].startswith("total;dur=")
+        with patch.object(tracing.settings, "SERVER_TIMING_ENABLED", False):
+            assert "server-timing" not in client.get("/health", headers={"X-Debug-Timing": "1"}).headers
+        assert type(tracing.settings)(ENVIRONMENT="production").SERVER_TIMING_ENABLED is False
+
+        tracing.flush_traces()
+        lines = export_file.read_text().splitlines()
+        assert len(lines) == 2
+        exported = json.loads(lines[1])["resourceSpans"][0]
+        root = exported["scopeSpans"][0]["spans"][0]
+        assert root["name"] == "GET /health"
+        assert root["traceId"] == debug.headers["x-trace-id"]
+        assert exported["resource"]["attributes"][0]["value"]["stringValue"] == tracing.SERVICE_NAME